@@ -10,9 +10,19 @@ urlpatterns = [
         views.SmartlingStatusView.as_view(),
         name="status",
     ),
+    path(
+        "jobs/export/",
+        views.SmartlingJobExportView.as_view(),
+        name="jobs-export",
+    ),
+    path(
+        "jobs/users/",
+        views.SmartlingJobUsersView.as_view(),
+        name="jobs-users",
+    ),
     path(
         "landed-translations/",
-        views.landed_translations_list,
+        views.LandedTranslationTasksView.as_view(),
         name="landed-translations",
     ),
 ]
@@ -1,6 +1,7 @@
 import logging
 import pprint
 import textwrap
+import time
 
 from collections.abc import Generator
 from contextlib import contextmanager
@@ -21,6 +22,7 @@ import requests
 import requests.exceptions
 import rest_framework.serializers
 
+from django.core.cache import cache
 from django.utils import timezone
 from django.utils.functional import SimpleLazyObject
 from requests.exceptions import HTTPError
@@ -29,12 +31,14 @@ from .. import utils
 from ..exceptions import IncapableVisualContextCallback
 from ..settings import settings as smartling_settings
 from . import types
+from .multipart import StreamingMultipartEncoder, iter_po
 from .serializers import (
     AddLocaleToJobResponseSerializer,
     AddVisualContextToJobSerializer,
     AuthenticateResponseSerializer,
     CreateBatchResponseSerializer,
     CreateJobResponseSerializer,
+    GetFileLastModifiedResponseSerializer,
     GetFileStatusResponseSerializer,
     GetJobDetailsResponseSerializer,
     GetProjectDetailsResponseSerializer,
@@ -44,6 +48,7 @@ from .serializers import (
     ResponseSerializer,
     UploadFileToBatchResponseSerializer,
 )
+from .validation import ResponseValidationError, get_response_validator
 
 
 if TYPE_CHECKING:
@@ -86,6 +91,105 @@ class JobNotFound(SmartlingAPIError):
     pass
 
 
+class DeadlineExceeded(SmartlingAPIError):
+    """
+    Exception to be raised when downloading a response takes longer than its
+    timeout profile's deadline.
+    """
+
+
+class CircuitOpen(SmartlingAPIError):
+    """
+    Exception to be raised instead of sending a request while the circuit
+    breaker is open.
+    """
+
+
+# Circuit breaker
+
+
+class CircuitBreaker:
+    """
+    Stops requests being sent to Smartling for a cooldown period after a run of
+    consecutive failed requests, so that an outage fails fast instead of every
+    request waiting for the timeout.
+
+    A request counts as failed if it couldn't be sent or got no response (e.g.
+    a connection error or timeout) or got a 5xx response. The state is kept in
+    Django's cache so that it's shared by all processes, and failures are
+    counted with cache.incr(), which is atomic on backends like Redis and
+    Memcached. Once the cooldown has passed, a single request is let through
+    to check whether Smartling has recovered, while the others keep failing
+    fast; the breaker is reset if it succeeds and reopened if it fails.
+    """
+
+    failures_cache_key = "wagtail_localize_smartling:circuit_breaker:failures"
+    open_until_cache_key = "wagtail_localize_smartling:circuit_breaker:open_until"
+    probe_cache_key = "wagtail_localize_smartling:circuit_breaker:probe"
+    # How long the request checking whether Smartling has recovered has before
+    # another one is let through, in case it never records its result
+    probe_timeout = 60
+
+    def _get_state(self) -> dict[str, float]:
+        state = cache.get_many([self.failures_cache_key, self.open_until_cache_key])
+        return {
+            name: state[key]
+            for name, key in [("failures", self.failures_cache_key), ("open_until", self.open_until_cache_key)]
+            if key in state
+        }
+
+    def is_open(self, state: dict[str, float] | None = None) -> bool:
+        if state is None:
+            state = self._get_state()
+        return state.get("open_until", 0) > time.time()
+
+    def before_request(self) -> dict[str, float]:
+        """
+        Raise CircuitOpen if the breaker is open, or if the cooldown has passed
+        and another request is already checking whether Smartling has
+        recovered. Returns the current state for passing to record_success()
+        or record_failure().
+        """
+        if not smartling_settings.CIRCUIT_BREAKER_THRESHOLD:
+            return {}
+        state = self._get_state()
+        if "open_until" in state:
+            if self.is_open(state):
+                raise CircuitOpen("Not sending request to Smartling, the API has been failing")
+            if not cache.add(self.probe_cache_key, True, timeout=self.probe_timeout):
+                raise CircuitOpen("Not sending request to Smartling, waiting to see whether the API has recovered")
+        return state
+
+    def record_success(self, state: dict[str, float]) -> None:
+        if state:
+            self.reset()
+
+    def record_failure(self, state: dict[str, float]) -> None:
+        if not smartling_settings.CIRCUIT_BREAKER_THRESHOLD:
+            return
+        try:
+            failures = cache.incr(self.failures_cache_key)
+        except ValueError:
+            # This is the first failure, or the count was reset in the meantime
+            cache.add(self.failures_cache_key, 0, timeout=None)
+            failures = cache.incr(self.failures_cache_key)
+        if failures >= smartling_settings.CIRCUIT_BREAKER_THRESHOLD:
+            logger.error(
+                "Smartling API requests failed %s times in a row, not sending any more for %ss",
+                failures,
+                smartling_settings.CIRCUIT_BREAKER_COOLDOWN_SECONDS,
+            )
+            cache.set(
+                self.open_until_cache_key,
+                time.time() + smartling_settings.CIRCUIT_BREAKER_COOLDOWN_SECONDS,
+                timeout=None,
+            )
+            cache.delete(self.probe_cache_key)
+
+    def reset(self) -> None:
+        cache.delete_many([self.failures_cache_key, self.open_until_cache_key, self.probe_cache_key])
+
+
 # API client
 
 # TODO allow customization of serializers to account for custom fields
@@ -104,6 +208,8 @@ class SmartlingAPIClient:
         self.access_token_expires_at: datetime = a_day_ago
         self.refresh_token_expires_at: datetime = a_day_ago
 
+        self.circuit_breaker = CircuitBreaker()
+
     # Utilities
 
     @property
@@ -188,6 +294,48 @@ class SmartlingAPIClient:
             return "https://api.stg.smartling.net"
         raise SmartlingAPIError(f"Unknown environment: {smartling_settings.ENVIRONMENT}")
 
+    def _send(
+        self,
+        method: Literal["GET", "POST"],
+        url: str,
+        *,
+        timeout_profile: str = "default",
+        **kwargs,
+    ) -> requests.Response:
+        """
+        Send a request to Smartling via the circuit breaker, with the connect
+        and read timeouts from the given profile in the API_TIMEOUT_PROFILES
+        setting.
+        """
+        state = self.circuit_breaker.before_request()
+        try:
+            response = requests.request(
+                method=method,
+                url=url,
+                timeout=smartling_settings.API_TIMEOUT_PROFILES[timeout_profile].requests_timeout,
+                **kwargs,
+            )
+        except requests.exceptions.RequestException:
+            self.circuit_breaker.record_failure(state)
+            raise
+        if response.status_code >= 500:
+            self.circuit_breaker.record_failure(state)
+        else:
+            self.circuit_breaker.record_success(state)
+        return response
+
+    def _iter_content(self, response: requests.Response, *, started_at: float) -> Generator[bytes]:
+        """
+        Read a streamed download's body in chunks, raising DeadlineExceeded if
+        it takes longer than the download timeout profile's deadline since
+        started_at, a time.monotonic() value.
+        """
+        deadline = smartling_settings.API_TIMEOUT_PROFILES["download"].deadline
+        for chunk in response.iter_content(chunk_size=8192):
+            if deadline is not None and time.monotonic() - started_at > deadline:
+                raise DeadlineExceeded(f"Download of {response.url} took longer than {deadline}s")
+            yield chunk
+
     def _request(
         self,
         *,
@@ -195,23 +343,19 @@ class SmartlingAPIClient:
         path: str,
         response_serializer_class: type[ResponseSerializer | NullDataResponseSerializer],
         send_headers: bool = True,
+        timeout_profile: str = "default",
+        headers: dict[str, str] | None = None,
         **kwargs,
     ) -> dict[str, Any]:
         url = urljoin(self._base_url, path)
-        headers = self._headers if send_headers else {}
+        headers = {**(self._headers if send_headers else {}), **(headers or {})}
 
         logger.info(
             "Smartling API request: %s %s",
             method,
             url,
         )
-        response = requests.request(
-            method=method,
-            url=url,
-            headers=headers,
-            timeout=smartling_settings.API_TIMEOUT_SECONDS,
-            **kwargs,
-        )
+        response = self._send(method, url, headers=headers, timeout_profile=timeout_profile, **kwargs)
         logger.info(
             "Smartling API response: %s %s",
             response.status_code,
@@ -223,6 +367,19 @@ class SmartlingAPIClient:
         except requests.exceptions.JSONDecodeError as e:
             raise InvalidResponse(f"Response was not valid JSON: {response.text}") from e
 
+        if smartling_settings.API_RESPONSE_VALIDATION == "typed_dict":
+            try:
+                validated = get_response_validator(response_serializer_class)(response_json)["response"]
+            except ResponseValidationError as e:
+                raise InvalidResponse(f"Response did not match expected format: {response_json}") from e
+
+            try:
+                response.raise_for_status()
+            except HTTPError as e:
+                raise FailedResponse(code=validated["code"], errors=validated.get("errors", [])) from e
+
+            return validated["data"]
+
         serializer = cast(
             # This cast is required because the created instance could be a
             # ListSerializer if we'd passed many=True, but we know better.
@@ -399,25 +556,31 @@ class SmartlingAPIClient:
             utils.format_smartling_locale_id(t.target_locale.language_code) for t in job.translations.all()
         ]
 
-        data_payload = {
+        fields = [
             # NB: If we switch to multiple files per Batch (e.g. different
             # locales per upload to the batch, for some reason), the fileUri must
             # be unique _per Batch_. With a single file, it's not a concern.
-            "fileUri": file_uri,
-            "fileType": "gettext",
-            "localeIdsToAuthorize[]": locales_to_authorize,
-        }
+            ("fileUri", file_uri),
+            ("fileType", "gettext"),
+            *(("localeIdsToAuthorize[]", locale_id) for locale_id in locales_to_authorize),
+        ]
 
-        file_payload = {
-            "file": (file_uri, str(job.translation_source.export_po())),
-        }
+        # Large pages can have PO files of several MB, so write the PO file
+        # into the request body as it's sent rather than building the whole
+        # file and then the whole request body in memory
+        po = job.translation_source.export_po()
+        body = StreamingMultipartEncoder(
+            fields=fields,
+            files=[("file", file_uri, lambda: iter_po(po))],
+        )
 
         self._request(
             method="POST",
             path=f"/job-batches-api/v2/projects/{quote(job.project.project_id)}/batches/{batch_uid}/file",
             response_serializer_class=UploadFileToBatchResponseSerializer,
-            files=file_payload,
-            data=data_payload,
+            timeout_profile="upload",
+            headers={"Content-Type": body.content_type},
+            data=body,
         )
         return file_uri
 
@@ -530,6 +693,7 @@ class SmartlingAPIClient:
             method="POST",
             path=f"/context-api/v2/projects/{quote(job.project.project_id)}/contexts/upload-and-match-async",
             response_serializer_class=AddVisualContextToJobSerializer,
+            timeout_profile="upload",
             files=file_payload,
             data=data_payload,
         )
@@ -547,16 +711,19 @@ class SmartlingAPIClient:
             self._base_url,
             f"/files-api/v2/projects/{quote(job.project.project_id)}/locales/all/file/zip",
         )
-        with requests.get(
+        headers = self._headers
+        started_at = time.monotonic()
+        with self._send(
+            "GET",
             url,
-            headers=self._headers,
+            timeout_profile="download",
+            headers=headers,
             params={
                 "fileUri": job.file_uri,
                 "retrievalType": "published",
                 "includeOriginalStrings": False,
             },
             stream=True,
-            timeout=smartling_settings.API_TIMEOUT_SECONDS,
         ) as response:
             # Log consistently with other requests. Don't log the method and URL
             # until we've initiated the request so it doesn't get interleaved
@@ -592,7 +759,7 @@ class SmartlingAPIClient:
             # TODO buffer to a temporary file instead of a BytesIO for large files
 
             buffer = BytesIO()
-            for chunk in response.iter_content(chunk_size=8192):
+            for chunk in self._iter_content(response, started_at=started_at):
                 buffer.write(chunk)
             buffer.seek(0)
 
@@ -618,6 +785,23 @@ class SmartlingAPIClient:
             ),
         )
 
+    def get_file_last_modified(self, *, job: "Job") -> types.FileLastModifiedResponseData:
+        """
+        Get when each locale's translation of the job's file was last modified,
+        so unchanged translations don't need to be downloaded again.
+
+        API docs: https://api-reference.smartling.com/#tag/Files/operation/getFileLastModifiedAllLocales
+        """
+        return cast(
+            types.FileLastModifiedResponseData,
+            self._request(
+                method="GET",
+                path=f"/files-api/v2/projects/{quote(job.project.project_id)}/file/last-modified",
+                response_serializer_class=GetFileLastModifiedResponseSerializer,
+                params={"fileUri": job.file_uri},
+            ),
+        )
+
     def download_translation_for_locale(self, *, job: "Job", locale_id: str) -> bytes:
         """
         Download the translated PO file for a specific locale.
@@ -629,43 +813,47 @@ class SmartlingAPIClient:
             f"/files-api/v2/projects/{quote(job.project.project_id)}/locales/{quote(locale_id)}/file",
         )
 
+        headers = self._headers
         logger.info("Smartling API request: GET %s", url)
-        response = requests.get(
+        started_at = time.monotonic()
+        with self._send(
+            "GET",
             url,
-            headers=self._headers,
+            timeout_profile="download",
+            headers=headers,
             params={
                 "fileUri": job.file_uri,
                 "retrievalType": "published",
                 "includeOriginalStrings": False,
             },
-            timeout=smartling_settings.API_TIMEOUT_SECONDS,
-        )
-        logger.info(
-            "Smartling API response: %s %s",
-            response.status_code,
-            f"{response.elapsed.total_seconds()}s",
-        )
+            stream=True,
+        ) as response:
+            logger.info(
+                "Smartling API response: %s %s",
+                response.status_code,
+                f"{response.elapsed.total_seconds()}s",
+            )
 
-        if response.status_code != 200:
-            try:
-                response_json = response.json()
-            except requests.exceptions.JSONDecodeError as e:
-                raise InvalidResponse(f"Response was not valid JSON: {response.text}") from e
+            if response.status_code != 200:
+                try:
+                    response_json = response.json()
+                except requests.exceptions.JSONDecodeError as e:
+                    raise InvalidResponse(f"Response was not valid JSON: {response.text}") from e
 
-            serializer = ResponseSerializer(data=response_json)
+                serializer = ResponseSerializer(data=response_json)
 
-            try:
-                serializer.is_valid(raise_exception=True)
-            except rest_framework.serializers.ValidationError as e:
-                raise InvalidResponse(f"Response did not match expected format: {serializer.initial_data}") from e
+                try:
+                    serializer.is_valid(raise_exception=True)
+                except rest_framework.serializers.ValidationError as e:
+                    raise InvalidResponse(f"Response did not match expected format: {serializer.initial_data}") from e
 
-            try:
-                response.raise_for_status()
-            except HTTPError as e:
-                code, errors = serializer.response_errors
-                raise FailedResponse(code=code, errors=errors) from e
+                try:
+                    response.raise_for_status()
+                except HTTPError as e:
+                    code, errors = serializer.response_errors
+                    raise FailedResponse(code=code, errors=errors) from e
 
-        return response.content
+            return b"".join(self._iter_content(response, started_at=started_at))
 
     def add_locale_to_job(self, *, job: "Job", locale_id: str) -> None:
         """
@@ -0,0 +1,88 @@
+import secrets
+
+from collections.abc import Callable, Iterable, Iterator
+
+import polib
+
+
+def iter_po(po: polib.POFile) -> Iterator[str]:
+    """
+    Serialize a PO file in chunks, one entry at a time, rather than building
+    the whole file as a string like str(po).
+
+    Only polib's public API is used, so entries are serialized with
+    str(entry), which wraps long strings at polib's default width rather than
+    po.wrapwidth. Otherwise the output is the same as str(po), and it parses
+    to the same entries either way.
+    """
+    # The header comment and metadata, serialized by polib from an otherwise
+    # empty copy of the file
+    head = polib.POFile(wrapwidth=po.wrapwidth, encoding=po.encoding)
+    head.header = po.header
+    head.metadata = po.metadata
+    head.metadata_is_fuzzy = po.metadata_is_fuzzy
+    yield str(head)
+    for entry in po:
+        if not entry.obsolete:
+            yield "\n"
+            yield str(entry)
+    for entry in po.obsolete_entries():
+        yield "\n"
+        yield str(entry)
+
+
+class StreamingMultipartEncoder:
+    """
+    A multipart/form-data request body that's encoded as it's sent, rather than
+    built in memory first like requests does for `files`. Pass it to requests
+    as `data`, with `content_type` as the Content-Type header.
+
+    Each file's content is given by a callable returning an iterable of string
+    chunks. It's called twice: once to work out the Content-Length, which
+    Smartling needs, and once to send the body. For PO files that means they're
+    serialized twice per upload, trading CPU time for not holding the whole
+    file in memory.
+    """
+
+    chunk_size = 64 * 1024
+
+    def __init__(
+        self,
+        *,
+        fields: Iterable[tuple[str, str]],
+        files: Iterable[tuple[str, str, Callable[[], Iterable[str]]]],
+    ):
+        self.fields = list(fields)
+        self.files = list(files)
+        self.boundary = secrets.token_hex(16)
+        self.content_type = f"multipart/form-data; boundary={self.boundary}"
+        self._length: int | None = None
+
+    def _iter_parts(self) -> Iterator[bytes]:
+        for name, value in self.fields:
+            yield f'--{self.boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'.encode()
+        for name, filename, get_content in self.files:
+            yield (
+                f'--{self.boundary}\r\nContent-Disposition: form-data; name="{name}"; filename="{filename}"\r\n\r\n'
+            ).encode()
+            for chunk in get_content():
+                yield chunk.encode()
+            yield b"\r\n"
+        yield f"--{self.boundary}--\r\n".encode()
+
+    def __iter__(self) -> Iterator[bytes]:
+        # Send the body in reasonably sized chunks, rather than one per PO
+        # entry, to keep the number of writes to the socket down
+        buffer = bytearray()
+        for part in self._iter_parts():
+            buffer += part
+            if len(buffer) >= self.chunk_size:
+                yield bytes(buffer)
+                buffer.clear()
+        if buffer:
+            yield bytes(buffer)
+
+    def __len__(self) -> int:
+        if self._length is None:
+            self._length = sum(len(part) for part in self._iter_parts())
+        return self._length
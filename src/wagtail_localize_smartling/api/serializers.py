@@ -45,6 +45,11 @@ class ResponseSerializerMetaclass(serializers.SerializerMetaclass):
     """
 
     def __new__(cls, name, bases, attrs, **kwargs):
+        # The TypedDict from .types describing the response data, used by the
+        # lightweight validators in .validation
+        if "response_data_class" in kwargs:
+            attrs["response_data_class"] = kwargs["response_data_class"]
+
         if any(isinstance(b, ResponseSerializerMetaclass) for b in bases):
             # Identify whether this is a subclass requiring nullable `data`
 
@@ -124,6 +129,7 @@ class ResponseSerializer(
     # response = ...__InnerResponseSerializer() <- Created by ResponseSerializerMetaclass
 
     _data_serializer_class: ClassVar[type[serializers.Serializer]]
+    response_data_class: ClassVar[type | None] = None
 
     @cached_property
     def response_data(self) -> dict[str, Any]:
@@ -178,7 +184,10 @@ class AuthenticateResponseSerializer(
     tokenType = serializers.ChoiceField(choices=["Bearer"], allow_blank=False)
 
 
-class RefreshAccessTokenResponseSerializer(AuthenticateResponseSerializer):
+class RefreshAccessTokenResponseSerializer(
+    AuthenticateResponseSerializer,
+    response_data_class=types.RefreshAccessTokenResponseData,
+):
     # https://api-reference.smartling.com/#tag/Authentication/operation/refreshAccessToken
     pass
 
@@ -189,7 +198,10 @@ class TargetLocaleSerializer(serializers.Serializer):
     localeId = serializers.CharField()
 
 
-class GetProjectDetailsResponseSerializer(ResponseSerializer):
+class GetProjectDetailsResponseSerializer(
+    ResponseSerializer,
+    response_data_class=types.GetProjectDetailsResponseData,
+):
     # https://api-reference.smartling.com/#tag/Account-and-Projects/operation/getProjectDetails
     accountUid = serializers.CharField()
     archived = serializers.BooleanField()
@@ -205,7 +217,10 @@ class ListJobsItemSerializer(serializers.Serializer):
     jobName = serializers.CharField()
 
 
-class ListJobsResponseSerializer(ResponseSerializer):
+class ListJobsResponseSerializer(
+    ResponseSerializer,
+    response_data_class=types.ListJobsResponseData,
+):
     items = ListJobsItemSerializer(many=True)
 
 
@@ -214,7 +229,10 @@ class IssuesCountSerializer(serializers.Serializer):
     translationIssuesCount = serializers.IntegerField()
 
 
-class CreateJobResponseSerializer(ResponseSerializer):
+class CreateJobResponseSerializer(
+    ResponseSerializer,
+    response_data_class=types.CreateJobResponseData,
+):
     # https://api-reference.smartling.com/#tag/Jobs/operation/addJob
     callbackMethod = serializers.ChoiceField(choices=["GET", "POST"], allow_null=True)
     callbackUrl = serializers.URLField(allow_null=True)
@@ -255,30 +273,45 @@ class SourceFileSerializer(serializers.Serializer):
     fileUid = serializers.CharField()
 
 
-class GetJobDetailsResponseSerializer(CreateJobResponseSerializer):
+class GetJobDetailsResponseSerializer(
+    CreateJobResponseSerializer,
+    response_data_class=types.GetJobDetailsResponseData,
+):
     # https://api-reference.smartling.com/#tag/Jobs/operation/getJobDetails
     priority = serializers.IntegerField(allow_null=True)
     sourceFiles = serializers.ListField(child=SourceFileSerializer())
 
 
-class AddVisualContextToJobSerializer(ResponseSerializer):
+class AddVisualContextToJobSerializer(
+    ResponseSerializer,
+    response_data_class=types.AddVisualContextToJobResponseData,
+):
     # https://api-reference.smartling.com/#tag/Context/operation/uploadAndMatchVisualContext
     processUid = serializers.CharField()
 
 
-class CreateBatchResponseSerializer(ResponseSerializer):
+class CreateBatchResponseSerializer(
+    ResponseSerializer,
+    response_data_class=types.CreateBatchForJobResponseData,
+):
     # https://api-reference.smartling.com/#tag/Job-Batches-V2/operation/createJobBatchV2
     batchUid = serializers.CharField()
 
 
-class UploadFileToBatchResponseSerializer(NullDataResponseSerializer):
+class UploadFileToBatchResponseSerializer(
+    NullDataResponseSerializer,
+    response_data_class=types.UploadFileToBatchResponseData,
+):
     # https://api-reference.smartling.com/#tag/Job-Batches-V2/operation/uploadFileToJobBatchV2
     _acceptable_codes_for_null_response = [
         "ACCEPTED",
     ]
 
 
-class GetFileStatusResponseSerializer(ResponseSerializer):
+class GetFileStatusResponseSerializer(
+    ResponseSerializer,
+    response_data_class=types.FileStatusResponseData,
+):
     # https://api-reference.smartling.com/#tag/Files/operation/getFileTranslationStatusSingleLocale
     fileUri = serializers.CharField()
     totalStringCount = serializers.IntegerField()
@@ -291,7 +324,24 @@ class GetFileStatusResponseSerializer(ResponseSerializer):
     excludedWordCount = serializers.IntegerField()
 
 
-class AddLocaleToJobResponseSerializer(NullDataResponseSerializer):
+class FileLastModifiedItemSerializer(serializers.Serializer):
+    localeId = serializers.CharField()
+    lastModified = serializers.DateTimeField(default_timezone=UTC)
+
+
+class GetFileLastModifiedResponseSerializer(
+    ResponseSerializer,
+    response_data_class=types.FileLastModifiedResponseData,
+):
+    # https://api-reference.smartling.com/#tag/Files/operation/getFileLastModifiedAllLocales
+    totalCount = serializers.IntegerField()
+    items = FileLastModifiedItemSerializer(many=True)
+
+
+class AddLocaleToJobResponseSerializer(
+    NullDataResponseSerializer,
+    response_data_class=types.AddLocaleToJobResponseData,
+):
     # https://api-reference.smartling.com/#tag/Jobs/operation/addLocaleToJob
     # The API returns data: None on success for this endpoint
     _acceptable_codes_for_null_response = ["SUCCESS"]
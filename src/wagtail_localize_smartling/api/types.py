@@ -6,8 +6,8 @@ from django.utils.translation import gettext_lazy as _
 
 
 class _SmartlingAPIErrorDictBase(TypedDict):
-    key: str
-    message: str
+    key: str | None
+    message: str | None
 
 
 class SmartlingAPIErrorDict(_SmartlingAPIErrorDictBase, total=False):
@@ -118,6 +118,10 @@ class UploadFileToBatchResponseData(TypedDict):
     pass
 
 
+class AddLocaleToJobResponseData(TypedDict):
+    pass
+
+
 class FileStatusResponseData(TypedDict):
     """Response data from GET /files-api/v2/projects/{projectId}/locales/{localeId}/file/status"""
 
@@ -130,3 +134,15 @@ class FileStatusResponseData(TypedDict):
     completedWordCount: int
     excludedStringCount: int
     excludedWordCount: int
+
+
+class FileLastModifiedItemData(TypedDict):
+    localeId: str
+    lastModified: datetime
+
+
+class FileLastModifiedResponseData(TypedDict):
+    """Response data from GET /files-api/v2/projects/{projectId}/file/last-modified"""
+
+    totalCount: int
+    items: list[FileLastModifiedItemData]
@@ -0,0 +1,208 @@
+"""
+Lightweight validation of Smartling API responses against the TypedDicts in
+.types, as an alternative to the DRF serializers in .serializers.
+
+Validating a response with a DRF serializer instantiates the serializer and
+its nested serializers and runs every field's validation, which adds up on
+frequent calls like getting file statuses and job details. Here, a validator
+function is built once per response type instead, and it only checks the
+structure and types of the response:
+
+- Keys missing from the response data raise an error, and keys that aren't
+  declared on the TypedDict are dropped
+- str, int and bool values must have those types (ints are accepted for str
+  and integer strings for int, like DRF does)
+- Literal and enum values must be one of their choices
+- datetime values are parsed from ISO 8601 strings and converted to UTC
+
+Unlike the serializers, whitespace isn't trimmed from strings, and blank
+strings and URL formats aren't checked.
+
+Select these validators with the API_RESPONSE_VALIDATION setting.
+"""
+
+import enum
+import types as builtin_types
+
+from collections.abc import Callable
+from datetime import UTC, datetime
+from functools import cache
+from typing import TYPE_CHECKING, Any, Literal, Union, get_args, get_origin, get_type_hints, is_typeddict
+
+from django.utils.dateparse import parse_datetime
+
+from .types import SmartlingAPIErrorDict
+
+
+if TYPE_CHECKING:
+    from .serializers import ResponseSerializer
+
+
+Validator = Callable[[Any, str], Any]
+
+
+class ResponseValidationError(Exception):
+    def __init__(self, path: str, message: str):
+        self.path = path
+        self.message = message
+
+    def __str__(self):
+        return f"{self.path}: {self.message}"
+
+
+def _validate_any(value: Any, path: str) -> Any:
+    return value
+
+
+def _validate_str(value: Any, path: str) -> str:
+    if isinstance(value, str):
+        return value
+    if isinstance(value, int | float) and not isinstance(value, bool):
+        return str(value)
+    raise ResponseValidationError(path, "expected a string")
+
+
+def _validate_int(value: Any, path: str) -> int:
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            pass
+    raise ResponseValidationError(path, "expected an integer")
+
+
+def _validate_bool(value: Any, path: str) -> bool:
+    if isinstance(value, bool):
+        return value
+    raise ResponseValidationError(path, "expected a boolean")
+
+
+def _validate_datetime(value: Any, path: str) -> datetime:
+    parsed = None
+    if isinstance(value, str):
+        try:
+            parsed = parse_datetime(value)
+        except ValueError:
+            pass
+    if parsed is None:
+        raise ResponseValidationError(path, "expected an ISO 8601 datetime")
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=UTC)
+    return parsed.astimezone(UTC)
+
+
+_SCALAR_VALIDATORS: dict[Any, Validator] = {
+    Any: _validate_any,
+    str: _validate_str,
+    int: _validate_int,
+    bool: _validate_bool,
+    datetime: _validate_datetime,
+}
+
+
+@cache
+def get_validator(tp: Any) -> Validator:
+    """
+    Build a function that validates a value against the given type, e.g. a
+    TypedDict from .types, and returns the validated value.
+    """
+    if tp in _SCALAR_VALIDATORS:
+        return _SCALAR_VALIDATORS[tp]
+
+    origin = get_origin(tp)
+
+    if origin in (Union, builtin_types.UnionType):
+        non_null_types = [arg for arg in get_args(tp) if arg is not type(None)]
+        if len(non_null_types) != 1 or len(get_args(tp)) != 2:
+            raise TypeError(f"Only optional types are supported, not {tp!r}")
+        validate_value = get_validator(non_null_types[0])
+
+        def validate_optional(value: Any, path: str) -> Any:
+            return None if value is None else validate_value(value, path)
+
+        return validate_optional
+
+    if origin is list:
+        (item_type,) = get_args(tp)
+        validate_item = get_validator(item_type)
+
+        def validate_list(value: Any, path: str) -> list:
+            if not isinstance(value, list):
+                raise ResponseValidationError(path, "expected a list")
+            return [validate_item(item, f"{path}[{i}]") for i, item in enumerate(value)]
+
+        return validate_list
+
+    if origin is Literal or (isinstance(tp, type) and issubclass(tp, enum.Enum)):
+        choices = frozenset(get_args(tp) if origin is Literal else (member.value for member in tp))
+
+        def validate_choice(value: Any, path: str) -> Any:
+            if value not in choices:
+                raise ResponseValidationError(path, f"{value!r} is not a valid choice")
+            return value
+
+        return validate_choice
+
+    if is_typeddict(tp):
+        fields = [
+            (name, get_validator(field_type), name in tp.__required_keys__)
+            for name, field_type in get_type_hints(tp).items()
+        ]
+
+        def validate_typeddict(value: Any, path: str) -> dict[str, Any]:
+            if not isinstance(value, dict):
+                raise ResponseValidationError(path, "expected an object")
+            validated = {}
+            for name, validate_field, required in fields:
+                if name in value:
+                    validated[name] = validate_field(value[name], f"{path}.{name}")
+                elif required:
+                    raise ResponseValidationError(f"{path}.{name}", "missing")
+            return validated
+
+        return validate_typeddict
+
+    raise TypeError(f"Cannot validate values of type {tp!r}")
+
+
+@cache
+def get_response_validator(
+    response_serializer_class: type["ResponseSerializer"],
+) -> Callable[[Any], dict[str, Any]]:
+    """
+    Build a function that validates a whole Smartling response, i.e.
+
+    {"response": {"code": ..., "data": ..., "errors": [...]}}
+
+    where "data" is validated against the serializer class' response_data_class
+    TypedDict. The validated response has the same structure as the
+    serializer's validated_data.
+    """
+    if response_serializer_class.response_data_class is None:
+        raise TypeError(f"{response_serializer_class.__name__} has no response_data_class")
+
+    validate_data = get_validator(response_serializer_class.response_data_class)
+    validate_errors = get_validator(list[SmartlingAPIErrorDict])
+    null_data_codes = frozenset(getattr(response_serializer_class, "_acceptable_codes_for_null_response", ()))
+
+    def validate_response(value: Any) -> dict[str, Any]:
+        if not isinstance(value, dict) or not isinstance(response := value.get("response"), dict):
+            raise ResponseValidationError("response", "expected an object")
+        if "data" in response and "errors" in response:
+            raise ResponseValidationError("response", "data and errors cannot both be present")
+        if "code" not in response:
+            raise ResponseValidationError("response.code", "missing")
+
+        validated: dict[str, Any] = {"code": _validate_str(response["code"], "response.code")}
+        if "data" in response:
+            if response["data"] is None and validated["code"] in null_data_codes:
+                validated["data"] = None
+            else:
+                validated["data"] = validate_data(response["data"], "response.data")
+        if "errors" in response:
+            validated["errors"] = validate_errors(response["errors"], "response.errors")
+        return {"response": validated}
+
+    return validate_response
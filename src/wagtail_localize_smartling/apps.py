@@ -9,3 +9,5 @@ class WagtailLocalizeSmartlingAppConfig(AppConfig):
 
     def ready(self):
         from . import checks, signal_handlers, signals  # noqa: F401
+
+        signal_handlers.connect_snippet_published_handlers()
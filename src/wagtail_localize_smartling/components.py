@@ -1,12 +1,23 @@
 from typing import TYPE_CHECKING
 
+from django.core.cache import cache
+from django.utils.safestring import mark_safe
+from django.utils.translation import get_language
+
 
 if TYPE_CHECKING:
     from laces.typing import RenderContext
 
 from wagtail.admin.ui.components import Component
 
-from .models import LandedTranslationTask
+from .models import LandedTranslationTask, get_landed_translation_tasks_version
+
+
+# How long a user's rendered panel is cached for. The cache key includes a
+# version that changes whenever tasks are created or completed, so this only
+# bounds how stale the panel can get from changes to the translated items
+# themselves, such as renames.
+PANEL_CACHE_TIMEOUT = 60
 
 
 class LandedTranslationsPanel(Component):
@@ -19,11 +30,46 @@ class LandedTranslationsPanel(Component):
         super().__init__(*args, **kwargs)
 
     def get_all_landed_translation_tasks(self):
-        return LandedTranslationTask.objects.incomplete()  # pyright: ignore[reportAttributeAccessIssue]
+        return (
+            LandedTranslationTask.objects.incomplete()  # pyright: ignore[reportAttributeAccessIssue]
+            .select_related("content_type", "relevant_locale")
+            # Fetches the translated items with one query per content type
+            .prefetch_related("content_object")
+        )
 
     def get_context_data(self, parent_context: "RenderContext | None" = None):
         context = {}
         all_tasks = self.get_all_landed_translation_tasks()
-        context["tasks"] = all_tasks[: self.max_to_show]
-        context["total_tasks"] = all_tasks.count()
+        context["tasks"] = tasks = list(all_tasks[: self.max_to_show])
+        if self.max_to_show is None or len(tasks) < self.max_to_show:
+            context["total_tasks"] = len(tasks)
+        else:
+            context["total_tasks"] = all_tasks.count()
         return context
+
+    def get_cache_key(self, parent_context: "RenderContext | None" = None) -> str | None:
+        request = parent_context.get("request") if parent_context else None
+        user = getattr(request, "user", None)
+        if user is None or not user.is_authenticated:
+            return None
+
+        return ":".join(
+            [
+                "wagtail_localize_smartling:landed_translations_panel",
+                str(user.pk),
+                str(get_language()),
+                str(self.max_to_show),
+                str(get_landed_translation_tasks_version()),
+            ]
+        )
+
+    def render_html(self, parent_context: "RenderContext | None" = None):
+        cache_key = self.get_cache_key(parent_context)
+        if cache_key is None:
+            return super().render_html(parent_context)
+
+        html = cache.get(cache_key)
+        if html is None:
+            html = super().render_html(parent_context)
+            cache.set(cache_key, html, PANEL_CACHE_TIMEOUT)
+        return mark_safe(html)  # noqa: S308
@@ -0,0 +1,142 @@
+import csv
+import json
+
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from typing import Any
+
+from django.db.models import Prefetch, QuerySet
+
+from .models import Job, JobTranslation
+
+
+EXPORT_FORMATS = ("csv", "jsonl")
+EXPORT_CONTENT_TYPES = {
+    "csv": "text/csv",
+    "jsonl": "application/x-ndjson",
+}
+EXPORT_FIELDS = (
+    "id",
+    "name",
+    "reference_number",
+    "translation_job_uid",
+    "source_title",
+    "status",
+    "user",
+    "due_date",
+    "first_synced_at",
+    "last_synced_at",
+    "translations_imported_at",
+    "locales",
+)
+DEFAULT_CHUNK_SIZE = 2000
+
+
+def _format_datetime(value: datetime | None) -> str | None:
+    return value.isoformat() if value is not None else None
+
+
+def get_export_queryset(queryset: QuerySet[Job] | None = None) -> QuerySet[Job]:
+    """
+    Returns the given Job queryset (or all jobs) with everything needed for
+    the export fetched alongside each chunk of jobs.
+    """
+    if queryset is None:
+        queryset = Job.objects.all()
+
+    return (
+        queryset.select_related("user")
+        .prefetch_related(
+            Prefetch(
+                "job_translations",
+                queryset=JobTranslation.objects.select_related("translation__target_locale").order_by(
+                    "translation__target_locale__language_code"
+                ),
+            )
+        )
+        .order_by("pk")
+    )
+
+
+def iter_job_export_rows(
+    queryset: QuerySet[Job] | None = None,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[dict[str, Any]]:
+    """
+    Yields one dict per job, with the keys in EXPORT_FIELDS. "locales" is a
+    list of dicts with each target locale's language code and the time its
+    translation was imported, if it has been.
+
+    Jobs are fetched chunk_size at a time, so memory use doesn't grow with
+    the number of jobs.
+    """
+    for job in get_export_queryset(queryset).iterator(chunk_size=chunk_size):
+        yield {
+            "id": job.pk,
+            "name": job.name,
+            "reference_number": job.reference_number,
+            "translation_job_uid": job.translation_job_uid,
+            "source_title": job.source_title,
+            "status": job.status,
+            "user": job.user.get_username(),
+            "due_date": _format_datetime(job.due_date),
+            "first_synced_at": _format_datetime(job.first_synced_at),
+            "last_synced_at": _format_datetime(job.last_synced_at),
+            "translations_imported_at": _format_datetime(job.translations_imported_at),
+            "locales": [
+                {
+                    "locale": job_translation.translation.target_locale.language_code,
+                    "imported_at": _format_datetime(job_translation.imported_at),
+                }
+                for job_translation in job.job_translations.all()  # pyright: ignore[reportAttributeAccessIssue]
+            ],
+        }
+
+
+class _Echo:
+    """
+    A file-like object that returns what it's given, so that csv.writer can
+    produce lines for a streaming response.
+    """
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def stream_csv(rows: Iterable[dict[str, Any]]) -> Iterator[str]:
+    """
+    Yields the given export rows as CSV lines, starting with a header. Each
+    job's locales are combined into a single "locale=imported_at" column,
+    separated by semicolons.
+    """
+    writer = csv.writer(_Echo())
+    yield writer.writerow(EXPORT_FIELDS)
+    for row in rows:
+        locales = ";".join(f"{locale['locale']}={locale['imported_at'] or ''}" for locale in row["locales"])
+        yield writer.writerow(
+            [locales if field == "locales" else ("" if row[field] is None else row[field]) for field in EXPORT_FIELDS]
+        )
+
+
+def stream_jsonl(rows: Iterable[dict[str, Any]]) -> Iterator[str]:
+    """
+    Yields the given export rows as JSON Lines.
+    """
+    for row in rows:
+        yield json.dumps(row) + "\n"
+
+
+def stream_job_export(
+    export_format: str,
+    queryset: QuerySet[Job] | None = None,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[str]:
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format {export_format!r}")
+
+    rows = iter_job_export_rows(queryset, chunk_size=chunk_size)
+    if export_format == "csv":
+        return stream_csv(rows)
+    return stream_jsonl(rows)
@@ -0,0 +1,41 @@
+from django.core.management import BaseCommand
+
+from wagtail_localize_smartling.exports import DEFAULT_CHUNK_SIZE, EXPORT_FORMATS, stream_job_export
+
+
+class Command(BaseCommand):
+    """
+    Management command that exports all Smartling jobs, with the import time
+    of each of their target locales, as CSV or JSON Lines. Jobs are streamed
+    in chunks so memory use stays constant however many jobs there are.
+    """
+
+    help = "Export all Smartling jobs as CSV or JSON Lines"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--format",
+            choices=EXPORT_FORMATS,
+            default="csv",
+            help="Output format (default: csv)",
+        )
+        parser.add_argument(
+            "--output",
+            help="File to write the export to (default: stdout)",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help=f"Number of jobs to fetch from the database at a time (default: {DEFAULT_CHUNK_SIZE})",
+        )
+
+    def handle(self, *args, **options) -> None:
+        lines = stream_job_export(options["format"], chunk_size=options["chunk_size"])
+
+        if options["output"]:
+            with open(options["output"], "w", newline="", encoding="utf-8") as f:
+                f.writelines(lines)
+        else:
+            for line in lines:
+                self.stdout.write(line, ending="")
@@ -0,0 +1,32 @@
+from django.core.cache import cache
+from django.core.management import BaseCommand
+
+from wagtail_localize_smartling.models import JOB_SOURCE_CONTENT_TYPES_CACHE_KEY, Job
+from wagtail_localize_smartling.utils import get_source_instances
+
+
+class Command(BaseCommand):
+    """
+    Management command intended to be run once to populate missing
+    `Job.source_title`s and `Job.source_content_type`s
+    """
+
+    def handle(self, *args, **kwargs) -> None:
+        jobs = list(Job.objects.filter(source_title="").select_related("translation_source"))
+        source_instances = get_source_instances(job.translation_source for job in jobs)
+
+        updated_jobs = []
+        for job in jobs:
+            # Skip jobs whose source instance has since been deleted
+            if (source_instance := source_instances[job.translation_source_id]) is not None:  # pyright: ignore[reportAttributeAccessIssue]
+                job.refresh_source_details(source_instance)
+                updated_jobs.append(job)
+
+        if updated_jobs:
+            Job.objects.bulk_update(updated_jobs, ["source_title", "source_content_type"])
+            cache.delete(JOB_SOURCE_CONTENT_TYPES_CACHE_KEY)
+            self.stdout.write(
+                self.style.SUCCESS(f"Successfully populated {len(updated_jobs)} Smartling job source details")
+            )
+        else:
+            self.stdout.write(self.style.WARNING("Found no Smartling jobs to populate the source details for."))
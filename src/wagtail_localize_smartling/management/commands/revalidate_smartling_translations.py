@@ -0,0 +1,74 @@
+import logging
+
+from datetime import timedelta
+
+from django.core.management import BaseCommand, CommandError
+from django.db.models import F
+from django.utils import timezone
+
+from wagtail_localize_smartling.api.client import client
+from wagtail_localize_smartling.constants import TRANSLATED_STATUSES
+from wagtail_localize_smartling.models import Job, Project
+from wagtail_localize_smartling.sync import SyncJobException, revalidate_job
+
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Management command intended to be run on a low-frequency schedule (e.g.
+    daily) that picks up changes made in Smartling to the translations of jobs
+    that have already been imported, such as fixes made by translators after
+    the job was closed, and imports the locales that changed.
+
+    sync_smartling doesn't look at closed jobs again, so without this those
+    changes only land if the job is resubmitted.
+
+    Each run checks at most --limit jobs whose translations were imported in
+    the last --days days, starting with the ones that were checked longest ago.
+    Checking an unchanged job takes a single Smartling API request.
+    """
+
+    help = "Import changes made in Smartling to the translations of recently imported jobs"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=30,
+            help="Check jobs whose translations were imported in this many days (default: 30)",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=50,
+            help="Maximum number of jobs to check in this run (default: 50)",
+        )
+
+    def handle(self, *args, **options) -> None:
+        now = timezone.now()
+        job_ids = list(
+            Job.objects.filter(
+                project=Project.get_current(),
+                status__in=TRANSLATED_STATUSES,
+                translations_imported_at__gte=now - timedelta(days=options["days"]),
+            )
+            .order_by(F("translations_revalidated_at").asc(nulls_first=True), "pk")
+            .values_list("pk", flat=True)[: options["limit"]]
+        )
+
+        for job_id in job_ids:
+            try:
+                revalidate_job(job_id)
+            except SyncJobException:
+                logger.exception("Error revalidating job with ID %s", job_id)
+                if client.circuit_breaker.is_open():
+                    raise CommandError(
+                        "Smartling API is failing, stopped revalidating jobs until it recovers"
+                    ) from None
+                # Move on to other jobs in the next run, rather than retrying
+                # this one first every time
+                Job.objects.filter(pk=job_id).update(translations_revalidated_at=now)
+
+        self.stdout.write(f"Revalidated {len(job_ids)} Smartling job(s)")
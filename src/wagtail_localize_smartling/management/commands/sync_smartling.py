@@ -1,10 +1,13 @@
 import logging
 
-from django.core.management import BaseCommand
+from django.core.management import BaseCommand, CommandError
+from django.db.models import Q
 
-from wagtail_localize_smartling.constants import FINAL_STATUSES
-from wagtail_localize_smartling.models import Job, Project
-from wagtail_localize_smartling.sync import SyncJobException, sync_job
+from wagtail_localize_smartling.api.client import client
+from wagtail_localize_smartling.constants import FINAL_STATUSES, TRANSLATED_STATUSES
+from wagtail_localize_smartling.models import Job, JobTranslation, Project
+from wagtail_localize_smartling.notifications import send_queued_notifications
+from wagtail_localize_smartling.sync import JobNotFound, SyncJobException, sync_job
 
 
 logger = logging.getLogger(__name__)
@@ -13,18 +16,42 @@ logger = logging.getLogger(__name__)
 class Command(BaseCommand):
     """
     Management command intended to be run on a schedule (e.g. every 10 minutes) that:
+    - Refreshes the current project's details from Smartling
     - Picks up any pending translation jobs that need to be sent to Smartling
     - Checks the status of any unfinalised jobs and updates them as appropriate
-    - Applies any new translations
+    - Applies any new translations, and retries any locales that failed to import
+    - Sends any queued translation-imported notifications
+
+    If the Smartling API client's circuit breaker opens because Smartling is
+    failing, the remaining jobs are skipped and the command exits with an error.
     """
 
     def handle(self, *args, **kwargs) -> None:
-        project = Project.get_current()
-
-        for job_id in Job.objects.exclude(
-            project=project, status__in=FINAL_STATUSES
-        ).values_list("pk", flat=True):
+        project = Project.get_current(refresh=True)
+
+        # Finalised jobs are only synced to retry locales that failed to import
+        failed_imports = JobTranslation.objects.due_for_import_retry().values("job")
+        jobs = Job.objects.exclude(
+            Q(project=project, status__in=FINAL_STATUSES)
+            & ~Q(status__in=TRANSLATED_STATUSES, pk__in=failed_imports)
+        )
+        circuit_open = False
+        for job_id in jobs.values_list("pk", flat=True):
             try:
                 sync_job(job_id)
+            except JobNotFound:
+                # Merged into another job for the same translation source, see
+                # the SUBMISSION_COALESCE_WINDOW_MINUTES setting
+                logger.info("Job with ID %s no longer exists", job_id)
             except SyncJobException:
                 logger.exception("Error syncing job with ID %s", job_id)
+                if circuit_open := client.circuit_breaker.is_open():
+                    break
+
+        try:
+            send_queued_notifications()
+        except Exception:
+            logger.exception("Error sending translation-imported notifications")
+
+        if circuit_open:
+            raise CommandError("Smartling API is failing, stopped syncing jobs until it recovers")
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-19 01:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("wagtail_localize_smartling", "0008_jobtranslation_content_hash"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="job",
+            index=models.Index(
+                fields=["translation_source", "content_hash", "status"], name="wls_job_source_hash_status_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="jobtranslation",
+            index=models.Index(
+                condition=models.Q(("imported_at__isnull", True)), fields=["job"], name="wls_jobtranslation_pending_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="landedtranslationtask",
+            index=models.Index(
+                condition=models.Q(("cancelled_on__isnull", True), ("completed_on__isnull", True)),
+                fields=["content_type", "object_id"],
+                name="wls_landedtask_open_object_idx",
+            ),
+        ),
+    ]
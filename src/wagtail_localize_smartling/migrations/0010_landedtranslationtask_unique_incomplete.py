@@ -0,0 +1,51 @@
+# Generated by Django 5.2.18 on 2026-10-19 01:19
+
+from django.db import migrations, models
+from django.db.models import Count, Min
+from django.db.models.functions import Now
+
+
+def cancel_duplicate_incomplete_tasks(apps, schema_editor):
+    """
+    Before adding the unique constraint, cancel all but the oldest incomplete
+    task for each translated object and locale.
+    """
+    LandedTranslationTask = apps.get_model("wagtail_localize_smartling", "LandedTranslationTask")
+
+    incomplete_tasks = LandedTranslationTask.objects.filter(
+        completed_on__isnull=True,
+        cancelled_on__isnull=True,
+    )
+    duplicates = (
+        incomplete_tasks.values("content_type", "object_id", "relevant_locale")
+        .annotate(task_count=Count("pk"), first_pk=Min("pk"))
+        .filter(task_count__gt=1)
+    )
+    for duplicate in duplicates:
+        incomplete_tasks.filter(
+            content_type=duplicate["content_type"],
+            object_id=duplicate["object_id"],
+            relevant_locale=duplicate["relevant_locale"],
+        ).exclude(pk=duplicate["first_pk"]).update(cancelled_on=Now())
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("wagtail_localize_smartling", "0009_hot_lookup_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(cancel_duplicate_incomplete_tasks, migrations.RunPython.noop),
+        migrations.RemoveIndex(
+            model_name="landedtranslationtask",
+            name="wls_landedtask_open_object_idx",
+        ),
+        migrations.AddConstraint(
+            model_name="landedtranslationtask",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("cancelled_on__isnull", True), ("completed_on__isnull", True)),
+                fields=("content_type", "object_id", "relevant_locale"),
+                name="unique_incomplete_landed_translation_task",
+            ),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-19 01:41
+
+import django.db.models.deletion
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("wagtail_localize_smartling", "0011_translationimportednotification"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="job",
+            name="source_content_type",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="contenttypes.contenttype",
+            ),
+        ),
+        migrations.AddField(
+            model_name="job",
+            name="source_title",
+            field=models.CharField(blank=True, editable=False, max_length=255),
+        ),
+        migrations.AddIndex(
+            model_name="job",
+            index=models.Index(fields=["source_title"], name="wls_job_source_title_idx"),
+        ),
+    ]
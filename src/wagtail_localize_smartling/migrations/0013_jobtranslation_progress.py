@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-19 01:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("wagtail_localize_smartling", "0012_job_source_details"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="jobtranslation",
+            name="completed_string_count",
+            field=models.PositiveIntegerField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="jobtranslation",
+            name="progress_checked_at",
+            field=models.DateTimeField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="jobtranslation",
+            name="total_string_count",
+            field=models.PositiveIntegerField(editable=False, null=True),
+        ),
+    ]
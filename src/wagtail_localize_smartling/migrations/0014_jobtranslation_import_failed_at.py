@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("wagtail_localize_smartling", "0013_jobtranslation_progress"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="jobtranslation",
+            name="import_failed_at",
+            field=models.DateTimeField(editable=False, null=True),
+        ),
+    ]
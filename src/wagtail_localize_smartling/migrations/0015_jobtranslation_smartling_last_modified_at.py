@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("wagtail_localize_smartling", "0014_jobtranslation_import_failed_at"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="jobtranslation",
+            name="smartling_last_modified_at",
+            field=models.DateTimeField(editable=False, null=True),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("wagtail_localize_smartling", "0015_jobtranslation_smartling_last_modified_at"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="job",
+            name="translations_revalidated_at",
+            field=models.DateTimeField(editable=False, null=True),
+        ),
+    ]
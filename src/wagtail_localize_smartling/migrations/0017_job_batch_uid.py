@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("wagtail_localize_smartling", "0016_job_translations_revalidated_at"),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name="job",
+            name="status_consistent_with_sync_dates",
+        ),
+        migrations.AddField(
+            model_name="job",
+            name="batch_uid",
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AddConstraint(
+            model_name="job",
+            constraint=models.CheckConstraint(
+                condition=models.Q(
+                    models.Q(
+                        ("first_synced_at__isnull", True), ("last_synced_at__isnull", True), ("status", "UNSYNCED")
+                    ),
+                    models.Q(
+                        models.Q(("status", "UNSYNCED"), _negated=True),
+                        ("first_synced_at__isnull", False),
+                        ("last_synced_at__isnull", False),
+                        models.Q(("translation_job_uid", ""), _negated=True),
+                    ),
+                    _connector="OR",
+                ),
+                name="status_consistent_with_sync_dates",
+            ),
+        ),
+    ]
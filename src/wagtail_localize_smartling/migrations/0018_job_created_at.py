@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-19 03:03
+
+import django.utils.timezone
+
+from django.db import migrations, models
+from django.db.models import F, OuterRef, Subquery
+
+
+def backfill_created_at(apps, schema_editor):
+    """
+    Existing jobs would otherwise all be stamped with the time of the
+    migration, holding back the UNSYNCED ones for the whole
+    SUBMISSION_COALESCE_WINDOW_MINUTES window. Use when they were first synced
+    instead, or for jobs that haven't been, when their translation source was
+    created.
+    """
+    Job = apps.get_model("wagtail_localize_smartling", "Job")
+    TranslationSource = apps.get_model("wagtail_localize", "TranslationSource")
+    Job.objects.filter(first_synced_at__isnull=False).update(created_at=F("first_synced_at"))
+    Job.objects.filter(first_synced_at__isnull=True).update(
+        created_at=Subquery(
+            TranslationSource.objects.filter(pk=OuterRef("translation_source_id")).values("created_at")[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("wagtail_localize_smartling", "0017_job_batch_uid"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="job",
+            name="created_at",
+            field=models.DateTimeField(default=django.utils.timezone.now, editable=False),
+        ),
+        migrations.RunPython(backfill_created_at, migrations.RunPython.noop),
+    ]
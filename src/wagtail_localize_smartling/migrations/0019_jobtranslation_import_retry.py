@@ -0,0 +1,43 @@
+# Generated by Django 5.2.18 on 2026-10-19 03:22
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def schedule_retries_of_failed_imports(apps, schema_editor):
+    """
+    Keep retrying the locales that had already failed to import.
+    """
+    JobTranslation = apps.get_model("wagtail_localize_smartling", "JobTranslation")
+    JobTranslation.objects.filter(import_failed_at__isnull=False).update(
+        import_failure_count=1,
+        import_retry_at=F("import_failed_at"),
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("wagtail_localize_smartling", "0018_job_created_at"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="jobtranslation",
+            name="import_failure_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="jobtranslation",
+            name="import_retry_at",
+            field=models.DateTimeField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="jobtranslation",
+            index=models.Index(
+                condition=models.Q(("import_retry_at__isnull", False)),
+                fields=["import_retry_at"],
+                name="wls_jobtranslation_retry_idx",
+            ),
+        ),
+        migrations.RunPython(schedule_retries_of_failed_imports, migrations.RunPython.noop),
+    ]
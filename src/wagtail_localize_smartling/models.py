@@ -1,14 +1,17 @@
 import hashlib
 import logging
+import time
 
 from collections.abc import Iterable
-from datetime import datetime
-from functools import lru_cache
+from datetime import datetime, timedelta
 
 from django.conf import settings
+from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AbstractBaseUser
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.core.exceptions import ObjectDoesNotExist
 from django.db import models, transaction
 from django.db.models.manager import Manager
 from django.urls import reverse
@@ -26,6 +29,7 @@ from .api.types import JobStatus
 from .constants import EXPANDABLE_JOB_STATUSES, UNSYNCED_OR_PENDING_STATUSES
 from .forms import JobForm
 from .settings import settings as smartling_settings
+from .signals import landed_translation_tasks_completed
 from .sync import sync_job
 from .utils import compute_content_hash, get_snippet_admin_url
 
@@ -42,6 +46,23 @@ class SyncedModel(models.Model):
         abstract = True
 
 
+# Locales that fail to import are retried by later syncs after a delay that
+# doubles with each failure, up to a maximum, and are given up on after a
+# number of failures so that a file that can never be imported isn't
+# downloaded again on every sync
+IMPORT_RETRY_BASE_DELAY = timedelta(minutes=10)
+IMPORT_RETRY_MAX_DELAY = timedelta(days=1)
+MAX_IMPORT_FAILURES = 10
+
+
+class JobTranslationQuerySet(models.QuerySet):
+    def due_for_import_retry(self, now: datetime | None = None):
+        """
+        Locales that failed to import and are due to be retried.
+        """
+        return self.filter(import_retry_at__lte=now or timezone.now())
+
+
 class JobTranslation(models.Model):
     """
     Through model for Job.translations M2M that tracks per-locale import status.
@@ -62,13 +83,99 @@ class JobTranslation(models.Model):
     )
     imported_at = models.DateTimeField(null=True, editable=False)
     content_hash = models.CharField(max_length=64, blank=True, editable=False)
+    # When Smartling last modified the translation that was imported, so that
+    # unchanged translations aren't downloaded again
+    smartling_last_modified_at = models.DateTimeField(null=True, editable=False)
+    # Set when importing this locale's translation failed, so that later syncs
+    # retry it, and cleared once it's imported
+    import_failed_at = models.DateTimeField(null=True, editable=False)
+    # The number of times in a row importing failed, and when to retry it.
+    # import_retry_at is cleared once the locale has been given up on
+    import_failure_count = models.PositiveIntegerField(default=0, editable=False)
+    import_retry_at = models.DateTimeField(null=True, editable=False)
+    # Per-locale progress, as last reported by Smartling when the job was synced
+    completed_string_count = models.PositiveIntegerField(null=True, editable=False)
+    total_string_count = models.PositiveIntegerField(null=True, editable=False)
+    progress_checked_at = models.DateTimeField(null=True, editable=False)
+
+    objects = JobTranslationQuerySet.as_manager()
+
+    import_failure_fields = ["import_failed_at", "import_failure_count", "import_retry_at"]
 
     class Meta:
         unique_together = ["job", "translation"]
+        indexes = [
+            # Supports the per-locale import check in sync, which looks for
+            # a job's translations that haven't been imported yet
+            models.Index(
+                fields=["job"],
+                condition=models.Q(imported_at__isnull=True),
+                name="wls_jobtranslation_pending_idx",
+            ),
+            # Supports sync_smartling finding the locales to retry importing
+            models.Index(
+                fields=["import_retry_at"],
+                condition=models.Q(import_retry_at__isnull=False),
+                name="wls_jobtranslation_retry_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"JobTranslation({self.job.pk}, {self.translation.pk})"
 
+    def record_import_failure(self, now: datetime) -> None:
+        """
+        Mark this locale as having failed to import, and schedule the next
+        retry. Doesn't save the JobTranslation, see import_failure_fields.
+        """
+        self.import_failed_at = now
+        self.import_failure_count += 1
+        if self.import_failure_count >= MAX_IMPORT_FAILURES:
+            logger.error(
+                "Importing %s failed %d times, it won't be retried automatically",
+                self,
+                self.import_failure_count,
+            )
+            self.import_retry_at = None
+        else:
+            delay = IMPORT_RETRY_BASE_DELAY * 2 ** (self.import_failure_count - 1)
+            self.import_retry_at = now + min(delay, IMPORT_RETRY_MAX_DELAY)
+
+    def clear_import_failure(self) -> None:
+        self.import_failed_at = None
+        self.import_failure_count = 0
+        self.import_retry_at = None
+
+    def is_import_due(self, now: datetime) -> bool:
+        """
+        Whether importing this locale should be attempted, i.e. it hasn't
+        failed, or it's due to be retried.
+        """
+        return self.import_failed_at is None or (self.import_retry_at is not None and self.import_retry_at <= now)
+
+    @property
+    def progress_percentage(self) -> int | None:
+        """
+        The percentage of strings translated when progress was last checked,
+        or None if it hasn't been checked.
+        """
+        if not self.total_string_count or self.completed_string_count is None:
+            return None
+        return min(100, self.completed_string_count * 100 // self.total_string_count)
+
+    def get_progress_display(self) -> str:
+        if self.import_failed_at is not None:
+            return _("Import failed")
+        if self.imported_at is not None:
+            return _("Imported")
+        if (percentage := self.progress_percentage) is None:
+            return ""
+        return _("%(completed)d/%(total)d strings translated (%(percentage)d%%)") % {
+            "completed": self.completed_string_count,
+            "total": self.total_string_count,
+            "percentage": percentage,
+        }
+
 
 class Project(SyncedModel):
     """
@@ -99,17 +206,78 @@ class Project(SyncedModel):
     def __str__(self):
         return f"{self.name} ({self.project_id})"
 
+    # The current project, and the time.monotonic() after which it should be
+    # looked up again, shared by every call to get_current() in this process
+    _current: "tuple[Project, float] | None" = None
+
+    @classmethod
+    def get_current(cls, *, refresh: bool = False) -> "Project":
+        """
+        Returns the current Project as per the PROJECT_ID setting.
+
+        The project is cached in this process for PROJECT_CACHE_TIMEOUT_SECONDS
+        and then looked up in the database again. If its details were last
+        synced from the Smartling API longer ago than that, the stale project is
+        returned while a refresh is queued on the wagtail-localize background
+        worker, if there is one, or otherwise left to the next sync_smartling
+        run. The API is only called before returning when refresh is True, or
+        when the project isn't in the database yet.
+        """
+        if not refresh:
+            if cls._current is not None:
+                project, expires_at = cls._current
+                if time.monotonic() < expires_at:
+                    return project
+
+            if (project := cls._get_current_from_db()) is not None:
+                if project.is_stale():
+                    cls._queue_refresh()
+                cls._set_current(project)
+                return project
+
+        return cls._sync_current()
+
+    @classmethod
+    def clear_current_cache(cls) -> None:
+        cls._current = None
+
+    @classmethod
+    def _set_current(cls, project: "Project") -> None:
+        cls._current = (project, time.monotonic() + smartling_settings.PROJECT_CACHE_TIMEOUT_SECONDS)
+
+    @classmethod
+    def _get_current_from_db(cls) -> "Project | None":
+        return cls.objects.filter(
+            environment=smartling_settings.ENVIRONMENT,
+            project_id=smartling_settings.PROJECT_ID,
+        ).first()
+
     @classmethod
-    @lru_cache
-    def get_current(cls) -> "Project":
+    def _queue_refresh(cls) -> None:
+        if isinstance(background, ImmediateBackend):
+            # Don't call the API from inside a request with the dummy
+            # background worker, let the `sync_smartling` management command
+            # refresh the project on a schedule instead.
+            return
+
+        background.enqueue(refresh_current_project, args=(), kwargs={})
+
+    @classmethod
+    def _sync_current(cls) -> "Project":
         """
-        Returns the current Project as per the PROJECT_ID setting. The first
-        time this is called, the project details are fetched from the Smartling
-        API and a Project instance is created/updated as appropriate before
-        being returned. Subsequent calls returned that instance from cache.
+        Fetches the project details from the Smartling API and creates/updates
+        the Project and its target locales. If the API can't be reached, the
+        project from the database is returned instead, if there is one.
         """
         now = timezone.now()
-        project_details = client.get_project_details()
+        try:
+            project_details = client.get_project_details()
+        except Exception:
+            if (project := cls._get_current_from_db()) is None:
+                raise
+            logger.exception("Failed to sync project %s, using the last synced details", project)
+            cls._set_current(project)
+            return project
 
         try:
             project = cls.objects.get(
@@ -134,23 +302,37 @@ class Project(SyncedModel):
         project.last_synced_at = now
         project.save()
 
-        seen_target_locale_ids: set[str] = set()
-        for target_locale_data in project_details["targetLocales"]:
-            seen_target_locale_ids.add(target_locale_data["localeId"])
-            ProjectTargetLocale.objects.update_or_create(
-                project=project,
-                locale_id=target_locale_data["localeId"],
-                defaults={
-                    "description": target_locale_data["description"],
-                    "enabled": target_locale_data["enabled"],
-                },
-            )
-
-        project.target_locales.exclude(locale_id__in=seen_target_locale_ids).delete()
+        ProjectTargetLocale.objects.bulk_create(
+            [
+                ProjectTargetLocale(
+                    project=project,
+                    locale_id=target_locale_data["localeId"],
+                    description=target_locale_data["description"],
+                    enabled=target_locale_data["enabled"],
+                )
+                for target_locale_data in project_details["targetLocales"]
+            ],
+            update_conflicts=True,
+            unique_fields=["project", "locale_id"],
+            update_fields=["description", "enabled"],
+        )
+        project.target_locales.exclude(
+            locale_id__in=[target_locale_data["localeId"] for target_locale_data in project_details["targetLocales"]]
+        ).delete()
 
         logger.info("Synced project %s", project)
+        cls._set_current(project)
         return project
 
+    def is_stale(self) -> bool:
+        return self.last_synced_at is None or timezone.now() - self.last_synced_at > timedelta(
+            seconds=smartling_settings.PROJECT_CACHE_TIMEOUT_SECONDS
+        )
+
+
+def refresh_current_project() -> None:
+    Project.get_current(refresh=True)
+
 
 class ProjectTargetLocale(models.Model):
     project = models.ForeignKey(
@@ -169,6 +351,51 @@ class ProjectTargetLocale(models.Model):
         return f"{self.description}"
 
 
+# Cache key and timeout for the users who have submitted jobs, used by the
+# jobs listing's user filter. New submitters invalidate the cache, and the
+# timeout bounds how stale it can get for processes that don't share our cache
+# backend, or when users are renamed.
+JOB_USERS_CACHE_KEY = "wagtail_localize_smartling:job_users"
+JOB_USERS_CACHE_TIMEOUT = 15 * 60
+JOB_SOURCE_CONTENT_TYPES_CACHE_KEY = "wagtail_localize_smartling:job_source_content_types"
+
+
+class JobManager(models.Manager):
+    def get_users(self) -> dict[int, str]:
+        """
+        Returns a dict of user pk to username for everyone who has submitted
+        a job, ordered by username. This is cached, so the jobs listing
+        doesn't need to scan the whole jobs table on every request.
+        """
+        users = cache.get(JOB_USERS_CACHE_KEY)
+        if users is None:
+            User = get_user_model()
+            users = dict(
+                User.objects.filter(pk__in=self.order_by().values("user").distinct())
+                .order_by(User.USERNAME_FIELD)
+                .values_list("pk", User.USERNAME_FIELD)
+            )
+            cache.set(JOB_USERS_CACHE_KEY, users, JOB_USERS_CACHE_TIMEOUT)
+        return users
+
+    def get_source_content_type_ids(self) -> frozenset[int]:
+        """
+        Returns the IDs of the content types of the sources of all jobs. Like
+        get_users(), this is cached so the jobs listing's source type filter
+        doesn't need to scan the whole jobs table on every request.
+        """
+        content_type_ids = cache.get(JOB_SOURCE_CONTENT_TYPES_CACHE_KEY)
+        if content_type_ids is None:
+            content_type_ids = frozenset(
+                self.order_by()
+                .filter(source_content_type__isnull=False)
+                .values_list("source_content_type", flat=True)
+                .distinct()
+            )
+            cache.set(JOB_SOURCE_CONTENT_TYPES_CACHE_KEY, content_type_ids, JOB_USERS_CACHE_TIMEOUT)
+        return content_type_ids
+
+
 @register_translation_component(
     required=smartling_settings.REQUIRED,
     heading=_("Mark translation for Smartling processing"),
@@ -199,6 +426,17 @@ class Job(SyncedModel):
         related_name="smartling_jobs",
     )
     content_hash = models.CharField(max_length=64, blank=True)
+    # Denormalized from the TranslationSource's source instance so the jobs
+    # listing can show, sort and filter by it without resolving each source
+    source_title = models.CharField(max_length=255, blank=True, editable=False)
+    source_content_type = models.ForeignKey(
+        ContentType,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+        editable=False,
+    )
 
     # Smartling job config fields
 
@@ -210,6 +448,9 @@ class Job(SyncedModel):
     # Smartling API-derived fields
 
     translation_job_uid = models.CharField(max_length=64, editable=False)
+    # The batch the job's file is uploaded to in the initial sync, kept so that
+    # a failed upload can be retried without creating another batch
+    batch_uid = models.CharField(max_length=64, blank=True, editable=False)
     status = models.CharField(
         max_length=32,
         choices=JobStatus.choices,
@@ -220,7 +461,11 @@ class Job(SyncedModel):
     # Our fields
 
     project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name="jobs")
+    created_at = models.DateTimeField(default=timezone.now, editable=False)
     translations_imported_at = models.DateTimeField(null=True, editable=False)
+    # When the revalidate_smartling_translations command last checked the
+    # imported translations for changes made in Smartling
+    translations_revalidated_at = models.DateTimeField(null=True, editable=False)
     # NB - `file_uri`` isn't a field that the Smartling API returns. The
     # intended way to get this information is from the sourceFiles value in the
     # job details data or via the dedicated endpoint that lists file within a
@@ -236,16 +481,19 @@ class Job(SyncedModel):
     base_form_class = JobForm
     panels = [FieldPanel("due_date")]
 
+    objects = JobManager()
+
     class Meta(SyncedModel.Meta):
         default_permissions = ("view",)
         constraints = [
+            # Unsynced jobs can have a translation_job_uid if their initial
+            # sync failed after creating the job in Smartling
             models.CheckConstraint(
                 condition=(
                     models.Q(
                         status=JobStatus.UNSYNCED,
                         first_synced_at__isnull=True,
                         last_synced_at__isnull=True,
-                        translation_job_uid="",
                     )
                     | (
                         ~models.Q(status=JobStatus.UNSYNCED)
@@ -259,10 +507,58 @@ class Job(SyncedModel):
                 name="status_consistent_with_sync_dates",
             ),
         ]
+        indexes = [
+            # Supports finding existing pending jobs for the same content
+            # when submitting translations
+            models.Index(
+                fields=["translation_source", "content_hash", "status"],
+                name="wls_job_source_hash_status_idx",
+            ),
+            # Supports sorting the jobs listing by source. Filtering by source
+            # is a case-insensitive substring search, which can't use it
+            models.Index(fields=["source_title"], name="wls_job_source_title_idx"),
+        ]
 
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+        super().save(*args, **kwargs)
+
+        if adding:
+            # Only invalidate the cached users and source content types if
+            # this job adds to them
+            cached = cache.get_many([JOB_USERS_CACHE_KEY, JOB_SOURCE_CONTENT_TYPES_CACHE_KEY])
+            stale_keys = []
+            if (cached_users := cached.get(JOB_USERS_CACHE_KEY)) is not None and self.user_id not in cached_users:  # pyright: ignore[reportAttributeAccessIssue]
+                stale_keys.append(JOB_USERS_CACHE_KEY)
+            if (
+                self.source_content_type_id is not None  # pyright: ignore[reportAttributeAccessIssue]
+                and (cached_content_type_ids := cached.get(JOB_SOURCE_CONTENT_TYPES_CACHE_KEY)) is not None
+                and self.source_content_type_id not in cached_content_type_ids  # pyright: ignore[reportAttributeAccessIssue]
+            ):
+                stale_keys.append(JOB_SOURCE_CONTENT_TYPES_CACHE_KEY)
+            if stale_keys:
+                cache.delete_many(stale_keys)
+
+    def refresh_source_details(self, source_instance: models.Model | None = None) -> None:
+        """
+        Update the denormalized source_title and source_content_type fields
+        from the TranslationSource's source instance. Doesn't save the job.
+
+        If the source instance has been deleted, the last known values are
+        kept.
+        """
+        if source_instance is None:
+            try:
+                source_instance = self.translation_source.get_source_instance()
+            except ObjectDoesNotExist:
+                return
+
+        self.source_title = str(source_instance)[: self._meta.get_field("source_title").max_length]  # pyright: ignore[reportAttributeAccessIssue]
+        self.source_content_type_id = self.translation_source.specific_content_type_id  # pyright: ignore[reportAttributeAccessIssue]
+
     @staticmethod
     def get_default_name(
         translation_source: TranslationSource,
@@ -419,7 +715,7 @@ class Job(SyncedModel):
         # Create a new job for any remaining locales not covered by existing jobs
         if remaining_translations:
             new_translations = list(remaining_translations.values())
-            job = cls.objects.create(
+            job = cls(
                 project=project,
                 translation_source=translation_source,
                 user=user,
@@ -429,6 +725,8 @@ class Job(SyncedModel):
                 due_date=due_date,
                 content_hash=content_hash,
             )
+            job.refresh_source_details()
+            job.save()
             job.translations.set(new_translations)
 
             if isinstance(background, ImmediateBackend):
@@ -495,13 +793,95 @@ def _add_locales_to_existing_job(job: "Job", translations: list[Translation]) ->
                     raise
 
 
-class LandedTranslationTaskManager(models.Manager):
+# Cache key for a version number that changes whenever LandedTranslationTasks
+# are created, completed or cancelled, so that cached renders of the tasks can
+# be keyed on it rather than invalidated individually.
+LANDED_TASKS_VERSION_CACHE_KEY = "wagtail_localize_smartling:landed_translation_tasks_version"
+
+
+def get_landed_translation_tasks_version() -> int:
+    version = cache.get(LANDED_TASKS_VERSION_CACHE_KEY)
+    if version is None:
+        # Start from the current time, so a version that was in use before the
+        # key was deleted or evicted isn't reused
+        cache.add(LANDED_TASKS_VERSION_CACHE_KEY, time.time_ns(), None)
+        version = cache.get(LANDED_TASKS_VERSION_CACHE_KEY, 0)
+    return version
+
+
+def _invalidate_landed_translation_tasks_cache() -> None:
+    """
+    Change the tasks version with a single cache operation. Deleting the
+    version is enough to change it, see get_landed_translation_tasks_version().
+    """
+    cache.delete(LANDED_TASKS_VERSION_CACHE_KEY)
+
+
+class LandedTranslationTaskQuerySet(models.QuerySet):
     def incomplete(self):
         return self.filter(
             completed_on__isnull=True,
             cancelled_on__isnull=True,
         )
 
+    def complete(self) -> list[int]:
+        """
+        Mark all the incomplete tasks in this queryset as completed with a
+        single UPDATE, rather than saving each task in turn, then send the
+        landed_translation_tasks_completed signal once for the lot.
+
+        Returns the IDs of the tasks that were completed.
+        """
+        incomplete_tasks = self.incomplete()
+        task_ids = list(incomplete_tasks.values_list("pk", flat=True))
+        if not task_ids:
+            return task_ids
+
+        now = timezone.now()
+        if incomplete_tasks.filter(pk__in=task_ids).update(completed_on=now):
+            _invalidate_landed_translation_tasks_cache()
+
+        logger.info("%d LandedTranslationTask(s) completed: %s", len(task_ids), task_ids)
+        landed_translation_tasks_completed.send(
+            sender=self.model,
+            task_ids=task_ids,
+            completed_on=now,
+        )
+        return task_ids
+
+    def cancel(self) -> list[int]:
+        """
+        Mark all the incomplete tasks in this queryset as cancelled with a
+        single UPDATE.
+
+        Returns the IDs of the tasks that were cancelled.
+        """
+        incomplete_tasks = self.incomplete()
+        task_ids = list(incomplete_tasks.values_list("pk", flat=True))
+        if not task_ids:
+            return task_ids
+
+        if incomplete_tasks.filter(pk__in=task_ids).update(cancelled_on=timezone.now()):
+            _invalidate_landed_translation_tasks_cache()
+
+        logger.info("%d LandedTranslationTask(s) cancelled: %s", len(task_ids), task_ids)
+        return task_ids
+
+
+class LandedTranslationTaskManager(models.Manager.from_queryset(LandedTranslationTaskQuerySet)):
+    def has_incomplete(self) -> bool:
+        """
+        Cheap check for whether there are any incomplete tasks at all. This
+        lets hot paths, like the snippet post_save handler, skip looking up
+        tasks for a specific object in the common case where there are none.
+
+        This isn't cached, as tasks are usually created by a sync_smartling
+        process that may not share a cache with the web server. The EXISTS
+        query uses the partial index behind the
+        unique_incomplete_landed_translation_task constraint.
+        """
+        return self.incomplete().exists()
+
     def create_from_source_and_translation(
         self,
         source_object: models.Model,
@@ -542,6 +922,50 @@ class LandedTranslationTaskManager(models.Manager):
 
         return task
 
+    def create_from_source_and_translations(
+        self,
+        source_object: models.Model,
+        translations: Iterable[Translation],
+    ) -> None:
+        """
+        Batched version of create_from_source_and_translation() for when a
+        number of locales have been imported for the same source object.
+
+        The translated objects are looked up in a single query and the tasks are
+        created with a single INSERT. Locales that already have an incomplete
+        task for the translated object are skipped, courtesy of the
+        unique_incomplete_landed_translation_task constraint.
+        """
+        locale_ids = {translation.target_locale_id for translation in translations}  # pyright: ignore[reportAttributeAccessIssue]
+        if not locale_ids:
+            return
+
+        translated_objects = source_object.get_translations().filter(  # pyright: ignore[reportAttributeAccessIssue]
+            locale_id__in=locale_ids
+        )
+        c_type = ContentType.objects.get_for_model(source_object)
+
+        tasks = self.bulk_create(
+            [
+                LandedTranslationTask(
+                    content_type=c_type,
+                    object_id=object_id,
+                    relevant_locale_id=locale_id,
+                )
+                for object_id, locale_id in translated_objects.values_list("pk", "locale_id")
+            ],
+            ignore_conflicts=True,
+        )
+        if tasks:
+            _invalidate_landed_translation_tasks_cache()
+
+        logger.info(
+            "Translation-approval tasks made or found for %d translation(s) of %s#%s.",
+            len(tasks),
+            c_type.name,
+            source_object.pk,
+        )
+
 
 class LandedTranslationTask(models.Model):
     """
@@ -579,6 +1003,19 @@ class LandedTranslationTask(models.Model):
 
     objects = LandedTranslationTaskManager()
 
+    class Meta:
+        constraints = [
+            # Only one open task per translated object and locale. The index
+            # behind this also supports looking up the open tasks for a
+            # translated object, which happens every time a page is published
+            # or a snippet is saved
+            models.UniqueConstraint(
+                fields=["content_type", "object_id", "relevant_locale"],
+                condition=models.Q(completed_on__isnull=True, cancelled_on__isnull=True),
+                name="unique_incomplete_landed_translation_task",
+            ),
+        ]
+
     def __str__(self):
         return (
             "LandedTranslationTask for "
@@ -588,6 +1025,10 @@ class LandedTranslationTask(models.Model):
     def __repr__(self):
         return f"<LandedTranslationTask: {self.content_type.name}#{self.object_id}>"
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        _invalidate_landed_translation_tasks_cache()
+
     def edit_url_for_translated_item(self):
         if isinstance(self.content_object, Page):
             edit_url = reverse("wagtailadmin_pages:edit", args=[self.object_id])
@@ -614,3 +1055,39 @@ class LandedTranslationTask(models.Model):
 
     def is_cancelled(self) -> bool:
         return bool(self.cancelled_on)
+
+
+class TranslationImportedNotification(models.Model):
+    """
+    Outbox for the emails that tell translation approvers that translations
+    have been imported. Rows are written as part of the sync transaction and
+    sent afterwards by notifications.send_queued_notifications(), so a slow
+    mail server can't hold up syncing.
+    """
+
+    job = models.ForeignKey(
+        Job,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name="+",
+    )
+    # Denormalised so notifications can be rendered without extra queries,
+    # and still make sense if the job goes away
+    job_name = models.CharField(max_length=170)
+    translation_source_name = models.CharField(max_length=255)
+    target_locales = models.JSONField(default=list)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["created_at"],
+                condition=models.Q(sent_at__isnull=True),
+                name="wls_notification_unsent_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"Translations imported for {self.job_name}"
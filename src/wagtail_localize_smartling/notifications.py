@@ -0,0 +1,146 @@
+import logging
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth.models import Group
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.template.loader import render_to_string
+from django.utils import timezone
+
+from .models import TranslationImportedNotification
+from .settings import settings as smartling_settings
+
+
+logger = logging.getLogger(__name__)
+
+
+def get_approver_email_addresses() -> list[str]:
+    """
+    Returns the email addresses of all active members of the Translation
+    Approvers group, or an empty list if the group doesn't exist.
+    """
+    try:
+        # Group names are unique, so this is safe as a get()
+        ta_group = Group.objects.get(name=smartling_settings.TRANSLATION_APPROVER_GROUP_NAME)
+    except Group.DoesNotExist:
+        logger.warning(
+            f"Could not find the {smartling_settings.TRANSLATION_APPROVER_GROUP_NAME} "
+            "auth.Group to send email notifications to"
+        )
+        return []
+
+    approver_email_addresses = ta_group.user_set.filter(is_active=True).values_list(  # pyright: ignore[reportAttributeAccessIssue]
+        "email",
+        flat=True,
+    )
+    # Safety check to ensure no empty email addresses are included
+    return [email for email in approver_email_addresses if email]
+
+
+def _build_message(
+    notifications: list[TranslationImportedNotification],
+    *,
+    recipients: list[str],
+    digest: bool,
+) -> EmailMessage:
+    subject = render_to_string(
+        template_name="wagtail_localize_smartling/admin/email/notifications/translations_imported__subject.txt"
+    ).replace("\n", "")
+
+    if digest:
+        body = render_to_string(
+            template_name="wagtail_localize_smartling/admin/email/notifications/translations_imported_digest__body.txt",
+            context={"notifications": notifications},
+        )
+    else:
+        (notification,) = notifications
+        body = render_to_string(
+            template_name="wagtail_localize_smartling/admin/email/notifications/translations_imported__body.txt",
+            context={
+                "job_name": notification.job_name,
+                "translation_source_name": notification.translation_source_name,
+                "translation_target_locales": notification.target_locales,
+            },
+        )
+
+    return EmailMessage(
+        subject=subject,
+        body=body,
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=recipients,
+    )
+
+
+def send_queued_notifications() -> int:
+    """
+    Send any queued translation-imported notifications to the Translation
+    Approvers, reusing a single connection to the mail server. Returns the
+    number of emails sent.
+
+    If the EMAIL_DIGEST_WINDOW_MINUTES setting is set, nothing is sent until
+    the oldest queued notification has waited that long, then all queued
+    notifications are combined into a single email.
+
+    The notifications are claimed by marking them sent before any email is
+    sent, outside the transaction that locks them, so an error from the mail
+    server can't cause emails that were already delivered to be sent again.
+    Notifications whose email wasn't sent because of an error are queued again
+    for the next call.
+
+    This is called at the end of each sync_smartling run and, if a background
+    worker is configured, after each import that queues a notification.
+    """
+    digest_window = timedelta(minutes=smartling_settings.EMAIL_DIGEST_WINDOW_MINUTES)
+
+    with transaction.atomic():
+        notifications = list(
+            TranslationImportedNotification.objects.select_for_update(skip_locked=True)
+            .filter(sent_at__isnull=True)
+            .order_by("created_at", "pk")
+        )
+        if not notifications:
+            return 0
+
+        now = timezone.now()
+        if digest_window and notifications[0].created_at > now - digest_window:
+            logger.info("Holding %d translation-imported notification(s) for the digest", len(notifications))
+            return 0
+
+        TranslationImportedNotification.objects.filter(
+            pk__in=[notification.pk for notification in notifications]
+        ).update(sent_at=now)
+
+    recipients = get_approver_email_addresses()
+    if not recipients:
+        logger.warning(
+            "Unable to send translation-imported email notifications: "
+            f"no members of the {smartling_settings.TRANSLATION_APPROVER_GROUP_NAME} "
+            "group in the system"
+        )
+        return 0
+
+    if digest_window:
+        batches = [notifications]
+    else:
+        batches = [[notification] for notification in notifications]
+
+    sent_count = 0
+    attempted_count = 0
+    try:
+        with get_connection() as connection:
+            for batch in batches:
+                message = _build_message(batch, recipients=recipients, digest=bool(digest_window))
+                sent_count += connection.send_messages([message]) or 0
+                attempted_count += 1
+    except Exception:
+        unsent = [notification.pk for batch in batches[attempted_count:] for notification in batch]
+        TranslationImportedNotification.objects.filter(pk__in=unsent).update(sent_at=None)
+        logger.exception(
+            "Error sending translation-imported email notifications, %d will be retried",
+            len(unsent),
+        )
+
+    logger.info(f"{sent_count} translation-imported notification(s) sent to {len(recipients)} users")
+    return sent_count
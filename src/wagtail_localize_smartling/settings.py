@@ -2,7 +2,7 @@ import dataclasses
 import logging
 
 from collections.abc import Callable, Iterable
-from typing import TYPE_CHECKING, Literal, cast
+from typing import TYPE_CHECKING, Literal, NamedTuple, cast
 
 from django.conf import settings as django_settings
 from django.core.exceptions import ImproperlyConfigured
@@ -18,6 +18,36 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+class TimeoutProfile(NamedTuple):
+    """
+    Timeouts in seconds for a kind of request to the Smartling API: for
+    connecting, for each read from the connection, and optionally an overall
+    deadline for downloading the response.
+    """
+
+    connect: float
+    read: float
+    deadline: float | None = None
+
+    @property
+    def requests_timeout(self) -> tuple[float, float]:
+        return (self.connect, self.read)
+
+
+def _default_timeout_profiles(
+    api_timeout_seconds: float = 5.0,
+) -> "dict[str, TimeoutProfile]":
+    """
+    Small JSON requests use API_TIMEOUT_SECONDS for everything, while uploads
+    and downloads of files get longer to transfer them.
+    """
+    return {
+        "default": TimeoutProfile(api_timeout_seconds, api_timeout_seconds),
+        "upload": TimeoutProfile(api_timeout_seconds, 60.0),
+        "download": TimeoutProfile(api_timeout_seconds, 30.0, 5 * 60.0),
+    }
+
+
 @dataclasses.dataclass(frozen=True)
 class SmartlingSettings:
     PROJECT_ID: str
@@ -26,6 +56,13 @@ class SmartlingSettings:
     REQUIRED: bool = False
     ENVIRONMENT: Literal["production", "staging"] = "production"
     API_TIMEOUT_SECONDS: float = 5.0
+    API_TIMEOUT_PROFILES: "dict[str, TimeoutProfile]" = dataclasses.field(
+        default_factory=_default_timeout_profiles
+    )
+    API_RESPONSE_VALIDATION: Literal["serializer", "typed_dict"] = "serializer"
+    PROJECT_CACHE_TIMEOUT_SECONDS: float = 60 * 60
+    CIRCUIT_BREAKER_THRESHOLD: int = 5
+    CIRCUIT_BREAKER_COOLDOWN_SECONDS: float = 5 * 60
     LOCALE_TO_SMARTLING_LOCALE: "dict[str, str]" = dataclasses.field(
         default_factory=dict
     )
@@ -42,6 +79,8 @@ class SmartlingSettings:
     ADD_APPROVAL_TASK_TO_DASHBOARD: bool = True
     MAX_APPROVAL_TASKS_ON_DASHBOARD: int = 7
     SEND_EMAIL_ON_TRANSLATION_IMPORT: bool = True
+    EMAIL_DIGEST_WINDOW_MINUTES: int = 0
+    SUBMISSION_COALESCE_WINDOW_MINUTES: int = 0
     EXCLUDE_LOCALES: frozenset[str] = dataclasses.field(default_factory=frozenset)
 
 
@@ -98,6 +137,106 @@ def _init_settings() -> SmartlingSettings:
             )
         settings_kwargs["API_TIMEOUT_SECONDS"] = api_timeout_seconds
 
+    timeout_profiles = _default_timeout_profiles(
+        settings_kwargs.get("API_TIMEOUT_SECONDS", 5.0)
+    )
+    if "API_TIMEOUT_PROFILES" in settings_dict:
+        profiles_setting = settings_dict["API_TIMEOUT_PROFILES"]
+        if not isinstance(profiles_setting, dict):
+            raise ImproperlyConfigured(
+                f"{setting_name}['API_TIMEOUT_PROFILES'] must be a dictionary"
+            )
+        for name, values in profiles_setting.items():
+            prefix = f"{setting_name}['API_TIMEOUT_PROFILES'][{name!r}]"
+            if name not in timeout_profiles:
+                raise ImproperlyConfigured(
+                    f"{prefix} is not one of {', '.join(timeout_profiles)}"
+                )
+            if not isinstance(values, dict) or not set(values) <= {
+                "connect",
+                "read",
+                "deadline",
+            }:
+                raise ImproperlyConfigured(
+                    f"{prefix} must be a dictionary with 'connect', 'read' "
+                    f"and/or 'deadline' keys"
+                )
+            if name != "download" and "deadline" in values:
+                raise ImproperlyConfigured(
+                    f"{prefix} cannot have a 'deadline', only 'download' can"
+                )
+            profile = timeout_profiles[name]._asdict()
+            for key, value in values.items():
+                if value is None and key == "deadline":
+                    profile[key] = None
+                    continue
+                try:
+                    value = float(value)
+                except (TypeError, ValueError) as e:
+                    raise ImproperlyConfigured(
+                        f"{prefix}[{key!r}] must be a number"
+                    ) from e
+                if value <= 0:
+                    raise ImproperlyConfigured(
+                        f"{prefix}[{key!r}] must be a positive number"
+                    )
+                profile[key] = value
+            timeout_profiles[name] = TimeoutProfile(**profile)
+    settings_kwargs["API_TIMEOUT_PROFILES"] = timeout_profiles
+
+    if "API_RESPONSE_VALIDATION" in settings_dict:
+        if (response_validation := settings_dict["API_RESPONSE_VALIDATION"]) not in (
+            "serializer",
+            "typed_dict",
+        ):
+            raise ImproperlyConfigured(
+                f"{setting_name}['API_RESPONSE_VALIDATION'] must be "
+                f"'serializer' or 'typed_dict'"
+            )
+        settings_kwargs["API_RESPONSE_VALIDATION"] = response_validation
+
+    if "PROJECT_CACHE_TIMEOUT_SECONDS" in settings_dict:
+        try:
+            project_cache_timeout_seconds = float(settings_dict["PROJECT_CACHE_TIMEOUT_SECONDS"])
+        except (TypeError, ValueError) as e:
+            raise ImproperlyConfigured(
+                f"{setting_name}['PROJECT_CACHE_TIMEOUT_SECONDS'] must be a number"
+            ) from e
+
+        if project_cache_timeout_seconds <= 0:
+            raise ImproperlyConfigured(
+                f"{setting_name}['PROJECT_CACHE_TIMEOUT_SECONDS'] must be a positive number"
+            )
+        settings_kwargs["PROJECT_CACHE_TIMEOUT_SECONDS"] = project_cache_timeout_seconds
+
+    if "CIRCUIT_BREAKER_THRESHOLD" in settings_dict:
+        try:
+            circuit_breaker_threshold = int(settings_dict["CIRCUIT_BREAKER_THRESHOLD"])
+        except (TypeError, ValueError) as e:
+            raise ImproperlyConfigured(
+                f"{setting_name}['CIRCUIT_BREAKER_THRESHOLD'] must be a whole number"
+            ) from e
+
+        if circuit_breaker_threshold < 0:
+            raise ImproperlyConfigured(
+                f"{setting_name}['CIRCUIT_BREAKER_THRESHOLD'] must not be negative"
+            )
+        settings_kwargs["CIRCUIT_BREAKER_THRESHOLD"] = circuit_breaker_threshold
+
+    if "CIRCUIT_BREAKER_COOLDOWN_SECONDS" in settings_dict:
+        try:
+            circuit_breaker_cooldown_seconds = float(settings_dict["CIRCUIT_BREAKER_COOLDOWN_SECONDS"])
+        except (TypeError, ValueError) as e:
+            raise ImproperlyConfigured(
+                f"{setting_name}['CIRCUIT_BREAKER_COOLDOWN_SECONDS'] must be a number"
+            ) from e
+
+        if circuit_breaker_cooldown_seconds <= 0:
+            raise ImproperlyConfigured(
+                f"{setting_name}['CIRCUIT_BREAKER_COOLDOWN_SECONDS'] must be a positive number"
+            )
+        settings_kwargs["CIRCUIT_BREAKER_COOLDOWN_SECONDS"] = circuit_breaker_cooldown_seconds
+
     if (
         "LOCALE_MAPPING_CALLBACK" in settings_dict
         and "LOCALE_TO_SMARTLING_LOCALE" in settings_dict
@@ -192,6 +331,34 @@ def _init_settings() -> SmartlingSettings:
             "SEND_EMAIL_ON_TRANSLATION_IMPORT"
         ]
 
+    if "EMAIL_DIGEST_WINDOW_MINUTES" in settings_dict:
+        try:
+            email_digest_window_minutes = int(settings_dict["EMAIL_DIGEST_WINDOW_MINUTES"])
+        except (TypeError, ValueError) as e:
+            raise ImproperlyConfigured(
+                f"{setting_name}['EMAIL_DIGEST_WINDOW_MINUTES'] must be a whole number"
+            ) from e
+
+        if email_digest_window_minutes < 0:
+            raise ImproperlyConfigured(
+                f"{setting_name}['EMAIL_DIGEST_WINDOW_MINUTES'] must not be negative"
+            )
+        settings_kwargs["EMAIL_DIGEST_WINDOW_MINUTES"] = email_digest_window_minutes
+
+    if "SUBMISSION_COALESCE_WINDOW_MINUTES" in settings_dict:
+        try:
+            submission_coalesce_window_minutes = int(settings_dict["SUBMISSION_COALESCE_WINDOW_MINUTES"])
+        except (TypeError, ValueError) as e:
+            raise ImproperlyConfigured(
+                f"{setting_name}['SUBMISSION_COALESCE_WINDOW_MINUTES'] must be a whole number"
+            ) from e
+
+        if submission_coalesce_window_minutes < 0:
+            raise ImproperlyConfigured(
+                f"{setting_name}['SUBMISSION_COALESCE_WINDOW_MINUTES'] must not be negative"
+            )
+        settings_kwargs["SUBMISSION_COALESCE_WINDOW_MINUTES"] = submission_coalesce_window_minutes
+
     if "EXCLUDE_LOCALES" in settings_dict:
         exclude = settings_dict["EXCLUDE_LOCALES"]
         if not isinstance(exclude, (list, tuple, set, frozenset)):
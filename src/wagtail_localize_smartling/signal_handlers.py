@@ -2,22 +2,19 @@ import logging
 
 from typing import TYPE_CHECKING, Type  # noqa: UP035
 
-from django.conf import settings
-from django.contrib.auth.models import Group
+from django.apps import apps
 from django.contrib.contenttypes.models import ContentType
-from django.core.mail import send_mail
+from django.db import transaction
 from django.db.models.signals import post_save
-from django.template.loader import render_to_string
-from wagtail.models import Page
+from wagtail.models import Page, TranslatableMixin
 from wagtail.signals import page_published
 from wagtail.snippets.models import get_snippet_models
+from wagtail_localize.tasks import ImmediateBackend, background
 
-from wagtail_localize_smartling.models import LandedTranslationTask
+from wagtail_localize_smartling.models import LandedTranslationTask, TranslationImportedNotification
+from wagtail_localize_smartling.notifications import send_queued_notifications
 from wagtail_localize_smartling.settings import settings as smartling_settings
-from wagtail_localize_smartling.signals import (
-    individual_translation_imported,
-    translation_import_successful,
-)
+from wagtail_localize_smartling.signals import translation_import_successful
 
 
 if TYPE_CHECKING:
@@ -37,35 +34,37 @@ def _model_is_registered_as_snippet(model: Type["Model"]) -> bool:  # noqa: UP00
     return model in get_snippet_models()
 
 
-def create_landed_translation_task(
+def create_landed_translation_tasks(
     sender: Type["Job"],  # noqa: UP006
     instance: "Job",
-    translation: "Translation",
+    translations_imported: list["Translation"],
     **kwargs,
 ):
+    """
+    Create landed-translation tasks for all the translations imported in a sync
+    run in one go, rather than once per individual_translation_imported signal.
+    """
     if not smartling_settings.ADD_APPROVAL_TASK_TO_DASHBOARD:
         logger.debug("Creation of a landed-translation task is disabled by settings")
         return
 
-    LandedTranslationTask.objects.create_from_source_and_translation(  # pyright: ignore[reportAttributeAccessIssue]
+    LandedTranslationTask.objects.create_from_source_and_translations(  # pyright: ignore[reportAttributeAccessIssue]
         source_object=instance.translation_source.get_source_instance(),
-        translated_locale=translation.target_locale,
+        translations=translations_imported,
     )
 
 
-individual_translation_imported.connect(create_landed_translation_task, weak=False)
+translation_import_successful.connect(create_landed_translation_tasks, weak=False)
 
 
 def _close_translation_landed_task(instance):
     c_type = ContentType.objects.get_for_model(instance)
 
-    # Try to find the task
-    tasks = LandedTranslationTask.objects.filter(
+    # Complete any open tasks in one go
+    LandedTranslationTask.objects.filter(
         content_type=c_type,
         object_id=instance.pk,
-    )
-    for t in tasks:
-        t.complete()
+    ).complete()
 
 
 def close_translation_landed_task_on_page_published(
@@ -91,7 +90,8 @@ def close_translation_landed_task_on_snippet_published(
     **kwargs,
 ):
     # Both page_published and post_save send the core args, which
-    # is all we need
+    # is all we need. This is only connected to post_save for translatable
+    # models - see connect_snippet_published_handlers()
 
     # Skip during fixture loading (raw=True) — related objects may not be
     # available yet, and landed-translation tasks should not be looked up or
@@ -103,10 +103,34 @@ def close_translation_landed_task_on_snippet_published(
     if not _model_is_registered_as_snippet(sender):
         logger.debug(f"{instance} is not a Snippet, so not trying to find a landed-translation task")
         return
+
+    if not LandedTranslationTask.objects.has_incomplete():  # pyright: ignore[reportAttributeAccessIssue]
+        return
     return _close_translation_landed_task(instance)
 
 
-post_save.connect(close_translation_landed_task_on_snippet_published, weak=False)
+def connect_snippet_published_handlers() -> None:
+    """
+    Connect close_translation_landed_task_on_snippet_published to post_save for
+    each translatable model other than pages, so that saves of other models
+    don't pay for it. Called from our AppConfig.ready(). Safe to call more than
+    once.
+
+    Wagtail defers snippet registration until its snippets app is ready, and
+    snippets can also be registered from wagtail_hooks modules, so the snippet
+    models may not be known yet. Landed-translation tasks only exist for
+    translatable models though, which are all loaded by now, and the handler
+    checks whether the saved model is a snippet.
+    """
+    for model in apps.get_models():
+        if not issubclass(model, TranslatableMixin) or issubclass(model, Page):
+            continue
+        post_save.connect(
+            close_translation_landed_task_on_snippet_published,
+            sender=model,
+            weak=False,
+            dispatch_uid=f"wagtail_localize_smartling_snippet_published_{model._meta.label_lower}",
+        )
 
 
 def send_email_notification_upon_overall_translation_import(
@@ -119,63 +143,29 @@ def send_email_notification_upon_overall_translation_import(
     Signal handler for receiving news that a translation has landed from
     Smartling.
 
-    For now, sends a notification email to all Translation Approvers. TODO: make this a custom
-    notification option for all users in the Translation Approver group
+    For now, queues a notification email to all Translation Approvers. This
+    runs inside the sync transaction, so we only write to the outbox here and
+    leave sending to notifications.send_queued_notifications(). TODO: make this
+    a custom notification option for all users in the Translation Approver group
     """
     if not smartling_settings.SEND_EMAIL_ON_TRANSLATION_IMPORT:
         logger.info("Email notifications following translation import are disabled by settings")
         return
 
-    ta_group = Group.objects.filter(name=smartling_settings.TRANSLATION_APPROVER_GROUP_NAME)
-    if not ta_group.exists():
-        logger.warning(
-            f"Could not find the {smartling_settings.TRANSLATION_APPROVER_GROUP_NAME} "
-            "auth.Group to send email notifications to"
-        )
-        return
-
-    # Group names are unique, so this is safe as a get()
-    ta_group = ta_group.get()
-
-    approver_email_addresses = ta_group.user_set.filter(is_active=True).values_list(  # pyright: ignore[reportAttributeAccessIssue]
-        "email",
-        flat=True,
+    TranslationImportedNotification.objects.create(
+        job=instance,
+        job_name=instance.name,
+        translation_source_name=str(instance.translation_source.get_source_instance())[:255],
+        target_locales=[str(translation.target_locale) for translation in translations_imported],
     )
-    approver_email_addresses = [
-        email for email in approver_email_addresses if email
-    ]  # Safety check to ensure no empty email addresses are included
-
-    if not approver_email_addresses:
-        logger.warning(
-            "Unable to send translation-imported email notifications: "
-            f"no members of the {smartling_settings.TRANSLATION_APPROVER_GROUP_NAME} "
-            "group in the system"
-        )
-        return
+    logger.info("Translation-imported notification queued for job %s", instance)
 
-    email_subject = render_to_string(
-        template_name="wagtail_localize_smartling/admin/email/notifications/translations_imported__subject.txt"
-    ).replace("\n", "")
-
-    job_name = instance.name
-    translation_source_name = str(instance.translation_source.get_source_instance())
-
-    email_body = render_to_string(
-        template_name="wagtail_localize_smartling/admin/email/notifications/translations_imported__body.txt",
-        context={
-            "job_name": job_name,
-            "translation_source_name": translation_source_name,
-            "translation_target_locales": [x.target_locale for x in translations_imported],
-        },
-    )
+    if isinstance(background, ImmediateBackend):
+        # Don't send anything from inside the sync, let the `sync_smartling`
+        # management command send queued notifications at the end of its run
+        return
 
-    send_mail(
-        subject=email_subject,
-        message=email_body,
-        from_email=settings.DEFAULT_FROM_EMAIL,
-        recipient_list=approver_email_addresses,
-    )
-    logger.info(f"Translation-imported notification sent to {len(approver_email_addresses)} users")
+    transaction.on_commit(lambda: background.enqueue(send_queued_notifications, args=(), kwargs={}))
 
 
 translation_import_successful.connect(send_email_notification_upon_overall_translation_import, weak=False)
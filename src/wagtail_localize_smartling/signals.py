@@ -7,3 +7,7 @@ individual_translation_imported = Signal()
 # Sent once per translation import run if all went well
 # and at least one translation was imported
 translation_import_successful = Signal()
+
+# Sent once per bulk completion of LandedTranslationTasks (e.g. when a page with
+# open tasks is published), rather than once per task
+landed_translation_tasks_completed = Signal()
@@ -0,0 +1,34 @@
+// Fills the <datalist> of each DatalistInput with suggestions for what's been
+// typed so far, fetched from the URL in the input's data-options-url attribute.
+// Listens on the document, as Wagtail replaces the filters when they change.
+(() => {
+  const timers = new WeakMap();
+
+  const updateOptions = (input) => {
+    const url = new URL(input.dataset.optionsUrl, window.location.href);
+    url.searchParams.set("q", input.value);
+    fetch(url, { headers: { Accept: "application/json" } })
+      .then((response) => (response.ok ? response.json() : { results: [] }))
+      .then(({ results }) => {
+        if (!input.list) {
+          return;
+        }
+        input.list.replaceChildren(
+          ...results.map((value) => Object.assign(document.createElement("option"), { value })),
+        );
+      })
+      .catch(() => {});
+  };
+
+  const onInput = (event) => {
+    const input = event.target;
+    if (!(input instanceof HTMLInputElement) || !input.dataset.optionsUrl) {
+      return;
+    }
+    clearTimeout(timers.get(input));
+    timers.set(input, setTimeout(() => updateOptions(input), 200));
+  };
+
+  document.addEventListener("input", onInput);
+  document.addEventListener("focusin", onInput);
+})();
@@ -1,18 +1,25 @@
 import hashlib
 import logging
 
+from collections.abc import Callable, Iterator
+from datetime import datetime, timedelta
+from functools import partial
 from typing import TYPE_CHECKING
 
 import polib
 
+from django.core.cache import cache
 from django.db import transaction
 from django.utils import timezone
 from wagtail_localize.models import Translation
 
 from . import utils
-from .api.client import client
+from .api import types
+from .api.client import FailedResponse, client
+from .api.client import JobNotFound as SmartlingJobNotFound
 from .api.types import JobStatus
 from .constants import PENDING_STATUSES, TRANSLATED_STATUSES, UNTRANSLATED_STATUSES
+from .settings import settings as smartling_settings
 from .signals import individual_translation_imported, translation_import_successful
 
 
@@ -63,7 +70,10 @@ class FileURIMismatch(SyncJobException):
     pass
 
 
-@transaction.atomic(durable=True)
+class JobNotTranslated(SyncJobException):
+    pass
+
+
 def sync_job(job_id: int) -> None:
     """
     Sync the state of a Job instance with the corresponding job in Smartling.
@@ -71,9 +81,12 @@ def sync_job(job_id: int) -> None:
     This uses select_for_update() to lock the Job row for the duration of the
     method. These locks are only released when the _transaction_ ends, not
     savepoints. To ensure we don't accidentally create long-lasting locks on the
-    the Job rows, we pass durable=True to the atomic decorator. That means that
-    this atomic() block is definitely the outermost one and the transaction will
-    be committed or rolled back at the end of this function.
+    the Job rows, we pass durable=True to atomic(). That means that this
+    atomic() block is definitely the outermost one and the transaction will be
+    committed or rolled back at the end of this function.
+
+    If the initial sync fails part way through, the transaction is still
+    committed so that the steps that succeeded are kept, see _initial_sync().
 
     NB - this takes an ID, rather than a job instance, so that it's always
     operating on current data rather than pickled state. That means it's safe
@@ -82,18 +95,125 @@ def sync_job(job_id: int) -> None:
     """
     from .models import Job
 
+    initial_sync_error = None
+    with transaction.atomic(durable=True):
+        try:
+            job = Job.objects.select_for_update().get(pk=job_id)
+        except Job.DoesNotExist as e:
+            raise JobNotFound(f"Job with ID {job_id} not found") from e
+
+        if job.status == JobStatus.UNSYNCED:
+            job_to_sync = _coalesce_unsynced_jobs(job)
+            if job_to_sync is None:
+                return
+            job = job_to_sync
+            try:
+                _initial_sync(job)
+            except Exception as e:
+                initial_sync_error = e
+        else:
+            try:
+                _sync(job)
+            except Exception as e:
+                raise SyncJobException(f"Exception syncing job {job}") from e
+
+    if initial_sync_error is not None:
+        raise SyncJobException(f"Exception syncing job {job}") from initial_sync_error
+
+
+def _coalesce_unsynced_jobs(job: "Job") -> "Job | None":
+    """
+    If the SUBMISSION_COALESCE_WINDOW_MINUTES setting is set, merge the UNSYNCED
+    jobs for the job's TranslationSource whose initial sync hasn't started into
+    the most recently created one before it's synced, so that a page that's
+    resubmitted several times in quick succession only gets one job in
+    Smartling. Every change to the source content creates another job, but they
+    would all upload the same, current, content.
+
+    The latest job keeps its content hash, name and due date, and gets the
+    translations of all the merged jobs. The other jobs are deleted, and their
+    IDs and submitters are logged.
+
+    Returns the job to sync, or None if the latest job was created within the
+    window, in which case the initial sync is left for a later sync_smartling
+    run in case there are more resubmissions.
+    """
+    from .models import JOB_USERS_CACHE_KEY, Job
+
+    window = smartling_settings.SUBMISSION_COALESCE_WINDOW_MINUTES
+    if not window or job.translation_job_uid:
+        return job
+
+    jobs = list(
+        Job.objects.select_for_update()
+        .filter(
+            project_id=job.project_id,
+            translation_source_id=job.translation_source_id,
+            status=JobStatus.UNSYNCED,
+            translation_job_uid="",
+        )
+        .order_by("-created_at", "-pk")
+    )
+    latest_job, *superseded_jobs = jobs
+
+    if timezone.now() - latest_job.created_at < timedelta(minutes=window):
+        logger.info(
+            "Not syncing job %s yet, it was created in the last %d minute(s)",
+            latest_job,
+            window,
+        )
+        return None
+
+    if superseded_jobs:
+        latest_job.translations.add(*Translation.objects.filter(smartling_jobs__in=superseded_jobs).distinct())
+        latest_job.description = latest_job.get_description(
+            latest_job.translation_source, latest_job.translations.all()
+        )
+        latest_job.save(update_fields=["description"])
+        superseded_job_ids = [j.pk for j in superseded_jobs]
+        superseded_users = sorted({str(j.user) for j in superseded_jobs})
+        Job.objects.filter(pk__in=superseded_job_ids).delete()
+        logger.info(
+            "Merged job(s) %s for the same translation source, submitted by %s, into job %s",
+            ", ".join(map(str, superseded_job_ids)),
+            ", ".join(superseded_users),
+            latest_job,
+        )
+        if any(j.user_id != latest_job.user_id for j in superseded_jobs):  # pyright: ignore[reportAttributeAccessIssue]
+            # Their submitters may not have any other jobs
+            cache.delete(JOB_USERS_CACHE_KEY)
+
+    return latest_job
+
+
+@transaction.atomic(durable=True)
+def revalidate_job(job_id: int) -> None:
+    """
+    Re-import the locales of a translated Job whose translations have changed
+    in Smartling since they were imported, e.g. fixes made by translators after
+    the job was closed. Locales that haven't been modified in Smartling, or
+    whose content is the same as what was imported, are left alone.
+
+    Like sync_job(), this locks the Job row for the duration of the method.
+    """
+    from .models import Job
+
     try:
         job = Job.objects.select_for_update().get(pk=job_id)
     except Job.DoesNotExist as e:
         raise JobNotFound(f"Job with ID {job_id} not found") from e
 
+    if job.status not in TRANSLATED_STATUSES:
+        # e.g. the job's status changed since it was picked for revalidation
+        raise JobNotTranslated(f"Cannot revalidate job {job} with status {job.status}")
+
     try:
-        if job.status == JobStatus.UNSYNCED:
-            _initial_sync(job)
-        else:
-            _sync(job)
+        _download_and_apply_translations(job)
     except Exception as e:
-        raise SyncJobException(f"Exception syncing job {job}") from e
+        raise SyncJobException(f"Exception revalidating job {job}") from e
+
+    job.translations_revalidated_at = timezone.now()
+    job.save(update_fields=["translations_revalidated_at"])
 
 
 def _initial_sync(job: "Job") -> None:
@@ -102,24 +222,73 @@ def _initial_sync(job: "Job") -> None:
     add the PO file from the TranslationSource.
 
     Also add Visual Context for Smartling CAT, if a callback to get that is configured
+
+    Each step is saved to the job as soon as it succeeds, in its own savepoint,
+    and sync_job() commits them even if a later step fails. The job stays
+    UNSYNCED until every step has succeeded, and the next attempt resumes from
+    the step that failed, rather than creating another job in Smartling and
+    uploading the file again.
     """
-    logger.info("Performing initial sync for job %s", job)
+    job_data: types.CreateJobResponseData | None = None
 
-    # Create the job in the Smartling API
-    target_locale_ids = [
-        utils.format_smartling_locale_id(lc)
-        for lc in job.translations.values_list("target_locale__language_code", flat=True)
-    ]
+    if job.translation_job_uid:
+        logger.info("Resuming initial sync for job %s", job)
+        try:
+            job_data = client.get_job_details(job=job)
+        except SmartlingJobNotFound:
+            logger.warning("Job not found in Smartling, creating it again")
+            with transaction.atomic():
+                job.translation_job_uid = ""
+                job.batch_uid = ""
+                job.file_uri = ""
+                job.save(update_fields=["translation_job_uid", "batch_uid", "file_uri"])
+    else:
+        logger.info("Performing initial sync for job %s", job)
+
+    if job_data is None:
+        # Create the job in the Smartling API
+        target_locale_ids = [
+            utils.format_smartling_locale_id(lc)
+            for lc in job.translations.values_list("target_locale__language_code", flat=True)
+        ]
+
+        with transaction.atomic():
+            job_data = client.create_job(
+                job_name=job.name,
+                target_locale_ids=target_locale_ids,
+                description=job.description,
+                reference_number=job.reference_number,
+                due_date=job.due_date,
+            )
+            job.translation_job_uid = job_data["translationJobUid"]
+            job.save(update_fields=["translation_job_uid"])
+
+    if not job.batch_uid:
+        # Create a Job Batch so we can upload Files without race conditions
+        # in associating them with a Job (even a single PO file can go in a batch)
+        with transaction.atomic():
+            job.batch_uid = client.create_batch_for_job(job=job)
+            job.save(update_fields=["batch_uid"])
+
+    if not job.file_uri:
+        # Upload the TranslationSource's PO file to the Batch in Smartling
+        try:
+            file_uri = client.upload_files_to_job_batch(job=job, batch_uid=job.batch_uid)
+        except FailedResponse:
+            # Smartling rejected the upload, so don't reuse the batch in case
+            # the problem is with the batch
+            with transaction.atomic():
+                job.batch_uid = ""
+                job.save(update_fields=["batch_uid"])
+            raise
+
+        with transaction.atomic():
+            job.file_uri = file_uri
+            job.save(update_fields=["file_uri"])
 
-    job_data = client.create_job(
-        job_name=job.name,
-        target_locale_ids=target_locale_ids,
-        description=job.description,
-        reference_number=job.reference_number,
-        due_date=job.due_date,
-    )
+    # Add context to the job (if settings.VISUAL_CONTEXT_CALLBACK is defined)
+    client.add_html_context_to_job(job=job)
 
-    job.translation_job_uid = job_data["translationJobUid"]
     job.status = job_data["jobStatus"]
 
     now = timezone.now()
@@ -129,23 +298,6 @@ def _initial_sync(job: "Job") -> None:
     job.full_clean()
     job.save()
 
-    # Create a Job Batch so we can upload Files without race conditions
-    # in associating them with a Job (even a single PO file can go in a batch)
-    batch_uid = client.create_batch_for_job(job=job)
-
-    # Upload the TranslationSource's PO file to the Batch in Smartling
-    file_uri = client.upload_files_to_job_batch(
-        job=job,
-        batch_uid=batch_uid,
-    )
-
-    # Add the file URI to the Job
-    job.file_uri = file_uri
-    job.save(update_fields=["file_uri"])
-
-    # Add context to the job (if settings.VISUAL_CONTEXT_CALLBACK is defined)
-    client.add_html_context_to_job(job=job)
-
 
 def _sync(job: "Job") -> None:
     """
@@ -171,6 +323,12 @@ def _sync(job: "Job") -> None:
         job.reference_number = job_data["referenceNumber"] or ""
         job.due_date = job_data["dueDate"]
 
+    if updated_status != initial_status:
+        # Pick up any changes to the source's title since the job was created.
+        # This resolves the source instance, so only do it when the job moves
+        # on, e.g. when it's translated, rather than on every sync
+        job.refresh_source_details()
+
     job.status = updated_status
     job.last_synced_at = timezone.now()
     job.save()
@@ -186,6 +344,18 @@ def _sync(job: "Job") -> None:
                 translations_imported=imported,
             )
 
+    # The same condition as sync_smartling uses to pick finalised jobs to sync.
+    # Locales can fail to import after the job was marked as imported, when
+    # revalidate_job() re-imports them
+    if (
+        initial_status in TRANSLATED_STATUSES
+        and updated_status in TRANSLATED_STATUSES
+        and job.job_translations.due_for_import_retry().exists()  # pyright: ignore[reportAttributeAccessIssue]
+    ):
+        logger.info("Retrying the locales that failed to import")
+        _apply_translations(job, failed_only=True)
+        return
+
     if updated_status == initial_status:
         logger.info("No change in status, no further action required")
         return
@@ -196,15 +366,40 @@ def _sync(job: "Job") -> None:
         if updated_status in PENDING_STATUSES:
             logger.info("Job still pending, no further action required")
         elif updated_status in TRANSLATED_STATUSES:
-            _download_and_apply_translations(job)
-            job.translations_imported_at = job.last_synced_at
-            job.save(update_fields=["translations_imported_at"])
+            _apply_translations(job)
         elif updated_status in UNTRANSLATED_STATUSES:
             logger.warning("Job is finalised but not translated")
     else:
         logger.info("Job already finalised, no further action required")
 
 
+def _get_last_modified_by_locale(job: "Job") -> dict[str, datetime]:
+    """
+    Returns when Smartling last modified each locale's translation of the job's
+    file, keyed by Wagtail locale ID. If Smartling can't tell us, this returns
+    an empty dict and the translations are downloaded regardless.
+    """
+    try:
+        file_last_modified = client.get_file_last_modified(job=job)
+    except Exception:
+        logger.exception("Error getting last modified times for job %s", job)
+        return {}
+
+    return {
+        utils.format_wagtail_locale_id(item["localeId"]): item["lastModified"] for item in file_last_modified["items"]
+    }
+
+
+def _is_unchanged_since_import(job_translation: "JobTranslation", last_modified: datetime | None) -> bool:
+    return (
+        job_translation.imported_at is not None
+        and job_translation.import_failed_at is None
+        and job_translation.smartling_last_modified_at is not None
+        and last_modified is not None
+        and last_modified <= job_translation.smartling_last_modified_at
+    )
+
+
 def _check_and_import_completed_locales(job: "Job") -> list[Translation]:
     """
     Check each locale's completion status and import any that are 100% complete
@@ -230,6 +425,8 @@ def _check_and_import_completed_locales(job: "Job") -> list[Translation]:
         return imported_translations
 
     now = timezone.now()
+    # Only looked up if a locale is ready to import
+    last_modified_by_locale: dict[str, datetime] | None = None
 
     for job_translation in pending_job_translations:
         translation = job_translation.translation
@@ -247,6 +444,12 @@ def _check_and_import_completed_locales(job: "Job") -> list[Translation]:
         total_strings = file_status["totalStringCount"]
         completed_strings = file_status["completedStringCount"]
 
+        # Keep the progress so admins can see it without calling Smartling
+        job_translation.total_string_count = total_strings
+        job_translation.completed_string_count = completed_strings
+        job_translation.progress_checked_at = now
+        update_fields = ["total_string_count", "completed_string_count", "progress_checked_at"]
+
         logger.info(
             "Locale %s: %d/%d strings completed",
             smartling_locale_id,
@@ -254,21 +457,41 @@ def _check_and_import_completed_locales(job: "Job") -> list[Translation]:
             total_strings,
         )
 
-        # Only import if 100% complete
-        if total_strings > 0 and completed_strings >= total_strings:
+        # Only import if 100% complete, and not while waiting to retry a
+        # failed import
+        if total_strings > 0 and completed_strings >= total_strings and job_translation.is_import_due(now):
+            if last_modified_by_locale is None:
+                last_modified_by_locale = _get_last_modified_by_locale(job)
+
             try:
-                content_hash = _import_translation_for_locale(job, translation, smartling_locale_id)
+                # Roll back just this locale if its import fails
+                with transaction.atomic():
+                    content_hash = _import_translation_for_locale(job, translation, smartling_locale_id)
+            except Exception:
+                logger.exception("Error importing translation for locale %s", smartling_locale_id)
+                job_translation.record_import_failure(now)
+                update_fields += job_translation.import_failure_fields
+            else:
                 job_translation.imported_at = now
                 job_translation.content_hash = content_hash
-                job_translation.save(update_fields=["imported_at", "content_hash"])
+                job_translation.clear_import_failure()
+                job_translation.smartling_last_modified_at = last_modified_by_locale.get(
+                    translation.target_locale.language_code
+                )
+                update_fields += [
+                    "imported_at",
+                    "content_hash",
+                    "smartling_last_modified_at",
+                    *job_translation.import_failure_fields,
+                ]
                 imported_translations.append(translation)
                 logger.info(
                     "Imported translation for locale %s (job %s)",
                     smartling_locale_id,
                     job,
                 )
-            except Exception:
-                logger.exception("Error importing translation for locale %s", smartling_locale_id)
+
+        job_translation.save(update_fields=update_fields)
 
     return imported_translations
 
@@ -292,17 +515,39 @@ def _import_translation_for_locale(job: "Job", translation: Translation, smartli
     return content_hash
 
 
-def _download_and_apply_translations(job: "Job") -> None:
+def _apply_translations(job: "Job", *, failed_only: bool = False) -> None:
     """
-    Download the translated files from a Smartling job and apply them.
-
-    This marks all JobTranslation records as imported.
+    Download and apply a translated job's translations, and mark the job as
+    imported once every locale has been.
     """
+    if _download_and_apply_translations(job, failed_only=failed_only):
+        job.translations_imported_at = job.last_synced_at
+        job.save(update_fields=["translations_imported_at"])
 
-    logger.info("Downloading and importing translations for job %s", job)
 
-    _translations_imported = []
-    now = timezone.now()
+def _iter_translated_files(
+    job: "Job", *, locale_ids: list[str] | None = None
+) -> Iterator[tuple[str, Callable[[], bytes]]]:
+    """
+    Yields the Wagtail locale ID of each of the job's translated files, with a
+    function returning the file's content, so that reading a file is only
+    attempted for the locales that are imported, and a failure to read one
+    can be handled for that locale alone.
+
+    The whole job's files are downloaded in a single ZIP, unless locale_ids is
+    given, in which case only those locales' files are downloaded.
+    """
+    if locale_ids is not None:
+        for locale_id in locale_ids:
+            yield (
+                locale_id,
+                partial(
+                    client.download_translation_for_locale,
+                    job=job,
+                    locale_id=utils.format_smartling_locale_id(locale_id),
+                ),
+            )
+        return
 
     with client.download_translations(job=job) as translations_zip:
         for zipinfo in translations_zip.infolist():
@@ -312,30 +557,92 @@ def _download_and_apply_translations(job: "Job") -> None:
             if file_uri != job.file_uri:
                 raise FileURIMismatch(f"File URI mismatch: expected {job.file_uri}, got {file_uri}")
 
-            wagtail_locale_id = utils.format_wagtail_locale_id(smartling_locale_id)
-            try:
-                translation: Translation = job.translations.get(target_locale__language_code=wagtail_locale_id)
-            except job.translations.model.DoesNotExist:
-                logger.info("Translation not found for locale %s, skipping", wagtail_locale_id)
-                continue
+            yield utils.format_wagtail_locale_id(smartling_locale_id), partial(translations_zip.read, zipinfo)
+
+
+def _download_and_apply_translations(job: "Job", *, failed_only: bool = False) -> bool:
+    """
+    Download the translated files from a Smartling job and apply them.
+
+    Each locale is imported in its own savepoint. If a locale fails to import,
+    only that locale is rolled back. It is marked with import_failed_at to be
+    retried by a later sync, with a back-off, and the other locales' imports
+    are kept. Pass failed_only=True to only retry the failed locales that are
+    due to be retried, downloading just their files rather than the whole job.
+
+    Locales whose translations haven't been modified in Smartling since they
+    were imported are skipped, and if none have been, nothing is downloaded.
 
-            job_translation = job.job_translations.filter(  # pyright: ignore[reportAttributeAccessIssue]
-                translation=translation
-            ).first()
+    Returns whether every locale of the job has been imported, including any
+    that weren't retried.
+    """
+
+    _translations_imported = []
+    now = timezone.now()
+
+    # Look up every locale's translation up front, rather than once per file
+    all_job_translations: list[JobTranslation] = list(
+        job.job_translations.select_related(  # pyright: ignore[reportAttributeAccessIssue]
+            "translation__target_locale"
+        )
+    )
+    job_translations_by_locale: dict[str, JobTranslation] = {
+        job_translation.translation.target_locale.language_code: job_translation
+        for job_translation in all_job_translations
+        # Same as JobTranslationQuerySet.due_for_import_retry()
+        if not failed_only or (job_translation.import_retry_at is not None and job_translation.import_retry_at <= now)
+    }
+    updated_job_translations: list[JobTranslation] = []
+
+    def all_imported() -> bool:
+        return not any(job_translation.import_failed_at for job_translation in all_job_translations)
+
+    last_modified_by_locale = _get_last_modified_by_locale(job)
+    changed_locale_ids = [
+        locale_id
+        for locale_id, job_translation in job_translations_by_locale.items()
+        if not _is_unchanged_since_import(job_translation, last_modified_by_locale.get(locale_id))
+    ]
+    if not changed_locale_ids:
+        logger.info("No translations for job %s have changed since they were imported, skipping download", job)
+        return all_imported()
+
+    logger.info("Downloading and importing translations for job %s", job)
+
+    for wagtail_locale_id, read_content in _iter_translated_files(
+        job, locale_ids=changed_locale_ids if failed_only else None
+    ):
+        if (job_translation := job_translations_by_locale.get(wagtail_locale_id)) is None:
+            logger.info("Translation not found for locale %s, skipping", wagtail_locale_id)
+            continue
+
+        last_modified = last_modified_by_locale.get(wagtail_locale_id)
+        if _is_unchanged_since_import(job_translation, last_modified):
+            logger.info("Translation for locale %s unchanged since it was imported, skipping", wagtail_locale_id)
+            continue
 
-            with translations_zip.open(zipinfo) as f:
-                content = f.read().decode("utf-8")
+        translation = job_translation.translation
+
+        try:
+            # A file that can't be downloaded, read or decoded only fails this
+            # locale
+            content = read_content().decode("utf-8")
+
+            with transaction.atomic():
                 content_hash = _compute_translation_hash(content)
 
                 # Skip if already imported with the same content hash
-                if job_translation and job_translation.imported_at and job_translation.content_hash == content_hash:
+                if job_translation.imported_at and job_translation.content_hash == content_hash:
                     logger.info(
                         "Translation for locale %s already imported with same content, skipping",
                         wagtail_locale_id,
                     )
+                    job_translation.clear_import_failure()
+                    job_translation.smartling_last_modified_at = last_modified
+                    updated_job_translations.append(job_translation)
                     continue
 
-                if job_translation and job_translation.imported_at:
+                if job_translation.imported_at:
                     logger.info(
                         "Translation for locale %s changed since per-locale import, re-importing",
                         wagtail_locale_id,
@@ -343,19 +650,42 @@ def _download_and_apply_translations(job: "Job") -> None:
 
                 po_file = polib.pofile(_sanitize_po_content(content))
                 translation.import_po(po_file)
-                individual_translation_imported.send(
-                    sender=job.__class__,
-                    instance=job,
-                    translation=translation,
-                )
-                logger.info("Imported translations for %s", translation)
-                _translations_imported.append(translation)
+        except Exception:
+            logger.exception(
+                "Error importing translation for locale %s, it will be retried on the next sync",
+                wagtail_locale_id,
+            )
+            job_translation.record_import_failure(now)
+            updated_job_translations.append(job_translation)
+            continue
 
-                # Mark as imported with content hash
-                if job_translation:
-                    job_translation.imported_at = now
-                    job_translation.content_hash = content_hash
-                    job_translation.save(update_fields=["imported_at", "content_hash"])
+        individual_translation_imported.send(
+            sender=job.__class__,
+            instance=job,
+            translation=translation,
+        )
+        logger.info("Imported translations for %s", translation)
+        _translations_imported.append(translation)
+
+        # Mark as imported with content hash
+        job_translation.imported_at = now
+        job_translation.content_hash = content_hash
+        job_translation.clear_import_failure()
+        job_translation.smartling_last_modified_at = last_modified
+        updated_job_translations.append(job_translation)
+
+    if updated_job_translations:
+        job.job_translations.bulk_update(  # pyright: ignore[reportAttributeAccessIssue]
+            updated_job_translations,
+            [
+                "imported_at",
+                "content_hash",
+                "smartling_last_modified_at",
+                "import_failed_at",
+                "import_failure_count",
+                "import_retry_at",
+            ],
+        )
 
     if _translations_imported:
         translation_import_successful.send(
@@ -363,3 +693,5 @@ def _download_and_apply_translations(job: "Job") -> None:
             instance=job,
             translations_imported=_translations_imported,
         )
+
+    return all_imported()
@@ -14,7 +14,6 @@ from wagtail_localize_smartling.utils import format_smartling_job_url
 register = template.Library()
 
 
-# TODO test
 @register.inclusion_tag(
     "wagtail_localize_smartling/admin/edit_translation_message.html",
     takes_context=True,
@@ -25,18 +24,22 @@ def smartling_edit_translation_message(context):
     }
 
     translation = context["translation"]
-    jobs = translation.smartling_jobs.all()
 
-    jobs_exists = bool(jobs)
-    inclusion_context["show_message"] = jobs_exists
+    # Jobs are ordered by `first_synced_at`, with null values coming at the top
+    # then pk descending. So we choose the first in the list. This may mean the job
+    # status will show as unsynced in the message below.
+    # Only fetch that job, and only the fields needed for the message and the
+    # link to Smartling.
+    latest_job = (
+        translation.smartling_jobs.select_related("project")
+        .only("status", "translation_job_uid", "project__project_id")
+        .first()
+    )
 
-    if not jobs_exists:
+    inclusion_context["show_message"] = latest_job is not None
+    if latest_job is None:
         return inclusion_context
 
-    # Jobs are ordered by `first_synced_at`, with null values coming at the top
-    # then pk descending. So we choose the first in the list. This may mean the job
-    # status will show as unsynced in the message below
-    latest_job = list(jobs)[0]
     buttons = []
 
     if latest_job.status in UNTRANSLATED_STATUSES:
@@ -1,8 +1,12 @@
 import hashlib
 
+from collections import defaultdict
+from collections.abc import Iterable
 from typing import TYPE_CHECKING
 from urllib.parse import quote, urljoin, urlparse
 
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.urls import reverse
 from wagtail.coreutils import (
     get_content_languages,
@@ -16,7 +20,12 @@ from .settings import settings as smartling_settings
 
 
 if TYPE_CHECKING:
+    from uuid import UUID
+
+    from django.contrib.auth.models import AbstractBaseUser
+    from django.db.models import Model
     from polib import POFile
+    from wagtail_localize.models import Translation, TranslationSource
 
     from .models import Job, Project
 
@@ -170,3 +179,95 @@ def get_snippet_admin_url(snippet):
     admin_root_path = reverse("wagtailadmin_home")
 
     return f"{admin_root_path}snippets/{app_label}/{model_name}/edit/{snippet.pk}/"
+
+
+# How long to remember whether a user is in the translation approver group,
+# which is checked on every load of the dashboard
+APPROVER_CHECK_CACHE_TIMEOUT = 60
+
+
+def user_is_translation_approver(user: "AbstractBaseUser") -> bool:
+    """
+    Returns whether the given user is a member of the translation approver
+    group. The result is cached per user for APPROVER_CHECK_CACHE_TIMEOUT
+    seconds, so group membership changes can take that long to be noticed.
+    """
+    if not user.is_authenticated:
+        return False
+
+    group_name = smartling_settings.TRANSLATION_APPROVER_GROUP_NAME
+    group_hash = hashlib.md5(group_name.encode(), usedforsecurity=False).hexdigest()
+    cache_key = f"wagtail_localize_smartling:is_translation_approver:{user.pk}:{group_hash}"
+    is_approver = cache.get(cache_key)
+    if is_approver is None:
+        is_approver = user.groups.filter(name=group_name).exists()  # pyright: ignore[reportAttributeAccessIssue]
+        cache.set(cache_key, is_approver, APPROVER_CHECK_CACHE_TIMEOUT)
+    return is_approver
+
+
+def _get_translatable_instances(
+    lookups: Iterable[tuple[int, int, "UUID", int]],
+) -> dict[int, "Model | None"]:
+    """
+    Takes (key, specific content type ID, translation key, locale ID) tuples
+    and returns a dict mapping each key to the matching instance, or None if
+    there isn't one. Uses one query per content type.
+    """
+    lookups_by_content_type: dict[int, list[tuple[int, UUID, int]]] = defaultdict(list)
+    for key, content_type_id, translation_key, locale_id in lookups:
+        lookups_by_content_type[content_type_id].append((key, translation_key, locale_id))
+
+    results: dict[int, Model | None] = {}
+    for content_type_id, content_type_lookups in lookups_by_content_type.items():
+        model = ContentType.objects.get_for_id(content_type_id).model_class()
+        instances = {}
+        if model is not None:
+            instances = {
+                (instance.translation_key, instance.locale_id): instance  # pyright: ignore[reportAttributeAccessIssue]
+                for instance in model._base_manager.filter(
+                    translation_key__in={translation_key for _, translation_key, _ in content_type_lookups},
+                    locale_id__in={locale_id for _, _, locale_id in content_type_lookups},
+                )
+            }
+        for key, translation_key, locale_id in content_type_lookups:
+            results[key] = instances.get((translation_key, locale_id))
+
+    return results
+
+
+def get_source_instances(
+    translation_sources: Iterable["TranslationSource"],
+) -> dict[int, "Model | None"]:
+    """
+    Bulk equivalent of TranslationSource.get_source_instance(). Returns a dict
+    mapping each TranslationSource pk to its source instance, or None if the
+    source instance has been deleted.
+
+    Uses one query per specific content type rather than one per source.
+    """
+    return _get_translatable_instances(
+        (source.pk, source.specific_content_type_id, source.object_id, source.locale_id)  # pyright: ignore[reportAttributeAccessIssue]
+        for source in translation_sources
+    )
+
+
+def get_target_instances(
+    translations: Iterable["Translation"],
+) -> dict[int, "Model | None"]:
+    """
+    Bulk equivalent of Translation.get_target_instance(). Returns a dict
+    mapping each Translation pk to its translated instance, or None if that
+    doesn't exist (yet).
+
+    Uses one query per specific content type rather than one per translation,
+    so select_related("source") on the translations to avoid a query each.
+    """
+    return _get_translatable_instances(
+        (
+            translation.pk,
+            translation.source.specific_content_type_id,  # pyright: ignore[reportAttributeAccessIssue]
+            translation.source.object_id,  # pyright: ignore[reportAttributeAccessIssue]
+            translation.target_locale_id,  # pyright: ignore[reportAttributeAccessIssue]
+        )
+        for translation in translations
+    )
@@ -1,15 +1,22 @@
 import logging
 
+from itertools import islice
 from typing import Any
 
-from django.shortcuts import get_object_or_404, redirect, render
+import django_filters
+
+from django.contrib import messages
+from django.contrib.contenttypes.models import ContentType
+from django.http import HttpResponseBadRequest, JsonResponse, StreamingHttpResponse
+from django.shortcuts import get_object_or_404, redirect
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.html import format_html
 from django.utils.translation import gettext_lazy as _
-from django.views.generic import TemplateView
-from laces.components import MediaContainer
+from django.utils.translation import ngettext
+from django.views.generic import TemplateView, View
 from wagtail.admin.auth import permission_denied
+from wagtail.admin.filters import WagtailFilterSet
 from wagtail.admin.utils import get_valid_next_url_from_request
 from wagtail.admin.views.generic import (
     PermissionCheckedMixin,
@@ -18,15 +25,17 @@ from wagtail.admin.views.generic import (
 from wagtail.models import Locale
 from wagtail.permission_policies import ModelPermissionPolicy
 
-from .components import LandedTranslationsPanel
 from .constants import UNTRANSLATED_STATUSES
-from .models import Job, Project
+from .exports import EXPORT_CONTENT_TYPES, EXPORT_FORMATS, stream_job_export
+from .models import Job, LandedTranslationTask, Project
 from .templatetags.wagtail_localize_smartling_admin_tags import smartling_job_url
 from .utils import (
     format_smartling_project_url,
     get_wagtail_source_locale,
     suggest_source_locale,
+    user_is_translation_approver,
 )
+from .viewsets import JobReportFilterSet
 
 
 logger = logging.getLogger(__name__)
@@ -168,17 +177,172 @@ class SmartlingResubmitJobView(  # pyright: ignore[reportIncompatibleMethodOverr
         return context
 
 
-def landed_translations_list(request):
-    components = MediaContainer(
-        [
-            LandedTranslationsPanel(),
-        ]
-    )
+class SmartlingJobExportView(PermissionCheckedMixin, View):
+    """
+    Streams all Smartling jobs, optionally filtered with the same filters as
+    the jobs listing, as CSV or JSON Lines, depending on the export_format
+    query parameter.
+    """
+
+    permission_policy = ModelPermissionPolicy(Job)
+    permission_required = "view"
+
+    def get(self, request, *args, **kwargs):
+        export_format = request.GET.get("export_format", "csv")
+        if export_format not in EXPORT_FORMATS:
+            return HttpResponseBadRequest(f"Unsupported export format: {export_format}")
+
+        filterset = JobReportFilterSet(request.GET, queryset=Job.objects.all(), request=request)
+        if not filterset.is_valid():
+            return HttpResponseBadRequest(filterset.errors.as_text())
+
+        filename = f"smartling-jobs-{timezone.now():%Y%m%d-%H%M%S}.{export_format}"
+        return StreamingHttpResponse(
+            stream_job_export(export_format, filterset.qs),
+            content_type=EXPORT_CONTENT_TYPES[export_format],
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        )
+
+
+class SmartlingJobUsersView(PermissionCheckedMixin, View):
+    """
+    Suggests the usernames of job submitters that start with the q query
+    parameter, for the jobs listing's user filter. Returns at most
+    `max_results` of them, so neither this response nor the listing grows with
+    the number of submitters.
+    """
+
+    permission_policy = ModelPermissionPolicy(Job)
+    permission_required = "view"
+    max_results = 20
 
-    return render(
-        request,
-        "wagtail_localize_smartling/admin/landed_translation_tasks.html",
-        {
-            "components": components,
-        },
+    def get(self, request, *args, **kwargs):
+        prefix = request.GET.get("q", "").strip().casefold()
+        usernames = (
+            username
+            for username in Job.objects.get_users().values()  # pyright: ignore[reportAttributeAccessIssue]
+            if username.casefold().startswith(prefix)
+        )
+        return JsonResponse({"results": list(islice(usernames, self.max_results))})
+
+
+class LandedTranslationTaskFilterSet(WagtailFilterSet):
+    relevant_locale = django_filters.ModelChoiceFilter(
+        label=_("Locale"),
+        queryset=Locale.objects.all(),
     )
+    content_type = django_filters.ModelChoiceFilter(
+        label=_("Type"),
+        queryset=lambda request: ContentType.objects.filter(
+            pk__in=LandedTranslationTask.objects.incomplete().values("content_type")  # pyright: ignore[reportAttributeAccessIssue]
+        ).order_by("app_label", "model"),
+    )
+
+    class Meta:
+        model = LandedTranslationTask
+        fields = ["relevant_locale", "content_type"]
+
+
+class LandedTranslationTasksView(  # pyright: ignore[reportIncompatibleMethodOverride]
+    WagtailAdminTemplateMixin, TemplateView
+):
+    """
+    Lists the incomplete landed translation tasks, with filters by locale and
+    type, and lets translation approvers complete or cancel them in bulk.
+
+    Tasks are paginated by keyset (the "after" and "before" task IDs) rather
+    than by page number, so later pages are as cheap as the first one however
+    many tasks are open. Each page takes one query for the tasks and one per
+    type of translated item.
+    """
+
+    _show_breadcrumbs = True
+    page_title = _("Translations to publish")
+    template_name = "wagtail_localize_smartling/admin/landed_translation_tasks.html"
+    header_icon = "wagtail-localize-language"
+    page_size = 50
+    actions = {
+        "complete": _("Mark as published"),
+        "cancel": _("Cancel"),
+    }
+
+    def get_breadcrumbs_items(self):  # pyright: ignore[reportIncompatibleMethodOverride]
+        return super().get_breadcrumbs_items() + [{"url": "", "label": self.page_title}]
+
+    def user_can_action_tasks(self, user) -> bool:
+        return user.is_superuser or user_is_translation_approver(user)
+
+    def get_queryset(self):
+        return (
+            LandedTranslationTask.objects.incomplete()  # pyright: ignore[reportAttributeAccessIssue]
+            .select_related("content_type", "relevant_locale")
+            .prefetch_related("content_object")
+        )
+
+    def _get_pk_param(self, name: str) -> int | None:
+        try:
+            return int(self.request.GET[name])
+        except (KeyError, ValueError):
+            return None
+
+    def paginate_queryset(self, queryset) -> tuple[list[LandedTranslationTask], bool, bool]:
+        """
+        Returns the tasks on the requested page, and whether there are
+        previous and next pages.
+        """
+        if (before := self._get_pk_param("before")) is not None:
+            tasks = list(queryset.filter(pk__lt=before).order_by("-pk")[: self.page_size + 1])
+            has_previous = len(tasks) > self.page_size
+            return tasks[: self.page_size][::-1], has_previous, True
+
+        if (after := self._get_pk_param("after")) is not None:
+            queryset = queryset.filter(pk__gt=after)
+        tasks = list(queryset.order_by("pk")[: self.page_size + 1])
+        has_next = len(tasks) > self.page_size
+        return tasks[: self.page_size], after is not None, has_next
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        filterset = LandedTranslationTaskFilterSet(
+            self.request.GET,
+            queryset=self.get_queryset(),
+            request=self.request,
+        )
+        tasks, has_previous, has_next = self.paginate_queryset(filterset.qs)
+        context.update(
+            {
+                "filters": filterset,
+                "tasks": tasks,
+                "previous_pk": tasks[0].pk if tasks and has_previous else None,
+                "next_pk": tasks[-1].pk if tasks and has_next else None,
+                "can_action_tasks": self.user_can_action_tasks(self.request.user),
+                "actions": self.actions,
+            }
+        )
+        return context
+
+    def post(self, request, *args, **kwargs):
+        if not self.user_can_action_tasks(request.user):
+            return permission_denied(request)
+
+        action = request.POST.get("action")
+        if action not in self.actions:
+            return HttpResponseBadRequest(f"Unsupported action: {action}")
+
+        task_ids = [task_id for task_id in request.POST.getlist("task_ids") if task_id.isdigit()]
+        tasks = LandedTranslationTask.objects.filter(pk__in=task_ids)
+        if action == "complete":
+            actioned = tasks.complete()  # pyright: ignore[reportAttributeAccessIssue]
+            message = ngettext(
+                "%(count)d task marked as published.",
+                "%(count)d tasks marked as published.",
+                len(actioned),
+            )
+        else:
+            actioned = tasks.cancel()  # pyright: ignore[reportAttributeAccessIssue]
+            message = ngettext("%(count)d task cancelled.", "%(count)d tasks cancelled.", len(actioned))
+        messages.success(request, message % {"count": len(actioned)})
+
+        return redirect(
+            get_valid_next_url_from_request(request) or reverse("wagtail_localize_smartling:landed-translations")
+        )
@@ -1,7 +1,13 @@
 import django_filters
 
+from django import forms
+from django.contrib.admin.utils import unquote
 from django.contrib.auth import get_user_model
-from django.urls import reverse
+from django.contrib.contenttypes.models import ContentType
+from django.shortcuts import get_object_or_404
+from django.urls import reverse, reverse_lazy
+from django.utils import timezone
+from django.utils.formats import date_format
 from django.utils.functional import cached_property
 from django.utils.html import format_html, format_html_join
 from django.utils.translation import gettext_lazy as _
@@ -9,32 +15,74 @@ from wagtail.admin.filters import WagtailFilterSet
 from wagtail.admin.ui.tables import Column, DateColumn, TitleColumn, UserColumn
 from wagtail.admin.views import generic
 from wagtail.admin.viewsets.model import ModelViewSet
+from wagtail.admin.widgets.button import Button
 from wagtail.permission_policies import ModelPermissionPolicy
+from wagtail_localize.models import get_edit_url
 
 from .api.types import JobStatus
 from .models import Job
 from .templatetags.wagtail_localize_smartling_admin_tags import smartling_job_url
+from .utils import get_source_instances, get_target_instances
 
 
-def get_users_for_filter(user):
-    User = get_user_model()
-    return User.objects.filter(
-        pk__in=Job.objects.values_list("user", flat=True)
-    ).order_by(User.USERNAME_FIELD)  # pyright: ignore[reportAttributeAccessIssue]
+class DatalistInput(forms.TextInput):
+    """
+    A text input that offers suggestions, via a <datalist>, so browsers can
+    autocomplete them. Rather than rendering every option into the page, the
+    suggestions for what's been typed so far are fetched from options_url,
+    which should return JSON like {"results": ["option", ...]}.
+    """
+
+    template_name = "wagtail_localize_smartling/admin/widgets/datalist_input.html"
+
+    def __init__(self, options_url: str, attrs=None):
+        super().__init__(attrs)
+        self.options_url = options_url
+
+    class Media:
+        js = ["wagtail_localize_smartling/js/datalist-input.js"]
+
+    def get_context(self, name, value, attrs):
+        context = super().get_context(name, value, attrs)
+        context["widget"]["attrs"]["list"] = f"{context['widget']['attrs'].get('id', name)}-options"
+        context["widget"]["attrs"]["data-options-url"] = str(self.options_url)
+        return context
+
+
+def get_source_content_types_for_filter(user):
+    return ContentType.objects.filter(
+        pk__in=Job.objects.get_source_content_type_ids()  # pyright: ignore[reportAttributeAccessIssue]
+    ).order_by("app_label", "model")
 
 
 class JobReportFilterSet(WagtailFilterSet):
+    source_title = django_filters.CharFilter(
+        label=_("Source"),
+        lookup_expr="icontains",
+    )
+    source_content_type = django_filters.ModelChoiceFilter(
+        label=_("Source type"),
+        field_name="source_content_type",
+        queryset=lambda request: get_source_content_types_for_filter(request.user),
+    )
     status = django_filters.ChoiceFilter(choices=JobStatus.choices)
-    user = django_filters.ModelChoiceFilter(
+    user = django_filters.CharFilter(
         label=_("User"),
-        field_name="user",
-        queryset=lambda request: get_users_for_filter(request.user),
+        method="filter_user",
+        widget=DatalistInput(
+            options_url=reverse_lazy("wagtail_localize_smartling:jobs-users"),
+            attrs={"autocomplete": "off"},
+        ),
     )
 
     class Meta:
         model = Job
         fields = ["status"]
 
+    def filter_user(self, queryset, name, value):
+        User = get_user_model()
+        return queryset.filter(**{f"user__{User.USERNAME_FIELD}__iexact": value})
+
 
 class JobPermissionPolicy(ModelPermissionPolicy):
     def user_has_permission(self, user, action):
@@ -46,6 +94,12 @@ class JobPermissionPolicy(ModelPermissionPolicy):
 
 class SourceInstanceColumn(TitleColumn):
     def get_value(self, instance):
+        if instance.source_title:
+            return instance.source_title
+        # Jobs created before source_title was added have it blank, in which
+        # case JobIndexView resolves their source instances up front
+        if hasattr(instance, "source_instance"):
+            return instance.source_instance
         return instance.translation_source.get_source_instance()
 
     def get_link_attrs(self, instance, parent_context):
@@ -53,7 +107,7 @@ class SourceInstanceColumn(TitleColumn):
 
 
 class TargetLocalesColumn(Column):
-    """Outputs a list of job target locales"""
+    """Outputs a list of job target locales, with their translation progress"""
 
     cell_template_name = (
         "wagtail_localize_smartling/admin/tables/target_locales_cell.html"
@@ -72,16 +126,39 @@ class JobIndexView(generic.IndexView):
             {"url": "", "label": self.page_title},
         ]
 
+    @cached_property
+    def header_more_buttons(self):
+        buttons = super().header_more_buttons
+        # Keep the current filters, but not the listing-specific parameters
+        params = self.request.GET.copy()
+        for param in ("p", "ordering", "export"):
+            params.pop(param, None)
+        export_url = reverse("wagtail_localize_smartling:jobs-export")
+        for label, export_format in [
+            (_("Download CSV"), "csv"),
+            (_("Download JSON Lines"), "jsonl"),
+        ]:
+            params["export_format"] = export_format
+            buttons.append(
+                Button(
+                    label,
+                    url=f"{export_url}?{params.urlencode()}",
+                    icon_name="download",
+                )
+            )
+        return buttons
+
     @cached_property
     def columns(self):
         columns = [
             SourceInstanceColumn(
                 "source_instance",
                 label=_("Source"),
+                sort_key="source_title",
                 get_url=self.get_inspect_url,
             ),
             TargetLocalesColumn(
-                "translations",
+                "job_translations",
                 label=_("Target locales"),
             ),
             DateColumn(
@@ -106,12 +183,41 @@ class JobIndexView(generic.IndexView):
 
     def get_queryset(self):
         queryset = super().get_queryset()
-        return queryset.select_related("translation_source").prefetch_related(
-            "translations__target_locale"
+        return queryset.select_related(
+            "translation_source", "user__wagtail_userprofile"
+        ).prefetch_related("job_translations__translation__target_locale")
+
+    def paginate_queryset(self, queryset, page_size):
+        paginator, page, object_list, is_paginated = super().paginate_queryset(
+            queryset, page_size
+        )
+
+        # Resolve the source instances for any jobs on the current page that
+        # are missing a source_title, with one query per content type rather
+        # than one query per row
+        jobs = list(object_list)
+        jobs_without_title = [job for job in jobs if not job.source_title]
+        source_instances = get_source_instances(
+            job.translation_source for job in jobs_without_title
         )
+        for job in jobs_without_title:
+            job.source_instance = source_instances[job.translation_source_id]
+        page.object_list = jobs
+
+        return paginator, page, jobs, is_paginated
 
 
 class JobInspectView(generic.InspectView):
+    def get_object(self, queryset=None):
+        return get_object_or_404(
+            Job.objects.select_related("translation_source", "user"),
+            pk=unquote(str(self.pk)),
+        )
+
+    @cached_property
+    def source_instance(self):
+        return self.object.translation_source.get_source_instance()
+
     def get_fields(self):
         return [
             "translation_source",
@@ -166,25 +272,53 @@ class JobInspectView(generic.InspectView):
     def get_translation_source_display_value(self):
         return format_html(
             '<a href="{}">{}</a>',
-            self.object.translation_source.get_source_instance_edit_url(),
-            self.object.translation_source.get_source_instance(),
+            get_edit_url(self.source_instance),
+            self.source_instance,
         )
 
     def get_translations_display_value(self):
-        content_html = format_html_join(
-            "\n",
-            '<li><a href="{}">{}</a> - {}</li>',
-            (
-                (
-                    translation.get_target_instance_edit_url(),
-                    str(translation.get_target_instance()),
-                    translation.target_locale.get_display_name(),
-                )
-                for translation in self.object.translations.all()
-            ),
+        job_translations = list(
+            self.object.job_translations.select_related(  # pyright: ignore[reportAttributeAccessIssue]
+                "translation__source", "translation__target_locale"
+            )
+        )
+        # Fetch all the target instances up front, rather than one per locale
+        target_instances = get_target_instances(
+            job_translation.translation for job_translation in job_translations
         )
 
-        return format_html("<ul>{}</ul>", content_html)
+        items = []
+        for job_translation in job_translations:
+            translation = job_translation.translation
+            locale_name = translation.target_locale.get_display_name()
+            if progress := job_translation.get_progress_display():
+                if job_translation.imported_at is None and job_translation.progress_checked_at is not None:
+                    progress = _("%(progress)s, as of %(checked_at)s") % {
+                        "progress": progress,
+                        "checked_at": date_format(
+                            timezone.localtime(job_translation.progress_checked_at),
+                            "SHORT_DATETIME_FORMAT",
+                        ),
+                    }
+                locale_name = format_html("{} ({})", locale_name, progress)
+
+            target_instance = target_instances[translation.pk]
+            if target_instance is None:
+                # Not translated yet, so there's nothing to link to
+                items.append(format_html("<li>{}</li>", locale_name))
+            else:
+                items.append(
+                    format_html(
+                        '<li><a href="{}">{}</a> - {}</li>',
+                        get_edit_url(target_instance),
+                        str(target_instance),
+                        locale_name,
+                    )
+                )
+
+        return format_html(
+            "<ul>{}</ul>", format_html_join("\n", "{}", ((item,) for item in items))
+        )
 
 
 class JobViewSet(ModelViewSet):
@@ -6,6 +6,7 @@ from wagtail.admin.menu import MenuItem
 from . import admin_urls
 from .components import LandedTranslationsPanel
 from .settings import settings as smartling_settings
+from .utils import user_is_translation_approver
 from .views import SmartlingResubmitJobView
 from .viewsets import smartling_job_viewset
 
@@ -38,8 +39,7 @@ def register_viewset():
 
 @hooks.register("construct_homepage_panels")  # pyright: ignore[reportOptionalCall]
 def add_landed_translations_panel(request, panels):
-    _group_name = smartling_settings.TRANSLATION_APPROVER_GROUP_NAME
-    if _group_name in request.user.groups.all().values_list("name", flat=True):
+    if user_is_translation_approver(request.user):
         panels.append(
             LandedTranslationsPanel(
                 max_to_show=smartling_settings.MAX_APPROVAL_TASKS_ON_DASHBOARD
@@ -30,6 +30,24 @@ if TYPE_CHECKING:
     from wagtail_localize_smartling.models import Job
 
 
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-benchmarks",
+        action="store_true",
+        default=False,
+        help="Run the tests marked as benchmarks, which depend on timing",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-benchmarks"):
+        return
+    skip_benchmark = pytest.mark.skip(reason="Benchmarks only run with --run-benchmarks")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
+
+
 @pytest.fixture(autouse=True)
 def temporary_media_dir(settings, tmp_path: Path):
     settings.MEDIA_ROOT = tmp_path / "media"
@@ -141,7 +159,7 @@ def smartling_project(responses, settings, smartling_auth):
     )
 
     # Reset Project.get_current() cache so the response always gets consumed
-    Project.get_current.cache_clear()
+    Project.clear_current_cache()
     return Project.get_current()
 
 
@@ -434,6 +452,35 @@ def smartling_get_file_status(responses, settings, smartling_auth):
     return add_file_status_response
 
 
+@pytest.fixture()
+def smartling_get_file_last_modified(responses, settings, smartling_auth):
+    """Mock API response for getting when each locale's translation was last modified."""
+    project_id = settings.WAGTAIL_LOCALIZE_SMARTLING["PROJECT_ID"]
+
+    def add_file_last_modified_response(last_modified_by_locale: dict[str, str]):
+        responses.add(
+            method="GET",
+            url=f"https://api.smartling.com/files-api/v2/projects/{quote(project_id)}/file/last-modified",
+            body=json.dumps(
+                {
+                    "response": {
+                        "code": "SUCCESS",
+                        "data": {
+                            "totalCount": len(last_modified_by_locale),
+                            "items": [
+                                {"localeId": locale_id, "lastModified": last_modified}
+                                for locale_id, last_modified in last_modified_by_locale.items()
+                            ],
+                        },
+                    },
+                }
+            ),
+            match_querystring=False,
+        )
+
+    return add_file_last_modified_response
+
+
 @pytest.fixture()
 def smartling_download_translation_for_locale(responses, settings, smartling_auth):
     """Mock API response for downloading translation for a single locale."""
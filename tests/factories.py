@@ -3,13 +3,25 @@ from typing import Any
 import factory
 import factory.django
 
-from wagtail.models import Locale
+from wagtail.models import Locale, TranslatableMixin
 from wagtail_localize.models import Translation
 
 from wagtail_localize_smartling import models as wls_models
 from wagtail_localize_smartling.settings import settings as smartling_settings
 
-from testapp.factories import TranslationSourceFactory, UserFactory
+from testapp.factories import InfoPageFactory, InfoSnippetFactory, TranslationSourceFactory, UserFactory
+
+
+def create_pages_and_snippets(root_page, numbers: range) -> list[TranslatableMixin]:
+    """
+    Creates a page titled "Page {i}" under root_page and a snippet with the
+    content "Snippet {i}" for each of the numbers, in that order.
+    """
+    instances = []
+    for i in numbers:
+        instances.append(InfoPageFactory(parent=root_page, title=f"Page {i}"))
+        instances.append(InfoSnippetFactory(content=f"Snippet {i}"))
+    return instances
 
 
 class JobFactory(factory.django.DjangoModelFactory):
@@ -54,6 +66,40 @@ class JobFactory(factory.django.DjangoModelFactory):
                 target_locale=target_locale,
             )
 
+    @classmethod
+    def create_for_pages_and_snippets(cls, root_page, numbers: range, **kwargs) -> list[wls_models.Job]:
+        """
+        Creates a job for each of the pages and snippets created by
+        create_pages_and_snippets().
+        """
+        return [cls(source_instance=instance, **kwargs) for instance in create_pages_and_snippets(root_page, numbers)]
+
+
+class LandedTranslationTaskFactory(factory.django.DjangoModelFactory):
+    """
+    Creates an incomplete task for the translated object passed as
+    content_object, in the locale with the language_code (French by default).
+    """
+
+    class Meta:  # pyright: ignore[reportIncompatibleVariableOverride]
+        model = wls_models.LandedTranslationTask
+
+    class Params:
+        language_code = "fr"
+
+    content_object = factory.SubFactory(InfoSnippetFactory)
+    relevant_locale = factory.LazyAttribute(lambda o: Locale.objects.get(language_code=o.language_code))
+
+    @classmethod
+    def create_for_pages_and_snippets(
+        cls, root_page, numbers: range, **kwargs
+    ) -> list[wls_models.LandedTranslationTask]:
+        """
+        Creates a task for each of the pages and snippets created by
+        create_pages_and_snippets().
+        """
+        return [cls(content_object=instance, **kwargs) for instance in create_pages_and_snippets(root_page, numbers)]
+
 
 class TranslationApproverGroupFactory(factory.django.DjangoModelFactory):
     class Meta:  # type: ignore
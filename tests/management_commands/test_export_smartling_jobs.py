@@ -0,0 +1,24 @@
+import json
+
+import pytest
+
+from django.core.management import call_command
+
+
+@pytest.mark.django_db()
+def test_export_smartling_jobs_to_stdout(smartling_job, capsys):
+    call_command("export_smartling_jobs", "--format", "jsonl")
+
+    rows = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [row["id"] for row in rows] == [smartling_job.pk]
+
+
+@pytest.mark.django_db()
+def test_export_smartling_jobs_to_file(smartling_job, tmp_path):
+    output = tmp_path / "jobs.csv"
+
+    call_command("export_smartling_jobs", "--output", str(output), "--chunk-size", "10")
+
+    lines = output.read_text().splitlines()
+    assert lines[0].startswith("id,name,reference_number")
+    assert lines[1].startswith(f"{smartling_job.pk},")
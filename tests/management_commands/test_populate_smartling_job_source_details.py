@@ -0,0 +1,27 @@
+import pytest
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.management import call_command
+
+from wagtail_localize_smartling.models import Job
+
+from testapp.factories import InfoPageFactory, InfoSnippetFactory
+from tests.factories import JobFactory
+
+
+@pytest.mark.django_db()
+def test_populate_smartling_job_source_details(smartling_project, root_page, capsys):
+    page = InfoPageFactory(parent=root_page, title="Test page")
+    page_job = JobFactory(source_instance=page)
+    snippet = InfoSnippetFactory(content="Test snippet")
+    snippet_job = JobFactory(source_instance=snippet)
+    assert not Job.objects.exclude(source_title="").exists()
+
+    call_command("populate_smartling_job_source_details")
+
+    page_job.refresh_from_db()
+    assert page_job.source_title == "Test page"
+    assert page_job.source_content_type == ContentType.objects.get_for_model(page)
+    snippet_job.refresh_from_db()
+    assert snippet_job.source_title == str(snippet)
+    assert "Successfully populated 2 Smartling job source details" in capsys.readouterr().out
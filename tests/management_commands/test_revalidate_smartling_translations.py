@@ -0,0 +1,85 @@
+from datetime import timedelta
+
+import pytest
+
+from django.core.management import call_command
+from django.utils import timezone
+
+from wagtail_localize_smartling.api.types import JobStatus
+from wagtail_localize_smartling.models import Job
+from wagtail_localize_smartling.sync import SyncJobException, revalidate_job
+
+from testapp.factories import InfoPageFactory
+from tests.factories import JobFactory
+
+
+pytestmark = pytest.mark.django_db
+
+
+def _translated_job(root_page, name: str, *, imported_days_ago: int, status=JobStatus.CLOSED, revalidated_at=None):
+    now = timezone.now()
+    return JobFactory(
+        source_instance=InfoPageFactory(parent=root_page, title=name),
+        status=status,
+        first_synced_at=now,
+        last_synced_at=now,
+        translation_job_uid=name,
+        translations_imported_at=now - timedelta(days=imported_days_ago),
+        translations_revalidated_at=revalidated_at,
+    )
+
+
+def test_revalidates_least_recently_checked_recent_jobs(smartling_project, root_page, mocker):
+    mock_revalidate_job = mocker.patch(
+        "wagtail_localize_smartling.management.commands.revalidate_smartling_translations.revalidate_job"
+    )
+    checked_job = _translated_job(root_page, "checked", imported_days_ago=1, revalidated_at=timezone.now())
+    unchecked_job = _translated_job(root_page, "unchecked", imported_days_ago=2)
+    completed_job = _translated_job(root_page, "completed", imported_days_ago=3, status=JobStatus.COMPLETED)
+    _translated_job(root_page, "old", imported_days_ago=60)
+    _translated_job(root_page, "cancelled", imported_days_ago=1, status=JobStatus.CANCELLED)
+
+    call_command("revalidate_smartling_translations", limit=2)
+    assert [call.args[0] for call in mock_revalidate_job.call_args_list] == [unchecked_job.pk, completed_job.pk]
+
+    mock_revalidate_job.reset_mock()
+    call_command("revalidate_smartling_translations")
+    assert [call.args[0] for call in mock_revalidate_job.call_args_list] == [
+        unchecked_job.pk,
+        completed_job.pk,
+        checked_job.pk,
+    ]
+
+
+def test_failed_jobs_are_moved_to_the_back_of_the_queue(smartling_project, root_page, mocker):
+    mocker.patch(
+        "wagtail_localize_smartling.management.commands.revalidate_smartling_translations.revalidate_job",
+        side_effect=SyncJobException,
+    )
+    job = _translated_job(root_page, "failing", imported_days_ago=1)
+
+    call_command("revalidate_smartling_translations")
+
+    assert Job.objects.get(pk=job.pk).translations_revalidated_at is not None
+
+
+def test_job_whose_status_changed_does_not_stop_the_sweep(smartling_project, root_page, mocker):
+    changed_job = _translated_job(root_page, "changed", imported_days_ago=2)
+    other_job = _translated_job(root_page, "other", imported_days_ago=1)
+    mocker.patch("wagtail_localize_smartling.sync._download_and_apply_translations")
+
+    def reopen_job_before_revalidating(job_id):
+        # The job's status changes after it was picked for revalidation
+        if job_id == changed_job.pk:
+            Job.objects.filter(pk=job_id).update(status=JobStatus.IN_PROGRESS)
+        return revalidate_job(job_id)
+
+    mocker.patch(
+        "wagtail_localize_smartling.management.commands.revalidate_smartling_translations.revalidate_job",
+        side_effect=reopen_job_before_revalidating,
+    )
+
+    call_command("revalidate_smartling_translations")
+
+    other_job.refresh_from_db()
+    assert other_job.translations_revalidated_at is not None
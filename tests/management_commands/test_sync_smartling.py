@@ -1,6 +1,17 @@
+import logging
+
+from datetime import timedelta
+
 import pytest
 
-from django.core.management import call_command
+from django.core.management import CommandError, call_command
+from django.utils import timezone
+from wagtail_localize.models import Translation
+
+from wagtail_localize_smartling.api.client import client
+from wagtail_localize_smartling.api.types import JobStatus
+from wagtail_localize_smartling.models import Job, JobTranslation
+from wagtail_localize_smartling.sync import SyncJobException
 
 from testapp.factories import InfoPageFactory
 from tests.factories import JobFactory
@@ -15,3 +26,86 @@ def test_sync_smartling(smartling_project):
     call_command("sync_smartling")
 
     raise AssertionError("TODO")
+
+
+def _synced_job(root_page, status, name: str):
+    now = timezone.now()
+    return JobFactory(
+        source_instance=InfoPageFactory(parent=root_page, title=name),
+        status=status,
+        first_synced_at=now,
+        last_synced_at=now,
+        translation_job_uid=name,
+    )
+
+
+@pytest.mark.django_db()
+def test_sync_smartling_retries_failed_imports_for_finalised_jobs(smartling_project, root_page, mocker):
+    mock_sync_job = mocker.patch("wagtail_localize_smartling.management.commands.sync_smartling.sync_job")
+    mocker.patch("wagtail_localize_smartling.management.commands.sync_smartling.send_queued_notifications")
+    in_progress_job = _synced_job(root_page, JobStatus.IN_PROGRESS, "in-progress-job")
+    closed_job = _synced_job(root_page, JobStatus.CLOSED, "closed-job")
+    failed_closed_job = _synced_job(root_page, JobStatus.CLOSED, "failed-closed-job")
+    failed_deleted_job = _synced_job(root_page, JobStatus.DELETED, "failed-deleted-job")
+    for job in (closed_job, failed_closed_job, failed_deleted_job):
+        job.translations.set(Translation.objects.filter(source=job.translation_source))
+    JobTranslation.objects.filter(job__in=[failed_closed_job, failed_deleted_job]).update(
+        import_failed_at=timezone.now(), import_failure_count=1, import_retry_at=timezone.now()
+    )
+
+    call_command("sync_smartling")
+
+    assert sorted(call.args[0] for call in mock_sync_job.call_args_list) == [in_progress_job.pk, failed_closed_job.pk]
+
+
+@pytest.mark.django_db()
+def test_sync_smartling_stops_when_circuit_breaker_opens(smartling_project, root_page, smartling_settings, mocker):
+    smartling_settings.CIRCUIT_BREAKER_THRESHOLD = 1
+
+    def fail_and_open_circuit_breaker(job_id):
+        client.circuit_breaker.record_failure({})
+        raise SyncJobException(f"Exception syncing job {job_id}")
+
+    mock_sync_job = mocker.patch(
+        "wagtail_localize_smartling.management.commands.sync_smartling.sync_job",
+        side_effect=fail_and_open_circuit_breaker,
+    )
+    mock_send_notifications = mocker.patch(
+        "wagtail_localize_smartling.management.commands.sync_smartling.send_queued_notifications"
+    )
+    for name in ("first-job", "second-job"):
+        _synced_job(root_page, JobStatus.IN_PROGRESS, name)
+
+    with pytest.raises(CommandError, match="Smartling API is failing"):
+        call_command("sync_smartling")
+
+    assert mock_sync_job.call_count == 1
+    mock_send_notifications.assert_called_once()
+
+
+@pytest.mark.django_db()
+def test_sync_smartling_skips_merged_jobs(smartling_project, root_page, smartling_settings, mocker, caplog):
+    smartling_settings.SUBMISSION_COALESCE_WINDOW_MINUTES = 10
+    mocker.patch("wagtail_localize_smartling.management.commands.sync_smartling.send_queued_notifications")
+    mock_client = mocker.patch("wagtail_localize_smartling.sync.client")
+    mock_client.create_job.return_value = {
+        "translationJobUid": "job-uid",
+        "jobStatus": JobStatus.AWAITING_AUTHORIZATION,
+    }
+    mock_client.create_batch_for_job.return_value = "batch-uid"
+    mock_client.upload_files_to_job_batch.return_value = "job.po"
+    created_at = timezone.now() - timedelta(minutes=20)
+    first_job = JobFactory(source_instance=InfoPageFactory(parent=root_page), unsynced=True, created_at=created_at)
+    second_job = JobFactory(
+        source_instance=first_job.translation_source.get_source_instance(),
+        translation_source=first_job.translation_source,
+        translations=Translation.objects.filter(source=first_job.translation_source),
+        unsynced=True,
+        created_at=created_at,
+    )
+
+    call_command("sync_smartling")
+
+    assert list(Job.objects.values_list("pk", "status")) == [(second_job.pk, JobStatus.AWAITING_AUTHORIZATION)]
+    mock_client.create_job.assert_called_once()
+    assert not [record for record in caplog.records if record.levelno >= logging.ERROR]
@@ -1,10 +1,27 @@
+import json
+
+from io import BytesIO
 from unittest.mock import Mock
+from urllib.parse import quote
 
+import polib
 import pytest
-
-from wagtail_localize_smartling.api.client import InvalidResponse, client
+import requests.exceptions
+
+from django.core.files.uploadhandler import MemoryFileUploadHandler
+from django.http.multipartparser import MultiPartParser
+from freezegun import freeze_time
+
+from wagtail_localize_smartling.api.client import (
+    CircuitOpen,
+    DeadlineExceeded,
+    FailedResponse,
+    InvalidResponse,
+    client,
+)
 from wagtail_localize_smartling.exceptions import IncapableVisualContextCallback
 from wagtail_localize_smartling.models import Job
+from wagtail_localize_smartling.settings import TimeoutProfile
 
 
 pytestmark = pytest.mark.django_db
@@ -147,8 +164,27 @@ def test_client__create_batch_for_job__error_path(
 def test_client__upload_files_to_job_batch__happy_path(
     smartling_job,
     smartling_upload_files_to_job_batch,
+    responses,
 ):
-    client.upload_files_to_job_batch(job=smartling_job, batch_uid="test-batch-uid")
+    file_uri = client.upload_files_to_job_batch(job=smartling_job, batch_uid="test-batch-uid")
+
+    request = responses.calls[-1].request
+    body = b"".join(request.body)
+    assert request.headers["Content-Length"] == str(len(body))
+    parser = MultiPartParser(
+        {"CONTENT_TYPE": request.headers["Content-Type"], "CONTENT_LENGTH": len(body)},
+        BytesIO(body),
+        [MemoryFileUploadHandler()],
+    )
+    data, files = parser.parse()
+    assert data["fileUri"] == file_uri
+    assert data["fileType"] == "gettext"
+    assert data.getlist("localeIdsToAuthorize[]") == ["fr"]
+    assert files["file"].name == file_uri
+    uploaded_po = polib.pofile(files["file"].read().decode())
+    assert [(entry.msgctxt, entry.msgid) for entry in uploaded_po] == [
+        (entry.msgctxt, entry.msgid) for entry in smartling_job.translation_source.export_po()
+    ]
 
 
 def test_client__upload_files_to_job_batch__error_path(
@@ -175,11 +211,15 @@ def test_get_file_uri_for_job():
 # =============================================================================
 
 
+@pytest.mark.parametrize("response_validation", ["serializer", "typed_dict"])
 def test_client__get_file_status_for_locale(
+    response_validation,
     smartling_job: "Job",
+    smartling_settings,
     smartling_get_file_status,
 ):
     """Test getting file status for a specific locale."""
+    smartling_settings.API_RESPONSE_VALIDATION = response_validation
     smartling_get_file_status("fr", total_strings=10, completed_strings=8)
 
     result = client.get_file_status_for_locale(job=smartling_job, locale_id="fr")
@@ -208,6 +248,38 @@ msgstr "Test traduit"
     assert b"Test traduit" in result
 
 
+def test_client__download_translation_for_locale__uses_download_timeouts(
+    smartling_job: "Job",
+    smartling_settings,
+    smartling_download_translation_for_locale,
+    responses,
+):
+    smartling_settings.API_TIMEOUT_PROFILES = {
+        **smartling_settings.API_TIMEOUT_PROFILES,
+        "download": TimeoutProfile(connect=2, read=20),
+    }
+    smartling_download_translation_for_locale("fr")
+
+    client.download_translation_for_locale(job=smartling_job, locale_id="fr")
+
+    assert responses.calls[-1].request.req_kwargs["timeout"] == (2, 20)
+
+
+def test_client__download_translation_for_locale__deadline_exceeded(
+    smartling_job: "Job",
+    smartling_settings,
+    smartling_download_translation_for_locale,
+):
+    smartling_settings.API_TIMEOUT_PROFILES = {
+        **smartling_settings.API_TIMEOUT_PROFILES,
+        "download": TimeoutProfile(connect=2, read=20, deadline=1e-9),
+    }
+    smartling_download_translation_for_locale("fr")
+
+    with pytest.raises(DeadlineExceeded):
+        client.download_translation_for_locale(job=smartling_job, locale_id="fr")
+
+
 def test_client__add_locale_to_job(
     smartling_job: "Job",
     smartling_add_locale_to_job,
@@ -219,3 +291,106 @@ def test_client__add_locale_to_job(
     result = client.add_locale_to_job(job=smartling_job, locale_id="de")
 
     assert result is None
+
+
+@pytest.fixture
+def project_details_url(settings):
+    project_id = settings.WAGTAIL_LOCALIZE_SMARTLING["PROJECT_ID"]
+    return f"https://api.smartling.com/projects-api/v2/projects/{quote(project_id)}"
+
+
+def test_client__circuit_breaker_opens_after_consecutive_failures(
+    smartling_auth, smartling_settings, responses, project_details_url
+):
+    smartling_settings.CIRCUIT_BREAKER_THRESHOLD = 2
+    smartling_settings.CIRCUIT_BREAKER_COOLDOWN_SECONDS = 60
+    responses.get(project_details_url, body=requests.exceptions.ConnectTimeout())
+    responses.get(project_details_url, status=503, body="Service Unavailable")
+
+    with freeze_time("2026-01-01 12:00:00"):
+        with pytest.raises(requests.exceptions.ConnectTimeout):
+            client.get_project_details()
+        assert not client.circuit_breaker.is_open()
+        with pytest.raises(InvalidResponse):
+            client.get_project_details()
+        assert client.circuit_breaker.is_open()
+
+        request_count = len(responses.calls)
+        with pytest.raises(CircuitOpen):
+            client.get_project_details()
+        assert len(responses.calls) == request_count
+
+    # Requests are let through again after the cooldown, and the next failure
+    # reopens the breaker straight away
+    with freeze_time("2026-01-01 12:01:01"):
+        with pytest.raises(InvalidResponse):
+            client.get_project_details()
+        assert client.circuit_breaker.is_open()
+
+
+def test_client__circuit_breaker_counts_concurrent_failures(smartling_settings):
+    smartling_settings.CIRCUIT_BREAKER_THRESHOLD = 2
+    # Two requests that were sent before either of them failed
+    first_state = client.circuit_breaker.before_request()
+    second_state = client.circuit_breaker.before_request()
+
+    client.circuit_breaker.record_failure(first_state)
+    client.circuit_breaker.record_failure(second_state)
+
+    assert client.circuit_breaker.is_open()
+
+
+def test_client__circuit_breaker_lets_a_single_request_through_after_the_cooldown(smartling_settings):
+    smartling_settings.CIRCUIT_BREAKER_THRESHOLD = 1
+    smartling_settings.CIRCUIT_BREAKER_COOLDOWN_SECONDS = 60
+    with freeze_time("2026-01-01 12:00:00"):
+        client.circuit_breaker.record_failure({})
+
+    with freeze_time("2026-01-01 12:01:01"):
+        assert not client.circuit_breaker.is_open()
+        # The first request checks whether Smartling has recovered, and the
+        # others fail fast until it has finished
+        probe_state = client.circuit_breaker.before_request()
+        with pytest.raises(CircuitOpen):
+            client.circuit_breaker.before_request()
+
+        client.circuit_breaker.record_success(probe_state)
+        assert client.circuit_breaker._get_state() == {}
+        assert client.circuit_breaker.before_request() == {}
+
+
+def test_client__circuit_breaker_is_reset_by_a_successful_request(
+    smartling_auth, smartling_settings, responses, project_details_url
+):
+    smartling_settings.CIRCUIT_BREAKER_THRESHOLD = 2
+    not_found_body = json.dumps({"response": {"code": "NOT_FOUND_ERROR", "errors": []}})
+    responses.get(project_details_url, status=500, body="Internal Server Error")
+    # Any response that isn't a server error means Smartling is up
+    responses.get(project_details_url, status=404, body=not_found_body)
+    responses.get(project_details_url, status=500, body="Internal Server Error")
+
+    with pytest.raises(InvalidResponse):
+        client.get_project_details()
+    with pytest.raises(FailedResponse):
+        client.get_project_details()
+    assert client.circuit_breaker._get_state() == {}
+
+    with pytest.raises(InvalidResponse):
+        client.get_project_details()
+    assert not client.circuit_breaker.is_open()
+
+
+def test_client__circuit_breaker_ignores_client_errors(
+    smartling_auth, smartling_settings, responses, project_details_url
+):
+    smartling_settings.CIRCUIT_BREAKER_THRESHOLD = 1
+    responses.get(
+        project_details_url,
+        status=404,
+        body=json.dumps({"response": {"code": "NOT_FOUND_ERROR", "errors": []}}),
+    )
+
+    with pytest.raises(FailedResponse):
+        client.get_project_details()
+
+    assert not client.circuit_breaker.is_open()
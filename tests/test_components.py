@@ -0,0 +1,69 @@
+import pytest
+
+from django.test import RequestFactory
+from django.urls import reverse
+
+from wagtail_localize_smartling.components import LandedTranslationsPanel
+from wagtail_localize_smartling.models import LandedTranslationTask
+from wagtail_localize_smartling.utils import user_is_translation_approver
+
+from tests.factories import LandedTranslationTaskFactory, TranslationApproverGroupFactory
+
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def parent_context(superuser):
+    request = RequestFactory().get("/")
+    request.user = superuser
+    return {"request": request}
+
+
+def test_panel_query_count_does_not_depend_on_number_of_tasks(root_page, django_assert_max_num_queries):
+    LandedTranslationTaskFactory.create_for_pages_and_snippets(root_page, range(1))
+    panel = LandedTranslationsPanel(max_to_show=10)
+
+    # Tasks, pages, snippets and the content types cache
+    with django_assert_max_num_queries(4):
+        html = panel.render_html()
+    assert "Page 0 in French" in html
+
+    LandedTranslationTaskFactory.create_for_pages_and_snippets(root_page, range(1, 5))
+    with django_assert_max_num_queries(4):
+        html = panel.render_html()
+    assert "Page 4 in French" in html
+    assert "InfoSnippet object" in html
+
+
+def test_panel_links_to_all_tasks_when_some_are_hidden(root_page):
+    LandedTranslationTaskFactory.create_for_pages_and_snippets(root_page, range(2))
+
+    html = LandedTranslationsPanel(max_to_show=3).render_html()
+
+    assert "Four translations must be published" in html
+    assert "See all 4 tasks" in html
+    assert reverse("wagtail_localize_smartling:landed-translations") in html
+
+
+def test_panel_render_is_cached_per_user_until_tasks_change(root_page, parent_context, django_assert_num_queries):
+    LandedTranslationTaskFactory.create_for_pages_and_snippets(root_page, range(2))
+    panel = LandedTranslationsPanel(max_to_show=10)
+    html = panel.render_html(parent_context)
+
+    # The test settings use the database cache: one lookup for the task
+    # version and one for the rendered panel
+    with django_assert_num_queries(2):
+        assert panel.render_html(parent_context) == html
+
+    LandedTranslationTask.objects.filter(object_id__isnull=False).complete()  # pyright: ignore[reportAttributeAccessIssue]
+    assert panel.render_html(parent_context).strip() == ""
+
+
+def test_user_is_translation_approver_is_cached(superuser, django_assert_num_queries):
+    assert user_is_translation_approver(superuser) is False
+
+    # Membership changes are picked up once the cached result expires
+    TranslationApproverGroupFactory().user_set.add(superuser)
+    with django_assert_num_queries(1):
+        assert user_is_translation_approver(superuser) is False
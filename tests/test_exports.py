@@ -0,0 +1,88 @@
+import csv
+import io
+import json
+
+import pytest
+
+from django.utils import timezone
+from wagtail_localize.models import Translation
+
+from wagtail_localize_smartling.exports import EXPORT_FIELDS, iter_job_export_rows, stream_job_export
+from wagtail_localize_smartling.models import Job
+
+from testapp.factories import InfoPageFactory
+from tests.factories import JobFactory
+
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def jobs(smartling_project, root_page):
+    jobs = []
+    for i in range(5):
+        job = JobFactory(
+            source_instance=InfoPageFactory(parent=root_page, title=f"Page {i}"),
+            source_title=f"Page {i}",
+        )
+        job.translations.set(Translation.objects.filter(source=job.translation_source))
+        jobs.append(job)
+    return jobs
+
+
+def test_iter_job_export_rows(jobs):
+    imported_at = timezone.now()
+    job_translation = jobs[0].job_translations.order_by("translation__target_locale__language_code").first()
+    job_translation.imported_at = imported_at
+    job_translation.save()
+
+    rows = list(iter_job_export_rows())
+
+    assert [row["id"] for row in rows] == [job.pk for job in jobs]
+    assert set(rows[0]) == set(EXPORT_FIELDS)
+    assert rows[0]["source_title"] == "Page 0"
+    assert rows[0]["user"] == jobs[0].user.get_username()
+    assert rows[0]["locales"] == [
+        {"locale": "de", "imported_at": imported_at.isoformat()},
+        {"locale": "fr", "imported_at": None},
+    ]
+
+
+def test_iter_job_export_rows_fetches_in_chunks(jobs, django_assert_num_queries):
+    # One query for the jobs, plus one query per chunk for their translations
+    with django_assert_num_queries(4):
+        rows = list(iter_job_export_rows(chunk_size=2))
+
+    assert len(rows) == 5
+
+
+def test_iter_job_export_rows_for_queryset(jobs):
+    rows = list(iter_job_export_rows(Job.objects.filter(pk=jobs[1].pk)))
+
+    assert [row["id"] for row in rows] == [jobs[1].pk]
+
+
+def test_stream_job_export_csv(jobs):
+    reader = csv.DictReader(io.StringIO("".join(stream_job_export("csv"))))
+
+    rows = list(reader)
+    assert reader.fieldnames == list(EXPORT_FIELDS)
+    assert len(rows) == 5
+    assert rows[0]["source_title"] == "Page 0"
+    assert rows[0]["due_date"] == ""
+    assert rows[0]["locales"] == "de=;fr="
+
+
+def test_stream_job_export_jsonl(jobs):
+    rows = [json.loads(line) for line in stream_job_export("jsonl")]
+
+    assert [row["id"] for row in rows] == [job.pk for job in jobs]
+    assert rows[0]["locales"] == [
+        {"locale": "de", "imported_at": None},
+        {"locale": "fr", "imported_at": None},
+    ]
+
+
+def test_stream_job_export_invalid_format():
+    with pytest.raises(ValueError):
+        stream_job_export("xml")
@@ -1,6 +1,11 @@
+from datetime import timedelta
+
 import pytest
+import requests
 
 from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 from freezegun import freeze_time
@@ -9,7 +14,14 @@ from wagtail_localize.models import Translation, TranslationSource
 from wagtail_localize.operations import translate_object
 
 from wagtail_localize_smartling.api.types import JobStatus
-from wagtail_localize_smartling.models import Job, JobTranslation, LandedTranslationTask
+from wagtail_localize_smartling.models import (
+    Job,
+    JobTranslation,
+    LandedTranslationTask,
+    Project,
+    ProjectTargetLocale,
+    refresh_current_project,
+)
 from wagtail_localize_smartling.utils import compute_content_hash, get_snippet_admin_url
 
 from testapp.factories import InfoPageFactory, InfoSnippetFactory, UserFactory
@@ -125,6 +137,41 @@ def test_LandedTranslationTaskManager_create_from_source_and_translation(
     assert task.cancelled_on is None
 
 
+def test_LandedTranslationTaskManager_create_from_source_and_translations(root_page):
+    locale_fr = Locale.objects.get(language_code="fr")
+    locale_de = Locale.objects.get(language_code="de")
+    page = InfoPageFactory(parent=root_page, title="Test page")
+    translation_source, _ = TranslationSource.get_or_create_from_instance(page)
+    translations = [
+        Translation.objects.create(source=translation_source, target_locale=locale) for locale in (locale_fr, locale_de)
+    ]
+    translate_object(instance=page, locales=[locale_fr, locale_de])
+    content_type = ContentType.objects.get_for_model(page)
+    # An incomplete task already exists for fr, so only de should get a new one
+    existing_task = LandedTranslationTask.objects.create(
+        content_type=content_type,
+        object_id=page.get_translations().get(locale=locale_fr).pk,
+        relevant_locale=locale_fr,
+    )
+
+    with CaptureQueriesContext(connection) as ctx:
+        LandedTranslationTask.objects.create_from_source_and_translations(  # pyright: ignore[reportAttributeAccessIssue]
+            source_object=page,
+            translations=translations,
+        )
+
+    # One query to look up the translated objects, one to insert the tasks
+    # (ignoring the test settings' database-backed cache)
+    assert len([q for q in ctx.captured_queries if '"cache"' not in q["sql"] and "SAVEPOINT" not in q["sql"]]) == 2
+
+    tasks = LandedTranslationTask.objects.incomplete()  # pyright: ignore[reportAttributeAccessIssue]
+    assert tasks.count() == 2
+    assert tasks.get(relevant_locale=locale_fr) == existing_task
+    de_task = tasks.get(relevant_locale=locale_de)
+    assert de_task.content_type == content_type
+    assert de_task.content_object == page.get_translations().get(locale=locale_de)
+
+
 def test_LandedTranslationTask_edit_url_for_translated_item__page(root_page):
     locale_fr = Locale.objects.get(language_code="fr")
     page = InfoPageFactory(parent=root_page, title="Test page")
@@ -555,3 +602,150 @@ def test_get_or_create_excluded_locale_not_added_to_existing_job(smartling_proje
     assert Job.objects.count() == 1
     assert job.translations.count() == 1
     assert set(job.translations.all()) == {fr_translation}
+
+
+def test_get_or_create_sets_source_details(smartling_project, root_page):
+    page = InfoPageFactory(parent=root_page, title="Test page")
+    translation_source, _ = TranslationSource.get_or_create_from_instance(page)
+    translation = Translation.objects.create(
+        source=translation_source,
+        target_locale=Locale.objects.get(language_code="fr"),
+    )
+
+    Job.get_or_create_from_source_and_translation_data(
+        translation_source=translation_source,
+        translations=[translation],
+        user=UserFactory(),
+        due_date=None,
+    )
+
+    job = Job.objects.get()
+    assert job.source_title == "Test page"
+    assert job.source_content_type == ContentType.objects.get_for_model(page)
+
+
+def test_Job_refresh_source_details(smartling_job: Job, mocker):
+    page = smartling_job.translation_source.get_source_instance()
+    page.title = "Renamed page"
+    page.save()
+
+    smartling_job.refresh_source_details()
+    assert smartling_job.source_title == "Renamed page"
+    assert smartling_job.source_content_type == ContentType.objects.get_for_model(page)
+
+    # The last known details are kept once the source has been deleted
+    mocker.patch.object(TranslationSource, "get_source_instance", side_effect=type(page).DoesNotExist)
+    smartling_job.refresh_source_details()
+    assert smartling_job.source_title == "Renamed page"
+
+
+@pytest.mark.parametrize(
+    ("completed", "total", "imported", "percentage", "display"),
+    [
+        (None, None, False, None, ""),
+        (0, 0, False, None, ""),
+        (5, 10, False, 50, "5/10 strings translated (50%)"),
+        (2, 3, False, 66, "2/3 strings translated (66%)"),
+        (10, 10, True, 100, "Imported"),
+    ],
+)
+def test_JobTranslation_progress(smartling_job: Job, completed, total, imported, percentage, display):
+    job_translation = JobTranslation.objects.get(job=smartling_job)
+    job_translation.completed_string_count = completed
+    job_translation.total_string_count = total
+    job_translation.imported_at = timezone.now() if imported else None
+
+    assert job_translation.progress_percentage == percentage
+    assert job_translation.get_progress_display() == display
+
+
+def test_Project_get_current_is_cached_in_process(smartling_project, responses, django_assert_num_queries):
+    api_calls = len(responses.calls)
+
+    with django_assert_num_queries(0):
+        assert Project.get_current() is smartling_project
+
+    assert len(responses.calls) == api_calls
+
+
+def test_Project_get_current_falls_back_to_database_on_cold_start(
+    smartling_project, responses, django_assert_num_queries
+):
+    api_calls = len(responses.calls)
+    Project.clear_current_cache()
+
+    with django_assert_num_queries(1):
+        assert Project.get_current() == smartling_project
+
+    assert len(responses.calls) == api_calls
+
+
+def test_Project_get_current_queues_refresh_when_stale(smartling_project, smartling_settings, mocker):
+    mock_background = mocker.patch("wagtail_localize_smartling.models.background")
+    Project.clear_current_cache()
+
+    with freeze_time(timezone.now() + timedelta(seconds=smartling_settings.PROJECT_CACHE_TIMEOUT_SECONDS + 1)):
+        assert Project.get_current() == smartling_project
+
+    mock_background.enqueue.assert_called_once_with(refresh_current_project, args=(), kwargs={})
+
+
+def test_Project_get_current_refresh_upserts_target_locales(smartling_project, django_assert_max_num_queries):
+    smartling_project.target_locales.filter(locale_id="fr").update(description="Old description", enabled=False)
+    ProjectTargetLocale.objects.create(project=smartling_project, locale_id="es", description="Spanish", enabled=True)
+
+    # Fetch the project, save it, upsert the target locales and delete the
+    # removed ones, plus the circuit breaker's lookup in the database cache
+    with django_assert_max_num_queries(5):
+        project = Project.get_current(refresh=True)
+
+    assert list(project.target_locales.order_by("locale_id").values_list("locale_id", "description", "enabled")) == [
+        ("de", "German (International) [de]", True),
+        ("fr", "French (International) [fr]", True),
+    ]
+
+
+def test_Project_get_current_refresh_falls_back_to_database(smartling_project, mocker):
+    mocker.patch(
+        "wagtail_localize_smartling.models.client.get_project_details",
+        side_effect=requests.exceptions.Timeout,
+    )
+
+    assert Project.get_current(refresh=True) == smartling_project
+
+
+def test_Project_get_current_refresh_raises_without_a_project(mocker):
+    mocker.patch(
+        "wagtail_localize_smartling.models.client.get_project_details",
+        side_effect=requests.exceptions.Timeout,
+    )
+    Project.clear_current_cache()
+
+    with pytest.raises(requests.exceptions.Timeout):
+        Project.get_current()
+
+
+def test_JobTranslation_import_failures_back_off_then_give_up(smartling_job: Job):
+    job_translation = smartling_job.job_translations.get()
+    now = timezone.now()
+
+    job_translation.record_import_failure(now)
+    assert job_translation.import_retry_at == now + timedelta(minutes=10)
+    assert not job_translation.is_import_due(now)
+    assert job_translation.is_import_due(now + timedelta(minutes=10))
+
+    job_translation.record_import_failure(now)
+    assert job_translation.import_retry_at == now + timedelta(minutes=20)
+
+    for _ in range(7):
+        job_translation.record_import_failure(now)
+    assert job_translation.import_failure_count == 9
+    assert job_translation.import_retry_at == now + timedelta(days=1)
+
+    job_translation.record_import_failure(now)
+    assert job_translation.import_retry_at is None
+    assert not job_translation.is_import_due(now + timedelta(days=365))
+
+    job_translation.clear_import_failure()
+    assert job_translation.is_import_due(now)
+    assert job_translation.import_failure_count == 0
@@ -0,0 +1,123 @@
+import tracemalloc
+
+import polib
+import pytest
+
+from requests import Request
+from wagtail.rich_text import RichText
+from wagtail_localize.models import TranslationSource
+
+from wagtail_localize_smartling.api.multipart import StreamingMultipartEncoder, iter_po
+
+from testapp.factories import InfoPageFactory
+
+
+pytestmark = pytest.mark.django_db
+
+
+def _make_po(entry_count: int, **kwargs) -> polib.POFile:
+    po = polib.POFile(**kwargs)
+    po.metadata = {"MIME-Version": "1.0", "Content-Type": "text/plain; charset=utf-8"}
+    for i in range(entry_count):
+        po.append(polib.POEntry(msgid=f"Paragraph {i} " + "lorem ipsum dolor " * 20, msgctxt=f"body.{i}", msgstr=""))
+    obsolete = polib.POEntry(msgid="Removed", msgstr="", obsolete=True)
+    po.append(obsolete)
+    return po
+
+
+def test_iter_po_matches_str():
+    po = _make_po(10)
+    po.header = "A header\n, fuzzy"
+
+    assert "".join(iter_po(po)) == str(po)
+
+
+def test_iter_po_keeps_entries_of_files_with_a_custom_wrap_width():
+    po = _make_po(10, wrapwidth=200)
+
+    parsed = polib.pofile("".join(iter_po(po)))
+
+    assert parsed.metadata == po.metadata
+    assert [(entry.msgctxt, entry.msgid, entry.obsolete) for entry in parsed] == [
+        (entry.msgctxt, entry.msgid, entry.obsolete) for entry in po
+    ]
+
+
+def test_iter_po_matches_export_po(root_page):
+    """
+    iter_po() reimplements polib's serialization, so check that it still
+    matches str() for a PO file that wagtail-localize exports.
+    """
+    page = InfoPageFactory(parent=root_page, title="Export test page")
+    page.body = [
+        ("heading", "A heading"),
+        ("paragraph", RichText('<p>Some <b>rich</b> text with a <a href="https://example.com">link</a></p>')),
+    ]
+    page.save()
+    translation_source, _ = TranslationSource.get_or_create_from_instance(page)
+    po = translation_source.export_po()
+
+    assert len(po) > 1
+    assert "".join(iter_po(po)) == str(po)
+
+
+def test_encoder_length_matches_body():
+    po = _make_po(10)
+    encoder = StreamingMultipartEncoder(
+        fields=[("fileUri", "file.po"), ("localeIdsToAuthorize[]", "fr"), ("localeIdsToAuthorize[]", "de")],
+        files=[("file", "file.po", lambda: iter_po(po))],
+    )
+
+    body = b"".join(encoder)
+
+    assert len(encoder) == len(body)
+    assert body.startswith(f"--{encoder.boundary}\r\n".encode())
+    assert body.endswith(f"--{encoder.boundary}--\r\n".encode())
+    assert str(po).encode() in body
+
+
+def _peak_memory(func) -> int:
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_streaming_upload_memory_benchmark():
+    """
+    Preparing and sending a large PO file with requests' `files` holds several
+    copies of the file in memory, while the streaming encoder only ever holds a
+    chunk of the body on top of the PO file itself.
+    """
+    po = _make_po(5000)
+    file_size = len(str(po).encode())
+
+    def buffered():
+        Request(
+            "POST",
+            "https://api.smartling.com/",
+            files={"file": ("file.po", str(po))},
+            data={"fileUri": "file.po"},
+        ).prepare()
+
+    def streaming():
+        encoder = StreamingMultipartEncoder(
+            fields=[("fileUri", "file.po")],
+            files=[("file", "file.po", lambda: iter_po(po))],
+        )
+        request = Request(
+            "POST",
+            "https://api.smartling.com/",
+            data=encoder,
+            headers={"Content-Type": encoder.content_type},
+        ).prepare()
+        for _ in request.body:
+            pass
+
+    buffered_peak = _peak_memory(buffered)
+    streaming_peak = _peak_memory(streaming)
+
+    assert buffered_peak > 2 * file_size
+    assert streaming_peak < file_size / 4
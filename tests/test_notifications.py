@@ -0,0 +1,120 @@
+import pytest
+
+from django.core import mail
+from django.test import override_settings
+from freezegun import freeze_time
+
+from wagtail_localize_smartling.models import Job, TranslationImportedNotification
+from wagtail_localize_smartling.notifications import send_queued_notifications
+from wagtail_localize_smartling.signals import translation_import_successful
+
+from tests.factories import TranslationApproverGroupFactory, WagtailUserFactory
+
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def approvers():
+    ta_group = TranslationApproverGroupFactory()
+    approver_1 = WagtailUserFactory(username="approver_1", email="approver_1@example.com")
+    approver_2 = WagtailUserFactory(username="approver_2", email="approver_2@example.com")
+    ta_group.user_set.add(approver_1, approver_2)
+    return [approver_1, approver_2]
+
+
+def _queue_notification(job_name: str, target_locales: list[str]) -> TranslationImportedNotification:
+    return TranslationImportedNotification.objects.create(
+        job_name=job_name,
+        translation_source_name=f"Source for {job_name}",
+        target_locales=target_locales,
+    )
+
+
+def test_one_email_per_notification_over_one_connection(approvers, mailoutbox, mocker):
+    _queue_notification("Job 1", ["French"])
+    _queue_notification("Job 2", ["German"])
+    get_connection = mocker.patch(
+        "wagtail_localize_smartling.notifications.get_connection",
+        wraps=mail.get_connection,
+    )
+
+    assert send_queued_notifications() == 2
+
+    get_connection.assert_called_once_with()
+    assert [message.to for message in mailoutbox] == [
+        ["approver_1@example.com", "approver_2@example.com"],
+        ["approver_1@example.com", "approver_2@example.com"],
+    ]
+    assert "Job 'Job 1'" in mailoutbox[0].body
+    assert "Job 'Job 2'" in mailoutbox[1].body
+
+
+@override_settings(DEFAULT_FROM_EMAIL="from@example.com")
+def test_digest_holds_notifications_until_the_window_has_passed(approvers, mailoutbox, smartling_settings):
+    smartling_settings.EMAIL_DIGEST_WINDOW_MINUTES = 30
+
+    with freeze_time("2024-05-03 12:00:00"):
+        first = _queue_notification("Job 1", ["French"])
+    with freeze_time("2024-05-03 12:20:00"):
+        second = _queue_notification("Job 2", ["French", "German"])
+        assert send_queued_notifications() == 0
+        assert len(mailoutbox) == 0
+
+    with freeze_time("2024-05-03 12:31:00"):
+        assert send_queued_notifications() == 1
+
+    assert len(mailoutbox) == 1
+    message = mailoutbox[0]
+    assert message.to == ["approver_1@example.com", "approver_2@example.com"]
+    assert "* Job 'Job 1' for 'Source for Job 1' into: French" in message.body
+    assert "* Job 'Job 2' for 'Source for Job 2' into: French, German" in message.body
+
+    for notification in (first, second):
+        notification.refresh_from_db()
+        assert notification.sent_at is not None
+
+
+def test_notifications_are_sent_in_the_background_when_a_worker_is_available(
+    smartling_job, django_capture_on_commit_callbacks, mocker
+):
+    mock_background = mocker.patch("wagtail_localize_smartling.signal_handlers.background")
+
+    with django_capture_on_commit_callbacks(execute=True):
+        translation_import_successful.send(
+            sender=Job,
+            instance=smartling_job,
+            translations_imported=list(smartling_job.translations.all()),
+        )
+
+    assert TranslationImportedNotification.objects.filter(job=smartling_job, sent_at__isnull=True).exists()
+    mock_background.enqueue.assert_called_once_with(send_queued_notifications, args=(), kwargs={})
+
+
+def test_failed_email_is_retried_without_resending_delivered_ones(approvers, mailoutbox, mocker):
+    first = _queue_notification("Job 1", ["French"])
+    second = _queue_notification("Job 2", ["German"])
+    locmem_send_messages = mail.get_connection().__class__.send_messages
+    calls = 0
+
+    def fail_second_message(self, messages):
+        nonlocal calls
+        calls += 1
+        if calls == 2:
+            raise ConnectionError("Mail server went away")
+        return locmem_send_messages(self, messages)
+
+    mocker.patch("django.core.mail.backends.locmem.EmailBackend.send_messages", fail_second_message)
+
+    assert send_queued_notifications() == 1
+
+    first.refresh_from_db()
+    second.refresh_from_db()
+    assert first.sent_at is not None
+    assert second.sent_at is None
+    assert len(mailoutbox) == 1
+
+    mocker.stopall()
+    assert send_queued_notifications() == 1
+
+    assert ["Job 'Job 2'" in message.body for message in mailoutbox] == [False, True]
@@ -0,0 +1,70 @@
+"""
+Regression tests making sure the hot lookups use the indexes added for them.
+
+Tables in the test database are tiny, so on PostgreSQL we turn off sequential
+scans for the duration of each test; otherwise the planner would rightly
+decide that reading the whole table is cheaper than using an index.
+"""
+
+import pytest
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from wagtail.models import Locale
+
+from wagtail_localize_smartling.constants import UNSYNCED_OR_PENDING_STATUSES
+from wagtail_localize_smartling.models import Job, JobTranslation, LandedTranslationTask
+
+from testapp.factories import InfoPageFactory
+
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def discourage_sequential_scans():
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+    elif connection.vendor != "sqlite":
+        pytest.skip(f"Query plan assertions not written for {connection.vendor}")
+
+
+def test_pending_job_translations_lookup_uses_partial_index(smartling_job):
+    plan = JobTranslation.objects.filter(job=smartling_job, imported_at__isnull=True).explain()
+
+    assert "wls_jobtranslation_pending_idx" in plan
+
+
+def test_open_landed_tasks_lookup_uses_unique_constraint_index():
+    page = InfoPageFactory()
+    content_type = ContentType.objects.get_for_model(page)
+    LandedTranslationTask.objects.create(
+        content_type=content_type,
+        object_id=page.pk,
+        relevant_locale=Locale.objects.get(language_code="fr"),
+    )
+
+    plan = (
+        LandedTranslationTask.objects.incomplete()  # pyright: ignore[reportAttributeAccessIssue]
+        .filter(content_type=content_type, object_id=page.pk)
+        .explain()
+    )
+
+    assert "unique_incomplete_landed_translation_task" in plan
+
+
+def test_any_open_landed_tasks_check_uses_unique_constraint_index():
+    plan = LandedTranslationTask.objects.incomplete().values("pk")[:1].explain()  # pyright: ignore[reportAttributeAccessIssue]
+
+    assert "unique_incomplete_landed_translation_task" in plan
+
+
+def test_existing_pending_jobs_lookup_uses_composite_index(smartling_job):
+    plan = Job.objects.filter(
+        translation_source=smartling_job.translation_source,
+        content_hash=smartling_job.content_hash,
+        status__in=UNSYNCED_OR_PENDING_STATUSES,
+    ).explain()
+
+    assert "wls_job_source_hash_status_idx" in plan
@@ -3,7 +3,7 @@ import pytest
 from django.core.exceptions import ImproperlyConfigured
 from django.test import override_settings
 
-from wagtail_localize_smartling.settings import _init_settings
+from wagtail_localize_smartling.settings import TimeoutProfile, _init_settings
 
 
 pytestmark = pytest.mark.django_db
@@ -28,6 +28,11 @@ def test_settings():
     assert smartling_settings.REQUIRED is True
     assert smartling_settings.ENVIRONMENT == "staging"
     assert smartling_settings.API_TIMEOUT_SECONDS == 10.0
+    assert smartling_settings.API_TIMEOUT_PROFILES == {
+        "default": TimeoutProfile(10.0, 10.0),
+        "upload": TimeoutProfile(10.0, 60.0),
+        "download": TimeoutProfile(10.0, 30.0, 300.0),
+    }
     assert smartling_settings.LOCALE_TO_SMARTLING_LOCALE == {}
     assert smartling_settings.SMARTLING_LOCALE_TO_LOCALE == {}
     assert smartling_settings.REFORMAT_LANGUAGE_CODES is True
@@ -38,6 +43,12 @@ def test_settings():
     assert smartling_settings.ADD_APPROVAL_TASK_TO_DASHBOARD is True
     assert smartling_settings.MAX_APPROVAL_TASKS_ON_DASHBOARD == 7
     assert smartling_settings.SEND_EMAIL_ON_TRANSLATION_IMPORT is True
+    assert smartling_settings.EMAIL_DIGEST_WINDOW_MINUTES == 0
+    assert smartling_settings.SUBMISSION_COALESCE_WINDOW_MINUTES == 0
+    assert smartling_settings.PROJECT_CACHE_TIMEOUT_SECONDS == 3600
+    assert smartling_settings.CIRCUIT_BREAKER_THRESHOLD == 5
+    assert smartling_settings.CIRCUIT_BREAKER_COOLDOWN_SECONDS == 300
+    assert smartling_settings.API_RESPONSE_VALIDATION == "serializer"
 
 
 @override_settings(
@@ -76,6 +87,73 @@ def test_non_numeric_api_timeout_seconds(settings):
         _init_settings()
 
 
+@pytest.mark.parametrize("value", ["non_numeric_value", 0, -1])
+def test_invalid_project_cache_timeout_seconds(settings, value):
+    settings.WAGTAIL_LOCALIZE_SMARTLING = {**REQUIRED_SETTINGS, "PROJECT_CACHE_TIMEOUT_SECONDS": value}
+
+    with pytest.raises(ImproperlyConfigured):
+        _init_settings()
+
+
+def test_api_timeout_profiles(settings):
+    settings.WAGTAIL_LOCALIZE_SMARTLING = {
+        **REQUIRED_SETTINGS,
+        "API_TIMEOUT_PROFILES": {
+            "default": {"connect": 2},
+            "download": {"read": "60", "deadline": None},
+        },
+    }
+
+    assert _init_settings().API_TIMEOUT_PROFILES == {
+        "default": TimeoutProfile(2.0, 5.0),
+        "upload": TimeoutProfile(5.0, 60.0),
+        "download": TimeoutProfile(5.0, 60.0, None),
+    }
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        ["default"],
+        {"unknown": {"connect": 1}},
+        {"default": 1},
+        {"default": {"total": 1}},
+        {"default": {"connect": "non_numeric_value"}},
+        {"default": {"read": None}},
+        {"download": {"deadline": 0}},
+        {"upload": {"deadline": 60}},
+    ],
+)
+def test_invalid_api_timeout_profiles(settings, value):
+    settings.WAGTAIL_LOCALIZE_SMARTLING = {**REQUIRED_SETTINGS, "API_TIMEOUT_PROFILES": value}
+
+    with pytest.raises(ImproperlyConfigured):
+        _init_settings()
+
+
+def test_invalid_api_response_validation(settings):
+    settings.WAGTAIL_LOCALIZE_SMARTLING = {**REQUIRED_SETTINGS, "API_RESPONSE_VALIDATION": "pydantic"}
+
+    with pytest.raises(ImproperlyConfigured):
+        _init_settings()
+
+
+@pytest.mark.parametrize(
+    "key,value",
+    [
+        ("CIRCUIT_BREAKER_THRESHOLD", "non_numeric_value"),
+        ("CIRCUIT_BREAKER_THRESHOLD", -1),
+        ("CIRCUIT_BREAKER_COOLDOWN_SECONDS", "non_numeric_value"),
+        ("CIRCUIT_BREAKER_COOLDOWN_SECONDS", 0),
+    ],
+)
+def test_invalid_circuit_breaker_settings(settings, key, value):
+    settings.WAGTAIL_LOCALIZE_SMARTLING = {**REQUIRED_SETTINGS, key: value}
+
+    with pytest.raises(ImproperlyConfigured):
+        _init_settings()
+
+
 @override_settings(
     WAGTAIL_LOCALIZE_SMARTLING={
         **REQUIRED_SETTINGS,
@@ -311,3 +389,41 @@ def test_exclude_locales_invalid_locale_code():
 def test_exclude_locales_valid_and_invalid_in_excluded_locales():
     with pytest.raises(ImproperlyConfigured, match="WAGTAIL_CONTENT_LANGUAGES"):
         _init_settings()
+
+
+@override_settings(
+    WAGTAIL_LOCALIZE_SMARTLING={
+        **REQUIRED_SETTINGS,
+        "EMAIL_DIGEST_WINDOW_MINUTES": 30,
+    }
+)
+def test_email_digest_window_minutes():
+    smartling_settings = _init_settings()
+    assert smartling_settings.EMAIL_DIGEST_WINDOW_MINUTES == 30
+
+
+@pytest.mark.parametrize("value", ("not-a-number", -5))
+def test_invalid_email_digest_window_minutes(value):
+    with override_settings(WAGTAIL_LOCALIZE_SMARTLING={**REQUIRED_SETTINGS, "EMAIL_DIGEST_WINDOW_MINUTES": value}):
+        with pytest.raises(ImproperlyConfigured, match="EMAIL_DIGEST_WINDOW_MINUTES"):
+            _init_settings()
+
+
+@override_settings(
+    WAGTAIL_LOCALIZE_SMARTLING={
+        **REQUIRED_SETTINGS,
+        "SUBMISSION_COALESCE_WINDOW_MINUTES": 15,
+    }
+)
+def test_submission_coalesce_window_minutes():
+    smartling_settings = _init_settings()
+    assert smartling_settings.SUBMISSION_COALESCE_WINDOW_MINUTES == 15
+
+
+@pytest.mark.parametrize("value", ("not-a-number", -5))
+def test_invalid_submission_coalesce_window_minutes(value):
+    with override_settings(
+        WAGTAIL_LOCALIZE_SMARTLING={**REQUIRED_SETTINGS, "SUBMISSION_COALESCE_WINDOW_MINUTES": value}
+    ):
+        with pytest.raises(ImproperlyConfigured, match="SUBMISSION_COALESCE_WINDOW_MINUTES"):
+            _init_settings()
@@ -7,47 +7,61 @@ from unittest.mock import Mock
 import pytest
 
 from django.contrib.auth.models import User
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.db.models.signals import post_save
 from django.template.loader import render_to_string
 from django.test import override_settings
-from wagtail.models import Page
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from wagtail.models import Locale, Page
 from wagtail_localize.models import Translation
 
-from wagtail_localize_smartling.models import Job, LandedTranslationTask
+from wagtail_localize_smartling.models import Job, LandedTranslationTask, TranslationImportedNotification
+from wagtail_localize_smartling.notifications import send_queued_notifications
 from wagtail_localize_smartling.signal_handlers import (
     _close_translation_landed_task,
     _model_is_registered_as_snippet,
     close_translation_landed_task_on_page_published,
     close_translation_landed_task_on_snippet_published,
-    create_landed_translation_task,
+    create_landed_translation_tasks,
     send_email_notification_upon_overall_translation_import,
 )
 from wagtail_localize_smartling.signals import (
     individual_translation_imported,
+    landed_translation_tasks_completed,
     translation_import_successful,
 )
 
+from testapp.factories import InfoPageFactory, InfoSnippetFactory
+from testapp.models import InfoSnippet
 from tests.factories import TranslationApproverGroupFactory, WagtailUserFactory
 
 
 pytestmark = [pytest.mark.django_db]
 
 
-def test_individual_translation_imported_is_connected_to_the_expected_handlers():
-    assert len(individual_translation_imported.receivers) == 1
-    assert individual_translation_imported.receivers[0][1] == create_landed_translation_task
+def _live_post_save_receivers(sender):
+    sync_receivers, _async_receivers = post_save._live_receivers(sender)
+    return sync_receivers
+
+
+def test_individual_translation_imported_is_not_connected_to_any_handlers():
+    assert len(individual_translation_imported.receivers) == 0
 
 
 def test_translation_import_successful_is_connected_to_the_expected_handlers():
-    assert len(translation_import_successful.receivers) == 1
-    assert translation_import_successful.receivers[0][1] == send_email_notification_upon_overall_translation_import
+    assert len(translation_import_successful.receivers) == 2
+    assert translation_import_successful.receivers[0][1] == create_landed_translation_tasks
+    assert translation_import_successful.receivers[1][1] == send_email_notification_upon_overall_translation_import
 
 
 @override_settings(
     DEFAULT_FROM_EMAIL="from@example.com",
     WAGTAILADMIN_BASE_URL="https://cms.example.com",
 )
-def test_notify_of_imported_translations__happy_path(mocker):
-    mock_logger_info = mocker.patch("wagtail_localize_smartling.signal_handlers.logger.info")
+def test_notify_of_imported_translations__happy_path(smartling_job_multi_locale, mailoutbox, mocker):
+    mock_logger_info = mocker.patch("wagtail_localize_smartling.notifications.logger.info")
 
     admin_1 = WagtailUserFactory(
         username="admin_1",
@@ -69,38 +83,41 @@ def test_notify_of_imported_translations__happy_path(mocker):
     ta_group.user_set.add(admin_1)
     ta_group.user_set.add(user_1)
 
-    mock_job = mocker.MagicMock(spec=Job)
-    mock_job.name = "Test Job"
-    mock_job.pk = 9876
-    mock_source = mocker.Mock(name="test-source")
-    mock_job.translation_source.get_source_instance.return_value = mock_source
-
-    mock_translation_fr = mocker.MagicMock(spec=Translation, name="mock-translation-fr")
-    mock_translation_fr.target_locale.language_code = "fr"
-    mock_translation_fr_CA = mocker.MagicMock(spec=Translation, name="mock-translation-fr-CA")
-    mock_translation_fr_CA.target_locale.language_code = "fr-CA"
-
-    mock_send_mail = mocker.patch("wagtail_localize_smartling.signal_handlers.send_mail")
-
     translation_import_successful.send(
         sender=Job,
-        instance=mock_job,
-        translations_imported=[mock_translation_fr, mock_translation_fr_CA],
+        instance=smartling_job_multi_locale,
+        translations_imported=list(smartling_job_multi_locale.translations.all()),
     )
-    assert mock_send_mail.call_count == 1
-    assert mock_send_mail.call_args[1]["subject"] == "New translations imported from Smartling"
-    assert mock_send_mail.call_args[1]["from_email"] == "from@example.com"
-    assert mock_send_mail.call_args[1]["recipient_list"] == [
+
+    # Notifications are queued during the sync, rather than sent
+    assert len(mailoutbox) == 0
+    notification = TranslationImportedNotification.objects.get()
+    assert notification.job == smartling_job_multi_locale
+    assert notification.sent_at is None
+
+    assert send_queued_notifications() == 1
+
+    assert len(mailoutbox) == 1
+    message = mailoutbox[0]
+    assert message.subject == "New translations imported from Smartling"
+    assert message.from_email == "from@example.com"
+    assert message.to == [
         "admin_1@example.com",
         "user_1@example.com",
     ]
 
     for expected_string in [
         "ACTION REQUIRED: Translations have been synced back from Smartling and need to be published.",
-        "They are for Job 'Test Job'",
+        f"They are for Job '{smartling_job_multi_locale.name}'",
+        "* French",
+        "* German",
     ]:
-        assert expected_string in mock_send_mail.call_args[1]["message"]
-    assert mock_logger_info.call_args_list[0][0][0] == "Translation-imported notification sent to 2 users"
+        assert expected_string in message.body
+    assert mock_logger_info.call_args_list[-1][0][0] == "1 translation-imported notification(s) sent to 2 users"
+
+    notification.refresh_from_db()
+    assert notification.sent_at is not None
+    assert send_queued_notifications() == 0
 
 
 @pytest.mark.parametrize(
@@ -131,88 +148,87 @@ def test_notification_body_rendering(translation_target_locales):
         assert "They are for Job 'TEST JOB' for 'TS NAME" in email_body
 
 
-def test_notify_of_imported_translations__no_group_members(mocker):
-    mock_logger_warning = mocker.patch("wagtail_localize_smartling.signal_handlers.logger.warning")
-
-    mock_job = mocker.MagicMock(spec=Job)
-    mock_job.name = "Test Job"
-    mock_job.pk = 9876
-    mock_source = mocker.Mock(name="test-source")
-    mock_job.translation_source.get_source_instance.return_value = mock_source
-
-    mock_translation_fr = mocker.MagicMock(spec=Translation, name="mock-translation-fr")
-    mock_translation_fr.target_locale.language_code = "fr"
-    mock_translation_fr_CA = mocker.MagicMock(spec=Translation, name="mock-translation-fr-CA")
-    mock_translation_fr_CA.target_locale.language_code = "fr-CA"
-
-    mock_send_mail = mocker.patch("wagtail_localize_smartling.signal_handlers.send_mail")
+def test_notify_of_imported_translations__no_group_members(smartling_job, mailoutbox, mocker):
+    mock_logger_warning = mocker.patch("wagtail_localize_smartling.notifications.logger.warning")
 
     translation_import_successful.send(
         sender=Job,
-        instance=mock_job,
-        translations_imported=[mock_translation_fr, mock_translation_fr_CA],
+        instance=smartling_job,
+        translations_imported=list(smartling_job.translations.all()),
     )
-    assert mock_send_mail.call_count == 0
-    assert mock_logger_warning.call_args_list[0][0][0] == (
+    assert send_queued_notifications() == 0
+
+    assert len(mailoutbox) == 0
+    assert mock_logger_warning.call_args_list[-1][0][0] == (
         "Unable to send translation-imported email notifications: "
         "no members of the Translation approver group in the system"
     )
+    # The notification isn't kept around to be retried forever
+    assert not TranslationImportedNotification.objects.filter(sent_at__isnull=True).exists()
 
 
-def test_create_landed_translation_task__task_created(
+def test_notify_of_imported_translations__disabled_by_settings(smartling_job, smartling_settings):
+    smartling_settings.SEND_EMAIL_ON_TRANSLATION_IMPORT = False
+
+    translation_import_successful.send(
+        sender=Job,
+        instance=smartling_job,
+        translations_imported=list(smartling_job.translations.all()),
+    )
+
+    assert not TranslationImportedNotification.objects.exists()
+
+
+def test_create_landed_translation_tasks__tasks_created(
     mocker,
     smartling_settings,
 ):
     smartling_settings.ADD_APPROVAL_TASK_TO_DASHBOARD = True
-    mock_create_from_source_and_translation = mocker.patch(
-        "wagtail_localize_smartling.models.LandedTranslationTask.objects.create_from_source_and_translation"
+    mock_create_from_source_and_translations = mocker.patch(
+        "wagtail_localize_smartling.models.LandedTranslationTask.objects.create_from_source_and_translations"
     )
 
     mock_job = mocker.MagicMock(spec=Job)
-    mock_translation = mocker.MagicMock(spec=Translation)
+    mock_translations = [mocker.MagicMock(spec=Translation), mocker.MagicMock(spec=Translation)]
     mock_source_instance = mocker.Mock(name="test-source")
     mock_job.translation_source.get_source_instance.return_value = mock_source_instance
 
-    create_landed_translation_task(
+    create_landed_translation_tasks(
         sender=Job,
         instance=mock_job,
-        translation=mock_translation,
+        translations_imported=mock_translations,
     )
 
-    mock_create_from_source_and_translation.assert_called_once_with(
+    mock_create_from_source_and_translations.assert_called_once_with(
         source_object=mock_source_instance,
-        translated_locale=mock_translation.target_locale,
+        translations=mock_translations,
     )
 
 
-def test_create_landed_translation_task__disabled_by_settings(
+def test_create_landed_translation_tasks__disabled_by_settings(
     mocker,
     smartling_settings,
 ):
     smartling_settings.ADD_APPROVAL_TASK_TO_DASHBOARD = False
 
     mock_logger_debug = mocker.patch("wagtail_localize_smartling.signal_handlers.logger.debug")
-    mock_create_from_source_and_translation = mocker.patch(
-        "wagtail_localize_smartling.models.LandedTranslationTask.objects.create_from_source_and_translation"
+    mock_create_from_source_and_translations = mocker.patch(
+        "wagtail_localize_smartling.models.LandedTranslationTask.objects.create_from_source_and_translations"
     )
 
     mock_job = mocker.MagicMock(spec=Job)
     mock_translation = mocker.MagicMock(spec=Translation)
 
-    create_landed_translation_task(sender=Job, instance=mock_job, translation=mock_translation)
+    create_landed_translation_tasks(sender=Job, instance=mock_job, translations_imported=[mock_translation])
 
     mock_logger_debug.assert_called_once_with("Creation of a landed-translation task is disabled by settings")
-    assert not mock_create_from_source_and_translation.called
+    assert not mock_create_from_source_and_translations.called
 
 
 def test__close_translation_landed_task__happy_path(mocker):
-    mock_task = mocker.MagicMock(spec=LandedTranslationTask)
-    mock_task.complete = mocker.MagicMock()
-
-    mock_tasks_filter = mocker.patch(
+    mock_complete = mocker.patch(
         "wagtail_localize_smartling.signal_handlers.LandedTranslationTask.objects.filter",
-        return_value=[mock_task],
-    )
+    ).return_value.complete
     mock_instance = mocker.Mock()
     mock_instance.pk = 1234
     mock_content_type = mocker.patch(
@@ -223,32 +239,67 @@ def test__close_translation_landed_task__happy_path(mocker):
     _close_translation_landed_task(mock_instance)
 
     mock_content_type.assert_called_once_with(mock_instance)
-    mock_tasks_filter.assert_called_once_with(
+    LandedTranslationTask.objects.filter.assert_called_once_with(  # pyright: ignore[reportFunctionMemberAccess]
         content_type=mock_content_type.return_value,
         object_id=1234,
     )
-    mock_task.complete.assert_called_once()
+    mock_complete.assert_called_once_with()
 
 
-def test__close_translation_landed_task__no_tasks_found(mocker):
-    mock_tasks_filter = mocker.patch(
-        "wagtail_localize_smartling.signal_handlers.LandedTranslationTask.objects.filter",
-        return_value=[],
+def test__close_translation_landed_task__completes_open_tasks_in_bulk(django_assert_num_queries):
+    page = InfoPageFactory()
+    content_type = ContentType.objects.get_for_model(page)
+    fr = Locale.objects.get(language_code="fr")
+    de = Locale.objects.get(language_code="de")
+    open_tasks = [
+        LandedTranslationTask.objects.create(content_type=content_type, object_id=page.pk, relevant_locale=locale)
+        for locale in (fr, de)
+    ]
+    cancelled_task = LandedTranslationTask.objects.create(
+        content_type=content_type,
+        object_id=page.pk,
+        relevant_locale=fr,
+        cancelled_on=timezone.now(),
     )
-    mock_instance = mocker.Mock()
-    mock_instance.pk = 5432
-    mock_content_type = mocker.patch(
-        "wagtail_localize_smartling.signal_handlers.ContentType.objects.get_for_model",
-        return_value=mocker.Mock(),
+    other_task = LandedTranslationTask.objects.create(
+        content_type=content_type,
+        object_id=page.pk + 1,
+        relevant_locale=fr,
     )
+    receiver = Mock()
+    landed_translation_tasks_completed.connect(receiver)
 
-    _close_translation_landed_task(mock_instance)
+    try:
+        # The content type is already cached, so: select task IDs, update, and
+        # delete the (database-backed) cache entry for incomplete tasks
+        with django_assert_num_queries(3):
+            _close_translation_landed_task(page)
+    finally:
+        landed_translation_tasks_completed.disconnect(receiver)
+
+    for task in open_tasks:
+        task.refresh_from_db()
+        assert task.is_completed()
+    cancelled_task.refresh_from_db()
+    assert cancelled_task.is_cancelled()
+    assert not cancelled_task.is_completed()
+    other_task.refresh_from_db()
+    assert not other_task.is_completed()
+
+    receiver.assert_called_once()
+    assert sorted(receiver.call_args.kwargs["task_ids"]) == sorted(t.pk for t in open_tasks)
 
-    mock_content_type.assert_called_once_with(mock_instance)
-    mock_tasks_filter.assert_called_once_with(
-        content_type=mock_content_type.return_value,
-        object_id=5432,
-    )
+
+def test__close_translation_landed_task__no_tasks_found():
+    receiver = Mock()
+    landed_translation_tasks_completed.connect(receiver)
+
+    try:
+        _close_translation_landed_task(InfoPageFactory())
+    finally:
+        landed_translation_tasks_completed.disconnect(receiver)
+
+    assert not receiver.called
 
 
 @pytest.mark.parametrize("fake_a_page", [True, False])
@@ -273,15 +324,16 @@ def test_close_translation_landed_task_on_page_published(fake_a_page, mocker):
         assert not mock_close_translation_landed_task.called
 
 
-@pytest.mark.parametrize("is_a_snippet", [True, False])
-def test_close_translation_landed_task_on_snippet_published(is_a_snippet, mocker):
+@pytest.mark.parametrize("has_incomplete_tasks", [True, False])
+def test_close_translation_landed_task_on_snippet_published(has_incomplete_tasks, mocker):
     mock_instance = mocker.Mock()
     mock_close_translation_landed_task = mocker.patch(
         "wagtail_localize_smartling.signal_handlers._close_translation_landed_task"
     )
-    mock_model_is_registered_as_snippet = mocker.patch(
-        "wagtail_localize_smartling.signal_handlers._model_is_registered_as_snippet",
-        return_value=is_a_snippet,
+    mocker.patch("wagtail_localize_smartling.signal_handlers._model_is_registered_as_snippet", return_value=True)
+    mock_has_incomplete = mocker.patch(
+        "wagtail_localize_smartling.signal_handlers.LandedTranslationTask.objects.has_incomplete",
+        return_value=has_incomplete_tasks,
     )
 
     close_translation_landed_task_on_snippet_published(
@@ -289,20 +341,87 @@ def test_close_translation_landed_task_on_snippet_published(is_a_snippet, mocker
         instance=mock_instance,
     )
 
-    mock_model_is_registered_as_snippet.assert_called_once_with(mock_instance.__class__)
-    if is_a_snippet:
+    mock_has_incomplete.assert_called_once_with()
+    if has_incomplete_tasks:
         mock_close_translation_landed_task.assert_called_once_with(mock_instance)
     else:
         assert not mock_close_translation_landed_task.called
 
 
+def test_snippet_published_handler_is_only_connected_to_translatable_models():
+    assert close_translation_landed_task_on_snippet_published in _live_post_save_receivers(InfoSnippet)
+    assert close_translation_landed_task_on_snippet_published not in _live_post_save_receivers(User)
+    assert close_translation_landed_task_on_snippet_published not in _live_post_save_receivers(Page)
+    # Nothing is connected to saves of every model
+    assert not any(
+        receiver.__module__ == "wagtail_localize_smartling.signal_handlers"
+        for receiver in _live_post_save_receivers(Locale)
+    )
+
+
+def test_snippet_published_handler_skips_models_that_are_not_snippets(mocker):
+    mocker.patch("wagtail_localize_smartling.signal_handlers.get_snippet_models", return_value=[])
+    mock_has_incomplete = mocker.patch(
+        "wagtail_localize_smartling.signal_handlers.LandedTranslationTask.objects.has_incomplete"
+    )
+
+    InfoSnippetFactory()
+
+    assert not mock_has_incomplete.called
+
+
+def test_saving_a_snippet_completes_its_landed_translation_task():
+    snippet = InfoSnippetFactory()
+    task = LandedTranslationTask.objects.create(
+        content_type=ContentType.objects.get_for_model(snippet),
+        object_id=snippet.pk,
+        relevant_locale=snippet.locale,
+    )
+
+    snippet.save()
+
+    task.refresh_from_db()
+    assert task.is_completed()
+
+
+def test_saving_a_snippet_without_incomplete_tasks_skips_the_task_lookup():
+    snippet = InfoSnippetFactory()
+
+    with CaptureQueriesContext(connection) as ctx:
+        snippet.save()
+
+    # Only the check for whether there are any incomplete tasks at all
+    task_queries = [
+        query["sql"] for query in ctx.captured_queries if LandedTranslationTask._meta.db_table in query["sql"]
+    ]
+    assert len(task_queries) == 1
+    assert "object_id" not in task_queries[0]
+
+
+def test_has_incomplete_sees_tasks_created_since_it_was_last_called():
+    assert not LandedTranslationTask.objects.has_incomplete()  # pyright: ignore[reportAttributeAccessIssue]
+    # e.g. by a sync_smartling process that doesn't share the cache
+    snippet = InfoSnippetFactory()
+    LandedTranslationTask.objects.bulk_create(
+        [
+            LandedTranslationTask(
+                content_type=ContentType.objects.get_for_model(snippet),
+                object_id=snippet.pk,
+                relevant_locale=snippet.locale,
+            )
+        ]
+    )
+
+    assert LandedTranslationTask.objects.has_incomplete()  # pyright: ignore[reportAttributeAccessIssue]
+
+
 def test_close_translation_landed_task_on_snippet_published__skips_when_raw(mocker):
     mock_instance = mocker.Mock()
     mock_close_translation_landed_task = mocker.patch(
         "wagtail_localize_smartling.signal_handlers._close_translation_landed_task"
     )
-    mock_model_is_registered_as_snippet = mocker.patch(
-        "wagtail_localize_smartling.signal_handlers._model_is_registered_as_snippet"
+    mock_has_incomplete = mocker.patch(
+        "wagtail_localize_smartling.signal_handlers.LandedTranslationTask.objects.has_incomplete"
     )
     mock_logger_debug = mocker.patch("wagtail_localize_smartling.signal_handlers.logger.debug")
 
@@ -312,7 +431,7 @@ def test_close_translation_landed_task_on_snippet_published__skips_when_raw(mock
         raw=True,
     )
 
-    assert not mock_model_is_registered_as_snippet.called
+    assert not mock_has_incomplete.called
     assert not mock_close_translation_landed_task.called
     mock_logger_debug.assert_called_once()
 
@@ -1,19 +1,40 @@
 """Tests for the sync module, including per-locale import (Issue #37)."""
 
+import io
+import zipfile
+
+from datetime import UTC, datetime, timedelta
 from unittest.mock import patch
+from urllib.parse import quote
 
 import pytest
+import requests.exceptions
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
+from wagtail_localize.models import Translation
 
+from wagtail_localize_smartling.api.client import FailedResponse
+from wagtail_localize_smartling.api.client import JobNotFound as SmartlingJobNotFound
+from wagtail_localize_smartling.api.types import JobStatus
 from wagtail_localize_smartling.models import Job, JobTranslation
 from wagtail_localize_smartling.sync import (
+    JobNotTranslated,
+    SyncJobException,
     _check_and_import_completed_locales,
     _compute_translation_hash,
+    _download_and_apply_translations,
     _import_translation_for_locale,
     _sanitize_po_content,
+    _sync,
+    revalidate_job,
+    sync_job,
 )
 
+from testapp.factories import InfoPageFactory
+from tests.factories import JobFactory
+
 
 pytestmark = pytest.mark.django_db
 
@@ -61,6 +82,12 @@ class TestCheckAndImportCompletedLocales:
         assert fr_jt.imported_at is not None
         assert de_jt.imported_at is None
 
+        # Progress is recorded for every checked locale
+        assert (fr_jt.completed_string_count, fr_jt.total_string_count) == (10, 10)
+        assert (de_jt.completed_string_count, de_jt.total_string_count) == (5, 10)
+        assert fr_jt.progress_checked_at == fr_jt.imported_at
+        assert de_jt.progress_checked_at is not None
+
     def test_no_import_when_not_complete(
         self,
         smartling_job_multi_locale: Job,
@@ -225,3 +252,520 @@ msgstr "Kontrolle \u2028über KI"
         translation = smartling_job.translations.first()
         # Should not raise
         _import_translation_for_locale(smartling_job, translation, "fr")
+
+
+PO_CONTENT = """
+msgid ""
+msgstr ""
+"Content-Type: text/plain; charset=UTF-8\\n"
+
+msgid "Hello"
+msgstr "Bonjour"
+"""
+
+
+@pytest.fixture
+def smartling_download_translations(responses, settings, smartling_auth):
+    """Mock API response for downloading a job's translations as a ZIP file."""
+    project_id = settings.WAGTAIL_LOCALIZE_SMARTLING["PROJECT_ID"]
+
+    def add_download_response(job: Job, po_contents: dict[str, str | bytes]):
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as translations_zip:
+            for locale_id, po_content in po_contents.items():
+                translations_zip.writestr(f"{locale_id}/{job.file_uri}", po_content)
+        responses.get(
+            f"https://api.smartling.com/files-api/v2/projects/{quote(project_id)}/locales/all/file/zip",
+            body=buffer.getvalue(),
+            match_querystring=False,
+        )
+
+    return add_download_response
+
+
+def test_download_and_apply_translations_looks_up_locales_once(
+    smartling_job_multi_locale: Job, smartling_download_translations, disable_signals
+):
+    job = smartling_job_multi_locale
+    smartling_download_translations(job, {"fr": PO_CONTENT, "de": PO_CONTENT, "es": PO_CONTENT})
+
+    with CaptureQueriesContext(connection) as ctx:
+        _download_and_apply_translations(job)
+
+    # One query to look up all of the job's locales and one to mark them
+    # imported, rather than two queries per file
+    job_translation_queries = [
+        query["sql"] for query in ctx.captured_queries if "wagtail_localize_smartling_jobtranslation" in query["sql"]
+    ]
+    assert len(job_translation_queries) == 2
+    job_translations = JobTranslation.objects.filter(job=job)
+    assert all(job_translation.imported_at is not None for job_translation in job_translations)
+    assert {job_translation.content_hash for job_translation in job_translations} == {
+        _compute_translation_hash(PO_CONTENT)
+    }
+
+
+def test_download_and_apply_translations_keeps_other_locales_when_one_fails(
+    smartling_job_multi_locale: Job, smartling_download_translations, disable_signals, mocker
+):
+    job = smartling_job_multi_locale
+    smartling_download_translations(job, {"fr": PO_CONTENT, "de": "not a PO file"})
+    import_successful = mocker.patch("wagtail_localize_smartling.sync.translation_import_successful")
+
+    assert _download_and_apply_translations(job) is False
+
+    fr_jt = JobTranslation.objects.get(job=job, translation__target_locale__language_code="fr")
+    de_jt = JobTranslation.objects.get(job=job, translation__target_locale__language_code="de")
+    assert fr_jt.imported_at is not None
+    assert fr_jt.import_failed_at is None
+    assert de_jt.imported_at is None
+    assert de_jt.import_failed_at is not None
+    assert de_jt.get_progress_display() == "Import failed"
+    import_successful.send.assert_called_once_with(sender=Job, instance=job, translations_imported=[fr_jt.translation])
+
+
+def test_sync_retries_locales_that_failed_to_import(
+    smartling_job_multi_locale: Job, smartling_download_translation_for_locale, disable_signals, mocker, responses
+):
+    job = smartling_job_multi_locale
+    job.status = JobStatus.COMPLETED
+    job.save()
+    fr_jt = JobTranslation.objects.get(job=job, translation__target_locale__language_code="fr")
+    fr_jt.imported_at = timezone.now()
+    fr_jt.content_hash = "fr-hash"
+    fr_jt.save()
+    JobTranslation.objects.filter(job=job, translation__target_locale__language_code="de").update(
+        import_failed_at=timezone.now(), import_failure_count=1, import_retry_at=timezone.now()
+    )
+    mocker.patch(
+        "wagtail_localize_smartling.sync.client.get_job_details",
+        return_value={
+            "jobStatus": JobStatus.COMPLETED,
+            "description": job.description,
+            "referenceNumber": job.reference_number,
+            "dueDate": None,
+        },
+    )
+    smartling_download_translation_for_locale("de", PO_CONTENT)
+
+    _sync(job)
+
+    # Only the failed locale is retried, and only its file is downloaded
+    assert not any("/file/zip" in call.request.url for call in responses.calls)
+    fr_jt.refresh_from_db()
+    assert fr_jt.content_hash == "fr-hash"
+    de_jt = JobTranslation.objects.get(job=job, translation__target_locale__language_code="de")
+    assert de_jt.imported_at is not None
+    assert (de_jt.import_failed_at, de_jt.import_failure_count, de_jt.import_retry_at) == (None, 0, None)
+    job.refresh_from_db()
+    assert job.translations_imported_at is not None
+
+
+def test_download_and_apply_translations_keeps_other_locales_when_one_cannot_be_decoded(
+    smartling_job_multi_locale: Job, smartling_download_translations, disable_signals
+):
+    job = smartling_job_multi_locale
+    smartling_download_translations(job, {"fr": PO_CONTENT, "de": b"\xff\xfe not UTF-8"})
+
+    assert _download_and_apply_translations(job) is False
+
+    fr_jt = JobTranslation.objects.get(job=job, translation__target_locale__language_code="fr")
+    de_jt = JobTranslation.objects.get(job=job, translation__target_locale__language_code="de")
+    assert fr_jt.imported_at is not None
+    assert de_jt.imported_at is None
+    assert de_jt.import_failed_at is not None
+    assert de_jt.import_failure_count == 1
+
+
+def test_failed_imports_are_not_retried_until_due(
+    smartling_job_multi_locale: Job, smartling_download_translations, disable_signals
+):
+    job = smartling_job_multi_locale
+    smartling_download_translations(job, {"fr": PO_CONTENT, "de": "not a PO file"})
+    _download_and_apply_translations(job)
+    de_jt = JobTranslation.objects.get(job=job, translation__target_locale__language_code="de")
+    assert de_jt.import_retry_at > timezone.now()
+
+    # Nothing is due yet, so nothing is downloaded, but the job still has a
+    # locale that failed to import
+    with (
+        patch("wagtail_localize_smartling.sync.client.download_translations") as download_translations,
+        patch("wagtail_localize_smartling.sync.client.download_translation_for_locale") as download_for_locale,
+    ):
+        assert _download_and_apply_translations(job, failed_only=True) is False
+    download_translations.assert_not_called()
+    download_for_locale.assert_not_called()
+
+
+def test_sync_does_not_mark_job_imported_while_other_locales_have_failed(
+    smartling_job_multi_locale: Job, smartling_download_translation_for_locale, disable_signals, mocker
+):
+    job = smartling_job_multi_locale
+    job.status = JobStatus.COMPLETED
+    job.save()
+    now = timezone.now()
+    # de is due to be retried, fr isn't yet
+    JobTranslation.objects.filter(job=job, translation__target_locale__language_code="fr").update(
+        import_failed_at=now, import_failure_count=1, import_retry_at=now + timedelta(hours=1)
+    )
+    JobTranslation.objects.filter(job=job, translation__target_locale__language_code="de").update(
+        import_failed_at=now, import_failure_count=1, import_retry_at=now
+    )
+    mocker.patch(
+        "wagtail_localize_smartling.sync.client.get_job_details",
+        return_value={
+            "jobStatus": JobStatus.COMPLETED,
+            "description": job.description,
+            "referenceNumber": job.reference_number,
+            "dueDate": None,
+        },
+    )
+    smartling_download_translation_for_locale("de", PO_CONTENT)
+
+    _sync(job)
+
+    de_jt = JobTranslation.objects.get(job=job, translation__target_locale__language_code="de")
+    assert de_jt.imported_at is not None
+    job.refresh_from_db()
+    assert job.translations_imported_at is None
+
+
+LAST_MODIFIED = datetime(2024, 5, 3, 12, 0, tzinfo=UTC)
+
+
+def _mark_imported(job: Job, language_code: str, last_modified: datetime) -> JobTranslation:
+    job_translation = JobTranslation.objects.get(job=job, translation__target_locale__language_code=language_code)
+    job_translation.imported_at = timezone.now()
+    job_translation.content_hash = f"{language_code}-hash"
+    job_translation.smartling_last_modified_at = last_modified
+    job_translation.save()
+    return job_translation
+
+
+def test_download_and_apply_translations_skips_download_when_unchanged(
+    smartling_job_multi_locale: Job, smartling_get_file_last_modified, responses
+):
+    job = smartling_job_multi_locale
+    for language_code in ("fr", "de"):
+        _mark_imported(job, language_code, LAST_MODIFIED)
+    smartling_get_file_last_modified({"fr": "2024-05-03T12:00:00Z", "de": "2024-05-03T11:00:00Z"})
+
+    assert _download_and_apply_translations(job) is True
+
+    # The ZIP of translations isn't downloaded
+    assert not any("/file/zip" in call.request.url for call in responses.calls)
+
+
+def test_download_and_apply_translations_only_imports_changed_locales(
+    smartling_job_multi_locale: Job, smartling_get_file_last_modified, smartling_download_translations, disable_signals
+):
+    job = smartling_job_multi_locale
+    fr_jt = _mark_imported(job, "fr", LAST_MODIFIED)
+    de_jt = _mark_imported(job, "de", LAST_MODIFIED)
+    smartling_get_file_last_modified({"fr": "2024-05-03T12:00:00Z", "de": "2024-05-04T12:00:00Z"})
+    smartling_download_translations(job, {"fr": PO_CONTENT, "de": PO_CONTENT})
+
+    assert _download_and_apply_translations(job) is True
+
+    fr_jt.refresh_from_db()
+    de_jt.refresh_from_db()
+    assert fr_jt.content_hash == "fr-hash"
+    assert de_jt.content_hash == _compute_translation_hash(PO_CONTENT)
+    assert de_jt.smartling_last_modified_at == datetime(2024, 5, 4, 12, 0, tzinfo=UTC)
+
+
+def test_per_locale_import_records_last_modified(
+    smartling_job_multi_locale: Job,
+    smartling_get_file_status,
+    smartling_get_file_last_modified,
+    smartling_download_translation_for_locale,
+    disable_signals,
+):
+    smartling_get_file_status("fr", total_strings=10, completed_strings=10)
+    smartling_get_file_status("de", total_strings=10, completed_strings=5)
+    smartling_get_file_last_modified({"fr": "2024-05-03T12:00:00Z", "de": "2024-05-03T11:00:00Z"})
+    smartling_download_translation_for_locale("fr")
+
+    _check_and_import_completed_locales(smartling_job_multi_locale)
+
+    fr_jt = JobTranslation.objects.get(job=smartling_job_multi_locale, translation__target_locale__language_code="fr")
+    assert fr_jt.smartling_last_modified_at == LAST_MODIFIED
+
+
+def test_revalidate_job_reimports_locales_changed_after_import(
+    smartling_job_multi_locale: Job, smartling_get_file_last_modified, smartling_download_translations, disable_signals
+):
+    job = smartling_job_multi_locale
+    job.status = JobStatus.CLOSED
+    job.translations_imported_at = timezone.now()
+    job.save()
+    fr_jt = _mark_imported(job, "fr", LAST_MODIFIED)
+    de_jt = _mark_imported(job, "de", LAST_MODIFIED)
+    smartling_get_file_last_modified({"fr": "2024-05-03T12:00:00Z", "de": "2024-05-10T12:00:00Z"})
+    smartling_download_translations(job, {"fr": PO_CONTENT, "de": PO_CONTENT})
+
+    revalidate_job(job.pk)
+
+    fr_jt.refresh_from_db()
+    de_jt.refresh_from_db()
+    assert fr_jt.content_hash == "fr-hash"
+    assert de_jt.content_hash == _compute_translation_hash(PO_CONTENT)
+    job.refresh_from_db()
+    assert job.translations_revalidated_at is not None
+
+
+def test_revalidate_job_requires_translated_job(smartling_job_multi_locale: Job):
+    with pytest.raises(JobNotTranslated):
+        revalidate_job(smartling_job_multi_locale.pk)
+
+
+def test_sync_retries_locales_that_failed_to_import_on_revalidation(
+    smartling_job_multi_locale: Job,
+    smartling_get_file_last_modified,
+    smartling_download_translations,
+    smartling_download_translation_for_locale,
+    disable_signals,
+    mocker,
+):
+    job = smartling_job_multi_locale
+    job.status = JobStatus.CLOSED
+    job.translations_imported_at = timezone.now()
+    job.save()
+    _mark_imported(job, "fr", LAST_MODIFIED)
+    _mark_imported(job, "de", LAST_MODIFIED)
+    smartling_get_file_last_modified({"fr": "2024-05-03T12:00:00Z", "de": "2024-05-10T12:00:00Z"})
+    smartling_download_translations(job, {"fr": PO_CONTENT, "de": "not a PO file"})
+    smartling_download_translation_for_locale("de", PO_CONTENT)
+
+    revalidate_job(job.pk)
+
+    de_jt = JobTranslation.objects.get(job=job, translation__target_locale__language_code="de")
+    assert de_jt.import_failed_at is not None
+    # The retry is due
+    JobTranslation.objects.filter(pk=de_jt.pk).update(import_retry_at=timezone.now())
+    mocker.patch(
+        "wagtail_localize_smartling.sync.client.get_job_details",
+        return_value={
+            "jobStatus": JobStatus.CLOSED,
+            "description": job.description,
+            "referenceNumber": job.reference_number,
+            "dueDate": None,
+        },
+    )
+
+    _sync(Job.objects.get(pk=job.pk))
+
+    de_jt.refresh_from_db()
+    assert de_jt.import_failed_at is None
+    assert de_jt.content_hash == _compute_translation_hash(PO_CONTENT)
+
+
+def test_sync_refreshes_source_details(smartling_job: Job):
+    page = smartling_job.translation_source.get_source_instance()
+    page.title = "Renamed page"
+    page.save()
+
+    job_data = {
+        "jobStatus": JobStatus.AWAITING_AUTHORIZATION,
+        "description": smartling_job.description,
+        "referenceNumber": smartling_job.reference_number,
+        "dueDate": None,
+    }
+    with patch("wagtail_localize_smartling.sync.client.get_job_details", return_value=job_data):
+        _sync(smartling_job)
+
+    smartling_job.refresh_from_db()
+    assert smartling_job.source_title == "Renamed page"
+
+
+def test_sync_only_refreshes_source_details_when_status_changes(smartling_job: Job, mocker):
+    refresh_source_details = mocker.patch.object(Job, "refresh_source_details")
+    job_data = {
+        "jobStatus": smartling_job.status,
+        "description": smartling_job.description,
+        "referenceNumber": smartling_job.reference_number,
+        "dueDate": None,
+    }
+    with patch("wagtail_localize_smartling.sync.client.get_job_details", return_value=job_data):
+        _sync(smartling_job)
+
+    refresh_source_details.assert_not_called()
+
+
+@pytest.fixture
+def initial_sync_client(mocker):
+    """
+    Mock the client methods used by the initial sync.
+    """
+    client = mocker.patch("wagtail_localize_smartling.sync.client")
+    client.create_job.return_value = {"translationJobUid": "job-uid", "jobStatus": JobStatus.AWAITING_AUTHORIZATION}
+    client.get_job_details.return_value = {"translationJobUid": "job-uid", "jobStatus": JobStatus.IN_PROGRESS}
+    client.create_batch_for_job.return_value = "batch-uid"
+    client.upload_files_to_job_batch.return_value = "job.po"
+    return client
+
+
+def test_initial_sync(smartling_project, root_page, initial_sync_client):
+    job = JobFactory(source_instance=InfoPageFactory(parent=root_page), unsynced=True)
+
+    sync_job(job.pk)
+
+    job.refresh_from_db()
+    assert job.status == JobStatus.AWAITING_AUTHORIZATION
+    assert job.first_synced_at is not None
+    assert (job.translation_job_uid, job.batch_uid, job.file_uri) == ("job-uid", "batch-uid", "job.po")
+    initial_sync_client.upload_files_to_job_batch.assert_called_once_with(job=job, batch_uid="batch-uid")
+    initial_sync_client.add_html_context_to_job.assert_called_once_with(job=job)
+    initial_sync_client.get_job_details.assert_not_called()
+
+
+def test_initial_sync_resumes_from_failed_step(smartling_project, root_page, initial_sync_client):
+    job = JobFactory(source_instance=InfoPageFactory(parent=root_page), unsynced=True)
+    initial_sync_client.upload_files_to_job_batch.side_effect = requests.exceptions.Timeout
+
+    with pytest.raises(SyncJobException):
+        sync_job(job.pk)
+
+    # The Smartling job and batch are kept, but the job isn't synced yet
+    job.refresh_from_db()
+    assert job.status == JobStatus.UNSYNCED
+    assert job.first_synced_at is None
+    assert (job.translation_job_uid, job.batch_uid, job.file_uri) == ("job-uid", "batch-uid", "")
+
+    initial_sync_client.upload_files_to_job_batch.side_effect = None
+    sync_job(job.pk)
+
+    job.refresh_from_db()
+    assert job.status == JobStatus.IN_PROGRESS
+    assert job.file_uri == "job.po"
+    initial_sync_client.create_job.assert_called_once()
+    initial_sync_client.create_batch_for_job.assert_called_once()
+    assert initial_sync_client.upload_files_to_job_batch.call_count == 2
+
+
+def test_initial_sync_retries_context_without_uploading_again(smartling_project, root_page, initial_sync_client):
+    job = JobFactory(source_instance=InfoPageFactory(parent=root_page), unsynced=True)
+    initial_sync_client.add_html_context_to_job.side_effect = [requests.exceptions.Timeout, None]
+
+    with pytest.raises(SyncJobException):
+        sync_job(job.pk)
+    sync_job(job.pk)
+
+    job.refresh_from_db()
+    assert job.status == JobStatus.IN_PROGRESS
+    initial_sync_client.create_job.assert_called_once()
+    initial_sync_client.upload_files_to_job_batch.assert_called_once()
+
+
+def test_initial_sync_uses_new_batch_after_rejected_upload(smartling_project, root_page, initial_sync_client):
+    job = JobFactory(source_instance=InfoPageFactory(parent=root_page), unsynced=True)
+    initial_sync_client.upload_files_to_job_batch.side_effect = FailedResponse(code="VALIDATION_ERROR", errors=[])
+
+    with pytest.raises(SyncJobException):
+        sync_job(job.pk)
+
+    job.refresh_from_db()
+    assert (job.translation_job_uid, job.batch_uid) == ("job-uid", "")
+
+
+def test_initial_sync_recreates_job_deleted_from_smartling(smartling_project, root_page, initial_sync_client):
+    job = JobFactory(
+        source_instance=InfoPageFactory(parent=root_page),
+        translation_job_uid="deleted-job-uid",
+        batch_uid="deleted-batch-uid",
+    )
+    initial_sync_client.get_job_details.side_effect = SmartlingJobNotFound
+
+    sync_job(job.pk)
+
+    job.refresh_from_db()
+    assert job.status == JobStatus.AWAITING_AUTHORIZATION
+    assert (job.translation_job_uid, job.batch_uid, job.file_uri) == ("job-uid", "batch-uid", "job.po")
+
+
+@pytest.fixture
+def resubmitted_jobs(root_page):
+    """
+    Two UNSYNCED jobs for the same translation source, for different locales,
+    created 30 and 20 minutes ago.
+    """
+    now = timezone.now()
+    older_job = JobFactory(
+        source_instance=InfoPageFactory(parent=root_page),
+        unsynced=True,
+        created_at=now - timedelta(minutes=30),
+    )
+    fr_translation, de_translation = (
+        Translation.objects.get(source=older_job.translation_source, target_locale__language_code=language_code)
+        for language_code in ("fr", "de")
+    )
+    older_job.translations.set([fr_translation])
+    newer_job = JobFactory(
+        source_instance=older_job.translation_source.get_source_instance(),
+        translation_source=older_job.translation_source,
+        translations=[de_translation],
+        unsynced=True,
+        created_at=now - timedelta(minutes=20),
+    )
+    return older_job, newer_job
+
+
+def test_initial_sync_merges_resubmitted_jobs(
+    smartling_project, smartling_settings, resubmitted_jobs, initial_sync_client
+):
+    smartling_settings.SUBMISSION_COALESCE_WINDOW_MINUTES = 10
+    older_job, newer_job = resubmitted_jobs
+
+    sync_job(older_job.pk)
+
+    assert not Job.objects.filter(pk=older_job.pk).exists()
+    newer_job.refresh_from_db()
+    assert newer_job.status == JobStatus.AWAITING_AUTHORIZATION
+    assert sorted(newer_job.translations.values_list("target_locale__language_code", flat=True)) == ["de", "fr"]
+    initial_sync_client.create_job.assert_called_once()
+    assert initial_sync_client.create_job.call_args.kwargs["job_name"] == newer_job.name
+    assert initial_sync_client.create_job.call_args.kwargs["target_locale_ids"] == ["de", "fr"]
+
+
+def test_initial_sync_logs_merged_jobs_and_refreshes_cached_users(
+    smartling_project, smartling_settings, resubmitted_jobs, initial_sync_client
+):
+    smartling_settings.SUBMISSION_COALESCE_WINDOW_MINUTES = 10
+    older_job, newer_job = resubmitted_jobs
+    assert older_job.user_id in Job.objects.get_users()
+
+    with patch("wagtail_localize_smartling.sync.logger") as logger:
+        sync_job(older_job.pk)
+
+    logger.info.assert_any_call(
+        "Merged job(s) %s for the same translation source, submitted by %s, into job %s",
+        str(older_job.pk),
+        str(older_job.user),
+        newer_job,
+    )
+    assert list(Job.objects.get_users()) == [newer_job.user_id]
+
+
+def test_initial_sync_waits_for_coalesce_window(
+    smartling_project, smartling_settings, resubmitted_jobs, initial_sync_client
+):
+    smartling_settings.SUBMISSION_COALESCE_WINDOW_MINUTES = 25
+    older_job, newer_job = resubmitted_jobs
+
+    sync_job(older_job.pk)
+
+    assert Job.objects.filter(pk__in=[older_job.pk, newer_job.pk], status=JobStatus.UNSYNCED).count() == 2
+    initial_sync_client.create_job.assert_not_called()
+
+
+def test_initial_sync_does_not_merge_jobs_without_coalesce_window(
+    smartling_project, resubmitted_jobs, initial_sync_client
+):
+    older_job, newer_job = resubmitted_jobs
+
+    sync_job(older_job.pk)
+
+    older_job.refresh_from_db()
+    newer_job.refresh_from_db()
+    assert older_job.status == JobStatus.AWAITING_AUTHORIZATION
+    assert newer_job.status == JobStatus.UNSYNCED
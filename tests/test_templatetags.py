@@ -0,0 +1,64 @@
+from datetime import timedelta
+
+import pytest
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from wagtail_localize_smartling.api.types import JobStatus
+from wagtail_localize_smartling.templatetags.wagtail_localize_smartling_admin_tags import (
+    smartling_edit_translation_message,
+)
+
+
+pytestmark = pytest.mark.django_db
+
+
+def _older_job(job, status):
+    older_job = job.__class__.objects.get(pk=job.pk)
+    older_job.pk = None
+    older_job.status = status
+    older_job.first_synced_at = older_job.last_synced_at = timezone.now() - timedelta(days=1)
+    older_job.translation_job_uid = "older_job"
+    older_job.save()
+    older_job.translations.set(job.translations.all())
+    return older_job
+
+
+def test_smartling_edit_translation_message_fetches_only_the_latest_job(smartling_job, rf):
+    for _ in range(3):
+        _older_job(smartling_job, JobStatus.CANCELLED)
+    translation = smartling_job.translations.get()
+
+    with CaptureQueriesContext(connection) as ctx:
+        context = smartling_edit_translation_message({"translation": translation, "request": rf.get("/")})
+
+    assert len(ctx.captured_queries) == 1
+    assert "LIMIT 1" in ctx.captured_queries[0]["sql"]
+    assert context["show_message"] is True
+    assert "This translation is managed by Smartling" in context["message"]
+    assert "Job status: Draft" in context["message"]
+    assert "test-project-id:job_to_be_cancelled" in context["message"]
+
+
+def test_smartling_edit_translation_message_latest_job_untranslated(smartling_job, rf):
+    smartling_job.status = JobStatus.CANCELLED
+    smartling_job.save()
+    _older_job(smartling_job, JobStatus.COMPLETED)
+    translation = smartling_job.translations.get()
+
+    context = smartling_edit_translation_message({"translation": translation, "request": rf.get("/")})
+
+    assert "The latest Smartling job for this translation was cancelled." in context["message"]
+    assert f"/smartling-jobs/resubmit/{smartling_job.pk}/" in context["message"]
+
+
+def test_smartling_edit_translation_message_no_jobs(smartling_job, rf, django_assert_num_queries):
+    translation = smartling_job.translations.get()
+    smartling_job.delete()
+
+    with django_assert_num_queries(1):
+        context = smartling_edit_translation_message({"translation": translation, "request": rf.get("/")})
+
+    assert context == {"show_message": False}
@@ -83,3 +83,53 @@ def test_get_snippet_admin_url():
 
     expected_url = "/admin/snippets/testapp/testmodel/edit/1/"
     assert utils.get_snippet_admin_url(snippet) == expected_url
+
+
+@pytest.mark.django_db
+def test_get_source_instances(root_page, django_assert_num_queries):
+    from wagtail_localize.models import TranslationSource
+
+    from testapp.factories import InfoPageFactory, InfoSnippetFactory
+
+    page = InfoPageFactory(parent=root_page, title="Test page")
+    snippet = InfoSnippetFactory(content="Test snippet")
+    deleted_snippet = InfoSnippetFactory(content="Deleted snippet")
+    page_source, _ = TranslationSource.get_or_create_from_instance(page)
+    snippet_source, _ = TranslationSource.get_or_create_from_instance(snippet)
+    deleted_snippet_source, _ = TranslationSource.get_or_create_from_instance(deleted_snippet)
+    deleted_snippet.delete()
+
+    # One query per specific content type
+    with django_assert_num_queries(2):
+        source_instances = utils.get_source_instances([page_source, snippet_source, deleted_snippet_source])
+
+    assert source_instances == {
+        page_source.pk: page,
+        snippet_source.pk: snippet,
+        deleted_snippet_source.pk: None,
+    }
+    assert type(source_instances[page_source.pk]) is type(page)
+
+
+@pytest.mark.django_db
+def test_get_target_instances(root_page, django_assert_num_queries):
+    from wagtail.models import Locale
+    from wagtail_localize.models import Translation
+    from wagtail_localize.operations import translate_object
+
+    from testapp.factories import InfoPageFactory
+
+    page = InfoPageFactory(parent=root_page, title="Test page")
+    translate_object(page, [Locale.objects.get(language_code="fr")])
+    translations = list(Translation.objects.filter(source__object_id=page.translation_key).select_related("source"))
+    untranslated = Translation.objects.create(
+        source=translations[0].source, target_locale=Locale.objects.get(language_code="de")
+    )
+
+    with django_assert_num_queries(1):
+        target_instances = utils.get_target_instances([*translations, untranslated])
+
+    assert target_instances == {
+        translations[0].pk: page.get_translation(Locale.objects.get(language_code="fr")),
+        untranslated.pk: None,
+    }
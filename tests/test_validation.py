@@ -0,0 +1,161 @@
+import timeit
+
+import pytest
+
+from wagtail_localize_smartling.api import serializers
+from wagtail_localize_smartling.api.validation import ResponseValidationError, get_response_validator
+
+
+pytestmark = pytest.mark.django_db
+
+JOB_DETAILS_DATA = {
+    "callbackMethod": None,
+    "callbackUrl": None,
+    "createdByUserUid": "user-uid",
+    "createdDate": "2026-01-01T12:00:00Z",
+    "description": "Translations for a page",
+    "dueDate": "2026-02-01T12:00:00+01:00",
+    "firstCompletedDate": None,
+    "firstAuthorizedDate": "2026-01-02T12:00:00Z",
+    "jobName": "Page #1",
+    "jobNumber": "SMTL-1",
+    "jobStatus": "IN_PROGRESS",
+    "lastCompletedDate": None,
+    "lastAuthorizedDate": "2026-01-02T12:00:00Z",
+    "modifiedByUserUid": None,
+    "modifiedDate": "2026-01-02T12:00:00Z",
+    "targetLocaleIds": ["fr", "de"],
+    "translationJobUid": "job-uid",
+    "referenceNumber": "",
+    "issues": {"sourceIssuesCount": 0, "translationIssuesCount": 1},
+    "priority": None,
+    "sourceFiles": [{"name": "job_1_ts_1.po", "uri": "job_1_ts_1.po", "fileUid": "file-uid"}],
+    "customFields": [],
+}
+
+FILE_STATUS_DATA = {
+    "fileUri": "job_1_ts_1.po",
+    "totalStringCount": 10,
+    "totalWordCount": 50,
+    "authorizedStringCount": 0,
+    "authorizedWordCount": 0,
+    "completedStringCount": 8,
+    "completedWordCount": 40,
+    "excludedStringCount": 0,
+    "excludedWordCount": 0,
+}
+
+PROJECT_DETAILS_DATA = {
+    "accountUid": "account-uid",
+    "archived": False,
+    "projectId": "project-id",
+    "projectName": "Project",
+    "projectTypeCode": "APPLICATION_RESOURCES",
+    "sourceLocaleDescription": "English",
+    "sourceLocaleId": "en-US",
+    "targetLocales": [{"description": "French", "enabled": True, "localeId": "fr"}],
+}
+
+SUCCESSFUL_RESPONSES = [
+    (serializers.GetJobDetailsResponseSerializer, JOB_DETAILS_DATA),
+    (serializers.GetFileStatusResponseSerializer, FILE_STATUS_DATA),
+    (serializers.GetProjectDetailsResponseSerializer, PROJECT_DETAILS_DATA),
+    (
+        serializers.GetFileLastModifiedResponseSerializer,
+        {"totalCount": 1, "items": [{"localeId": "fr", "lastModified": "2026-01-03T12:00:00Z"}]},
+    ),
+    (
+        serializers.AuthenticateResponseSerializer,
+        {
+            "accessToken": "access",
+            "expiresIn": 480,
+            "refreshExpiresIn": 3660,
+            "refreshToken": "refresh",
+            "tokenType": "Bearer",
+        },
+    ),
+    (serializers.UploadFileToBatchResponseSerializer, None),
+]
+
+
+def _response(data, code: str = "SUCCESS") -> dict:
+    return {"response": {"code": code, "data": data}}
+
+
+def _validate_with_serializer(serializer_class, response_json) -> dict:
+    serializer = serializer_class(data=response_json)
+    serializer.is_valid(raise_exception=True)
+    return serializer.validated_data
+
+
+@pytest.mark.parametrize("serializer_class,data", SUCCESSFUL_RESPONSES)
+def test_validator_matches_serializer(serializer_class, data):
+    code = "ACCEPTED" if data is None else "SUCCESS"
+    response_json = _response(data, code)
+
+    validated = get_response_validator(serializer_class)(response_json)
+
+    assert validated == _validate_with_serializer(serializer_class, response_json)
+
+
+def test_validator_matches_serializer_for_errors():
+    response_json = {
+        "response": {
+            "code": "VALIDATION_ERROR",
+            "errors": [{"key": None, "message": "Invalid file", "details": {"field": "file"}}],
+        }
+    }
+
+    validated = get_response_validator(serializers.GetFileStatusResponseSerializer)(response_json)
+
+    assert validated == _validate_with_serializer(serializers.GetFileStatusResponseSerializer, response_json)
+
+
+@pytest.mark.parametrize(
+    "response_json",
+    [
+        [],
+        {"response": None},
+        {"response": {"data": FILE_STATUS_DATA}},
+        _response({k: v for k, v in FILE_STATUS_DATA.items() if k != "fileUri"}),
+        _response({**FILE_STATUS_DATA, "completedStringCount": "eight"}),
+        _response({**FILE_STATUS_DATA, "fileUri": None}),
+        _response(None),
+        {"response": {"code": "SUCCESS", "data": FILE_STATUS_DATA, "errors": []}},
+    ],
+)
+def test_validator_rejects_invalid_responses(response_json):
+    with pytest.raises(ResponseValidationError):
+        get_response_validator(serializers.GetFileStatusResponseSerializer)(response_json)
+
+
+@pytest.mark.parametrize(
+    "changes",
+    [
+        {"jobStatus": "UNKNOWN"},
+        {"createdDate": "yesterday"},
+        {"targetLocaleIds": "fr"},
+        {"sourceFiles": [{"name": "file.po"}]},
+    ],
+)
+def test_validator_rejects_invalid_job_details(changes):
+    response_json = _response({**JOB_DETAILS_DATA, **changes})
+
+    with pytest.raises(ResponseValidationError):
+        get_response_validator(serializers.GetJobDetailsResponseSerializer)(response_json)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("serializer_class,data", SUCCESSFUL_RESPONSES[:2])
+def test_validator_benchmark(serializer_class, data):
+    """
+    The validators are built once per response type, so validating the common
+    response shapes is much cheaper than instantiating and running a serializer.
+    """
+    response_json = _response(data)
+    validate = get_response_validator(serializer_class)
+
+    serializer_time = min(timeit.repeat(lambda: _validate_with_serializer(serializer_class, response_json), number=50))
+    validator_time = min(timeit.repeat(lambda: validate(response_json), number=50))
+
+    assert validator_time * 5 < serializer_time
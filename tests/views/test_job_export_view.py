@@ -0,0 +1,65 @@
+import json
+
+import pytest
+
+from django.urls import reverse
+
+from wagtail_localize_smartling.api.types import JobStatus
+
+
+pytestmark = pytest.mark.django_db
+
+
+EXPORT_URL = reverse("wagtail_localize_smartling:jobs-export")
+
+
+def test_job_export_view_csv(client, superuser, smartling_job):
+    client.force_login(superuser)
+
+    response = client.get(EXPORT_URL)
+
+    assert response.status_code == 200
+    assert response.streaming
+    assert response["Content-Type"] == "text/csv"
+    assert response["Content-Disposition"].startswith('attachment; filename="smartling-jobs-')
+    lines = b"".join(response.streaming_content).decode().splitlines()
+    assert lines[0].startswith("id,name,reference_number")
+    assert len(lines) == 2
+
+
+def test_job_export_view_jsonl_with_filters(client, superuser, smartling_job):
+    client.force_login(superuser)
+
+    response = client.get(EXPORT_URL, {"export_format": "jsonl", "status": JobStatus.DRAFT})
+    assert response["Content-Type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in b"".join(response.streaming_content).splitlines()]
+    assert [row["id"] for row in rows] == [smartling_job.pk]
+
+    response = client.get(EXPORT_URL, {"export_format": "jsonl", "status": JobStatus.COMPLETED})
+    assert b"".join(response.streaming_content) == b""
+
+
+def test_job_export_view_invalid_format(client, superuser, smartling_job):
+    client.force_login(superuser)
+
+    response = client.get(EXPORT_URL, {"export_format": "xml"})
+
+    assert response.status_code == 400
+
+
+def test_job_export_view_requires_permission(client, regular_user, smartling_job):
+    client.force_login(regular_user)
+
+    response = client.get(EXPORT_URL)
+
+    assert response.status_code == 302
+
+
+def test_job_index_view_links_to_export_with_filters(client, superuser, smartling_job):
+    client.force_login(superuser)
+
+    response = client.get(reverse("wagtail_localize_smartling_jobs:index"), {"status": JobStatus.DRAFT})
+
+    content = response.content.decode()
+    assert f"{EXPORT_URL}?status={JobStatus.DRAFT}&amp;export_format=csv" in content
+    assert f"{EXPORT_URL}?status={JobStatus.DRAFT}&amp;export_format=jsonl" in content
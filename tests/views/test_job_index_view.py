@@ -0,0 +1,174 @@
+import pytest
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from wagtail_localize_smartling.models import Job
+from wagtail_localize_smartling.views import SmartlingJobUsersView
+
+from testapp.factories import InfoPageFactory, InfoSnippetFactory, UserFactory
+from testapp.models import InfoPage, InfoSnippet
+from tests.factories import JobFactory
+
+
+pytestmark = pytest.mark.django_db
+
+
+INDEX_URL = reverse("wagtail_localize_smartling_jobs:index")
+USERS_URL = reverse("wagtail_localize_smartling:jobs-users")
+
+
+def _count_index_queries(client) -> int:
+    with CaptureQueriesContext(connection) as ctx:
+        response = client.get(INDEX_URL)
+    assert response.status_code == 200
+    return len(ctx.captured_queries)
+
+
+def test_job_index_view_lists_source_instances(client, superuser, smartling_project, root_page):
+    JobFactory.create_for_pages_and_snippets(root_page, range(1))
+    client.force_login(superuser)
+
+    response = client.get(INDEX_URL)
+
+    content = response.content.decode()
+    assert "Page 0" in content
+    assert "InfoSnippet object" in content
+
+
+def test_job_index_view_query_count_does_not_depend_on_page_size(client, superuser, smartling_project, root_page):
+    JobFactory.create_for_pages_and_snippets(root_page, range(1))
+    client.force_login(superuser)
+    # Warm up any per-process caches (content types, site root paths, etc.)
+    client.get(INDEX_URL)
+
+    query_count = _count_index_queries(client)
+
+    JobFactory.create_for_pages_and_snippets(root_page, range(1, 6))
+
+    assert _count_index_queries(client) == query_count
+
+
+def test_job_index_view_filters_and_sorts_by_source_title(client, superuser, smartling_project, root_page):
+    for title in ["Banana", "Apple", "Cherry"]:
+        JobFactory(
+            source_instance=InfoPageFactory(parent=root_page, title=title),
+            source_title=title,
+        )
+    client.force_login(superuser)
+
+    response = client.get(INDEX_URL, {"source_title": "an"})
+    assert [job.source_title for job in response.context["object_list"]] == ["Banana"]
+
+    response = client.get(INDEX_URL, {"ordering": "source_title"})
+    assert [job.source_title for job in response.context["object_list"]] == ["Apple", "Banana", "Cherry"]
+
+
+def test_job_index_view_user_filter(client, superuser, smartling_project, root_page):
+    JobFactory.create_for_pages_and_snippets(root_page, range(2))
+    job = Job.objects.first()
+    client.force_login(superuser)
+
+    response = client.get(INDEX_URL, {"user": job.user.get_username().upper()})
+
+    assert [j.pk for j in response.context["object_list"]] == [job.pk]
+    content = response.content.decode()
+    assert 'list="id_user-options"' in content
+    assert f'data-options-url="{USERS_URL}"' in content
+    # The suggestions are fetched as the user types, not rendered into the page
+    assert "<option" not in content.split('<datalist id="id_user-options">')[1].split("</datalist>")[0]
+
+
+def test_job_users_view_suggests_submitters_by_prefix(client, superuser, smartling_project, root_page):
+    for username in ["alice", "Alan", "bob"]:
+        JobFactory(
+            source_instance=InfoPageFactory(parent=root_page, title=username, slug=username),
+            user=UserFactory(username=username),
+        )
+    UserFactory(username="albert")
+    client.force_login(superuser)
+
+    response = client.get(USERS_URL, {"q": "AL"})
+
+    assert response.json() == {"results": ["Alan", "alice"]}
+
+
+def test_job_users_view_limits_suggestions(client, superuser, smartling_project, root_page, monkeypatch):
+    JobFactory.create_for_pages_and_snippets(root_page, range(2))
+    monkeypatch.setattr(SmartlingJobUsersView, "max_results", 3)
+    client.force_login(superuser)
+
+    response = client.get(USERS_URL)
+
+    assert len(response.json()["results"]) == 3
+
+
+def test_job_users_view_requires_permission(client, regular_user):
+    client.force_login(regular_user)
+
+    response = client.get(USERS_URL)
+
+    assert response.status_code == 302
+
+
+def test_job_users_are_cached_until_a_new_user_submits_a_job(smartling_project, root_page, django_assert_num_queries):
+    JobFactory.create_for_pages_and_snippets(root_page, range(1))
+    users = Job.objects.get_users()
+    assert set(users) == set(Job.objects.values_list("user", flat=True))
+
+    # The test settings use the database cache, so the cache lookup is a query
+    with django_assert_num_queries(1):
+        assert Job.objects.get_users() == users
+
+    # A job for an existing submitter keeps the cache
+    JobFactory(source_instance=InfoPageFactory(parent=root_page, title="Page 1"), user=Job.objects.first().user)
+    with django_assert_num_queries(1):
+        assert Job.objects.get_users() == users
+
+    # A new submitter invalidates it
+    new_job = JobFactory(source_instance=InfoPageFactory(parent=root_page, title="Page 2"))
+    assert new_job.user.pk in Job.objects.get_users()
+
+
+def test_job_source_content_types_are_cached_until_a_new_type_is_used(
+    smartling_project, root_page, django_assert_num_queries
+):
+    page_content_type, snippet_content_type = ContentType.objects.get_for_models(InfoPage, InfoSnippet).values()
+    JobFactory(source_instance=InfoPageFactory(parent=root_page), source_content_type=page_content_type)
+    assert Job.objects.get_source_content_type_ids() == {page_content_type.pk}
+
+    with django_assert_num_queries(1):
+        assert Job.objects.get_source_content_type_ids() == {page_content_type.pk}
+
+    # A job for a source of a known type keeps the cache
+    JobFactory(
+        source_instance=InfoPageFactory(parent=root_page, title="Page 1"),
+        source_content_type=page_content_type,
+    )
+    with django_assert_num_queries(1):
+        assert Job.objects.get_source_content_type_ids() == {page_content_type.pk}
+
+    # So does a job whose source type isn't known yet
+    JobFactory(source_instance=InfoPageFactory(parent=root_page, title="Page 2"), source_content_type=None)
+    with django_assert_num_queries(1):
+        assert Job.objects.get_source_content_type_ids() == {page_content_type.pk}
+
+    # A new source type invalidates it
+    JobFactory(source_instance=InfoSnippetFactory(), source_content_type=snippet_content_type)
+    assert Job.objects.get_source_content_type_ids() == {page_content_type.pk, snippet_content_type.pk}
+
+
+def test_job_index_view_shows_locale_progress(client, superuser, smartling_job):
+    job_translation = smartling_job.job_translations.get()
+    job_translation.completed_string_count = 5
+    job_translation.total_string_count = 10
+    job_translation.progress_checked_at = timezone.now()
+    job_translation.save()
+    client.force_login(superuser)
+
+    response = client.get(INDEX_URL)
+
+    assert "French (5/10 strings translated (50%))" in response.content.decode()
@@ -0,0 +1,91 @@
+import pytest
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from freezegun import freeze_time
+from wagtail.models import Locale
+from wagtail_localize.models import Translation
+from wagtail_localize.operations import translate_object
+
+
+pytestmark = pytest.mark.django_db
+
+
+def _get_inspect_view(client, job):
+    with CaptureQueriesContext(connection) as ctx:
+        response = client.get(reverse("wagtail_localize_smartling_jobs:inspect", args=[job.pk]))
+    assert response.status_code == 200
+    return response, len(ctx.captured_queries)
+
+
+def test_job_inspect_view_lists_translations(client, superuser, smartling_job):
+    page = smartling_job.translation_source.get_source_instance()
+    translate_object(page, [Locale.objects.get(language_code="fr")])
+    translated_page = page.get_translation(Locale.objects.get(language_code="fr"))
+    client.force_login(superuser)
+
+    response, _ = _get_inspect_view(client, smartling_job)
+
+    content = response.content.decode()
+    assert f'<a href="{reverse("wagtailadmin_pages:edit", args=[page.pk])}">{page.title}</a>' in content
+    assert (
+        f'<li><a href="{reverse("wagtailadmin_pages:edit", args=[translated_page.pk])}">'
+        f"{translated_page.title}</a> - French</li>"
+    ) in content
+
+
+def test_job_inspect_view_lists_untranslated_locales(client, superuser, smartling_job):
+    client.force_login(superuser)
+
+    response, _ = _get_inspect_view(client, smartling_job)
+
+    assert "<li>French</li>" in response.content.decode()
+
+
+@freeze_time("2024-05-03 12:34:56")
+def test_job_inspect_view_shows_progress(client, superuser, smartling_job):
+    job_translation = smartling_job.job_translations.get()
+    job_translation.completed_string_count = 5
+    job_translation.total_string_count = 10
+    job_translation.progress_checked_at = timezone.now()
+    job_translation.save()
+    client.force_login(superuser)
+
+    response, _ = _get_inspect_view(client, smartling_job)
+
+    assert "<li>French (5/10 strings translated (50%), as of 05/03/2024 12:34 p.m.)</li>" in response.content.decode()
+
+
+def test_job_inspect_view_shows_failed_import_without_progress(client, superuser, smartling_job):
+    job_translation = smartling_job.job_translations.get()
+    job_translation.import_failed_at = timezone.now()
+    job_translation.progress_checked_at = None
+    job_translation.save()
+    client.force_login(superuser)
+
+    response, _ = _get_inspect_view(client, smartling_job)
+
+    assert "<li>French (Import failed)</li>" in response.content.decode()
+
+
+def test_job_inspect_view_query_count_does_not_depend_on_locale_count(client, superuser, smartling_job):
+    page = smartling_job.translation_source.get_source_instance()
+    locale_fr = Locale.objects.get(language_code="fr")
+    locale_de = Locale.objects.get(language_code="de")
+    translate_object(page, [locale_fr])
+    client.force_login(superuser)
+    # Warm up any per-process caches (content types, site root paths, etc.)
+    _get_inspect_view(client, smartling_job)
+
+    _, query_count = _get_inspect_view(client, smartling_job)
+
+    translate_object(page, [locale_de])
+    smartling_job.translations.add(
+        Translation.objects.get(source=smartling_job.translation_source, target_locale=locale_de)
+    )
+    response, de_query_count = _get_inspect_view(client, smartling_job)
+
+    assert "German" in response.content.decode()
+    assert de_query_count == query_count
@@ -0,0 +1,140 @@
+import pytest
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from wagtail.models import Locale
+
+from wagtail_localize_smartling.models import LandedTranslationTask
+from wagtail_localize_smartling.views import LandedTranslationTasksView
+
+from tests.factories import LandedTranslationTaskFactory, TranslationApproverGroupFactory
+
+
+pytestmark = pytest.mark.django_db
+
+
+LIST_URL = reverse("wagtail_localize_smartling:landed-translations")
+
+
+def _task_pks(response) -> list[int]:
+    return [task.pk for task in response.context["tasks"]]
+
+
+def test_lists_incomplete_tasks(client, superuser, root_page):
+    tasks = LandedTranslationTaskFactory.create_for_pages_and_snippets(root_page, range(2))
+    tasks[0].complete()
+    client.force_login(superuser)
+
+    response = client.get(LIST_URL)
+
+    assert response.status_code == 200
+    assert _task_pks(response) == [task.pk for task in tasks[1:]]
+    content = response.content.decode()
+    assert "Page 1" in content
+    assert "Page 0" not in content
+
+
+def test_query_count_does_not_depend_on_number_of_tasks(client, superuser, root_page):
+    LandedTranslationTaskFactory.create_for_pages_and_snippets(root_page, range(1))
+    client.force_login(superuser)
+    client.get(LIST_URL)
+
+    with CaptureQueriesContext(connection) as ctx:
+        client.get(LIST_URL)
+    query_count = len(ctx.captured_queries)
+
+    LandedTranslationTaskFactory.create_for_pages_and_snippets(root_page, range(1, 6))
+    with CaptureQueriesContext(connection) as ctx:
+        client.get(LIST_URL)
+
+    assert len(ctx.captured_queries) == query_count
+
+
+def test_keyset_pagination(client, superuser, root_page, monkeypatch):
+    monkeypatch.setattr(LandedTranslationTasksView, "page_size", 2)
+    tasks = LandedTranslationTaskFactory.create_for_pages_and_snippets(root_page, range(3))
+    client.force_login(superuser)
+
+    response = client.get(LIST_URL)
+    assert _task_pks(response) == [tasks[0].pk, tasks[1].pk]
+    assert response.context["previous_pk"] is None
+    assert response.context["next_pk"] == tasks[1].pk
+
+    response = client.get(LIST_URL, {"after": tasks[1].pk})
+    assert _task_pks(response) == [tasks[2].pk, tasks[3].pk]
+    assert response.context["previous_pk"] == tasks[2].pk
+    assert response.context["next_pk"] == tasks[3].pk
+
+    response = client.get(LIST_URL, {"after": tasks[3].pk})
+    assert _task_pks(response) == [tasks[4].pk, tasks[5].pk]
+    assert response.context["next_pk"] is None
+
+    response = client.get(LIST_URL, {"before": tasks[2].pk})
+    assert _task_pks(response) == [tasks[0].pk, tasks[1].pk]
+    assert response.context["previous_pk"] is None
+    assert response.context["next_pk"] == tasks[1].pk
+
+
+def test_filters_by_locale_and_content_type(client, superuser, root_page):
+    tasks = LandedTranslationTaskFactory.create_for_pages_and_snippets(root_page, range(2))
+    LandedTranslationTask.objects.filter(pk__in=[tasks[1].pk, tasks[3].pk]).update(
+        relevant_locale=Locale.objects.get(language_code="de")
+    )
+    client.force_login(superuser)
+
+    response = client.get(LIST_URL, {"relevant_locale": Locale.objects.get(language_code="de").pk})
+    assert _task_pks(response) == [tasks[1].pk, tasks[3].pk]
+
+    response = client.get(LIST_URL, {"content_type": tasks[0].content_type_id})
+    assert _task_pks(response) == [tasks[0].pk, tasks[2].pk]
+
+
+@pytest.mark.parametrize("action", ["complete", "cancel"])
+def test_bulk_actions(client, superuser, root_page, action):
+    tasks = LandedTranslationTaskFactory.create_for_pages_and_snippets(root_page, range(2))
+    client.force_login(superuser)
+
+    response = client.post(
+        LIST_URL,
+        {"action": action, "task_ids": [tasks[0].pk, tasks[1].pk], "next": f"{LIST_URL}?after=1"},
+    )
+
+    assert response.status_code == 302
+    assert response.url == f"{LIST_URL}?after=1"
+    for task in tasks:
+        task.refresh_from_db()
+    assert [task.is_completed() for task in tasks] == [action == "complete"] * 2 + [False] * 2
+    assert [task.is_cancelled() for task in tasks] == [action == "cancel"] * 2 + [False] * 2
+
+
+def test_bulk_actions_require_translation_approver(client, regular_user, root_page):
+    tasks = LandedTranslationTaskFactory.create_for_pages_and_snippets(root_page, range(1))
+    client.force_login(regular_user)
+
+    response = client.get(LIST_URL)
+    assert response.status_code == 200
+    assert response.context["can_action_tasks"] is False
+
+    response = client.post(LIST_URL, {"action": "complete", "task_ids": [tasks[0].pk]})
+    assert response.status_code == 302
+    tasks[0].refresh_from_db()
+    assert not tasks[0].is_completed()
+
+
+def test_translation_approvers_can_action_tasks(client, regular_user, root_page):
+    TranslationApproverGroupFactory().user_set.add(regular_user)
+    tasks = LandedTranslationTaskFactory.create_for_pages_and_snippets(root_page, range(1))
+    client.force_login(regular_user)
+
+    assert client.get(LIST_URL).context["can_action_tasks"] is True
+
+    client.post(LIST_URL, {"action": "complete", "task_ids": [tasks[0].pk]})
+    tasks[0].refresh_from_db()
+    assert tasks[0].is_completed()
+
+
+def test_unknown_bulk_action(client, superuser):
+    client.force_login(superuser)
+
+    assert client.post(LIST_URL, {"action": "delete"}).status_code == 400